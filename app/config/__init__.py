@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import ClassVar, List, Optional, Union
 
 from celery.schedules import crontab
+from kombu import Exchange, Queue
 from pydantic import ConfigDict, field_validator
 from pydantic_settings import BaseSettings
 
@@ -21,14 +22,47 @@ class Settings(BaseSettings):
     MONGODB_PASSWORD: Optional[str] = None
     MONGODB_EXPOSE_PORT: Optional[int] = None
     MONGO_CELERY_COLLECTION: str
+    # connection pool of each process (API worker, celery worker)
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 20000
+    MONGODB_SOCKET_TIMEOUT_MS: Optional[int] = None
+    # wire compression, e.g. "zstd,snappy,zlib"
+    MONGODB_COMPRESSORS: Optional[str] = None
+    # primary, primaryPreferred, secondary, secondaryPreferred or nearest
+    MONGODB_READ_PREFERENCE: str = "primary"
+    # read preference of list/report queries
+    MONGODB_REPORT_READ_PREFERENCE: str = "primary"
+    # log connection pool statistics (CMAP events)
+    MONGODB_POOL_MONITORING: bool = False
+    # seconds between two logs of the statistics, at most (logged on the pool activity)
+    MONGODB_POOL_STATS_LOG_SECONDS: int = 60
 
-    @field_validator("MONGODB_USERNAME", "MONGODB_PASSWORD", "MONGODB_EXPOSE_PORT", mode="before")
+    @field_validator(
+        "MONGODB_USERNAME",
+        "MONGODB_PASSWORD",
+        "MONGODB_EXPOSE_PORT",
+        "MONGODB_MAX_IDLE_TIME_MS",
+        "MONGODB_WAIT_QUEUE_TIMEOUT_MS",
+        "MONGODB_SOCKET_TIMEOUT_MS",
+        "MONGODB_COMPRESSORS",
+        mode="before",
+    )
     def allow_none(cls, v):
         if v is None or v == "":
             return None
         else:
             return v
 
+    @field_validator("MONGODB_READ_PREFERENCE", "MONGODB_REPORT_READ_PREFERENCE")
+    def check_read_preference(cls, v):
+        if v not in ("primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"):
+            raise ValueError(f"Invalid read preference: {v}")
+        return v
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str
@@ -60,12 +94,36 @@ class Settings(BaseSettings):
     PREFIX_IMAGE_GCLOUD: str = "https://lh3.googleusercontent.com/d/"
 
     BREVO_API_KEY: str
+    # recipients per Brevo API call (messageVersions) of the batched emails
+    BREVO_BATCH_SIZE: int = 100
+    # retries of a batch on rate limit / server errors of Brevo
+    BREVO_BATCH_RETRIES: int = 3
     YSOF_EMAIL: str
 
     SMTP_MAIL_HOST: str
     SMTP_MAIL_PORT: str
     SMTP_MAIL_USER: str
     SMTP_MAIL_PASSWORD: str
+    SMTP_STARTTLS: bool = True
+    SMTP_TIMEOUT: int = 30
+    # SMTP sessions kept open by each process (API worker, celery worker)
+    SMTP_POOL_SIZE: int = 2
+    # a session is closed after this many messages, a new one is opened
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    # seconds a session may stay idle before it is checked with a NOOP
+    SMTP_KEEPALIVE_SECONDS: int = 30
+    # messages per minute of each process, 0 disables the limit
+    SMTP_RATE_LIMIT_PER_MINUTE: int = 0
+
+    # calls per second to each provider shared by every process (Redis), 0 disables it
+    RATE_LIMIT_BREVO_PER_SECOND: float = 5
+    RATE_LIMIT_SMTP_PER_SECOND: float = 2
+    RATE_LIMIT_GOOGLE_PER_SECOND: float = 10
+    # longer waits reschedule the celery task instead of blocking the worker
+    RATE_LIMIT_MAX_BLOCK_SECONDS: int = 10
+    RATE_LIMIT_MAX_RETRIES: int = 20
+    # longer waits fail the calls made outside celery tasks at once (a 503 for Google)
+    RATE_LIMIT_MAX_WAIT_SECONDS: int = 5
 
     STUDENT_SUBJECT_EVALUATION_TEMPLATE: int
     STUDENT_NOTIFICATION_SUBJECT: int
@@ -86,6 +144,49 @@ class Settings(BaseSettings):
     REDIS_HOST: str
     REDIS_PASSWORD: str
     REDIS_PORT: str
+    # seconds to keep the current season in process memory, 0 disables this cache
+    CURRENT_SEASON_CACHE_TTL: int = 60
+    # seconds to keep a student's roll call results in Redis, 0 disables the cache
+    ROLL_CALL_CACHE_TTL: int = 60 * 60 * 24
+    # seconds to keep an authenticated admin/student in memory, 0 disables the cache
+    AUTH_PRINCIPAL_CACHE_TTL: int = 30
+    # also share the cached admins/students between processes through Redis
+    AUTH_PRINCIPAL_CACHE_REDIS: bool = False
+    # processes hashing/verifying passwords, 0 hashes in the calling thread
+    PASSWORD_HASH_WORKERS: int = 2
+    # hashes pending at once (queued or running), the next ones are rejected with a 503
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    # bcrypt cost of new hashes, the passwords of another cost are rehashed at login
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # audit logs buffered in each API process before being written in batches, 0 writes them
+    # in the request
+    AUDIT_LOG_BUFFER_SIZE: int = 10000
+    AUDIT_LOG_BATCH_SIZE: int = 200
+    AUDIT_LOG_FLUSH_SECONDS: float = 2
+    # a batch not written within this time is handed to celery (or to the journal)
+    AUDIT_LOG_WRITE_TIMEOUT_SECONDS: float = 5
+    # local file of the batches neither Mongo nor the broker accepted, replayed at startup
+    AUDIT_LOG_JOURNAL_PATH: str = "/tmp/audit-log-journal.jsonl"
+    AUDIT_LOG_DESCRIPTION_MAX_LENGTH: int = 10000
+    # seconds a list total is reused for the same filter (lists counted in "cached" mode)
+    LIST_TOTAL_CACHE_TTL: int = 5
+    # seconds to keep the responses of the read-mostly endpoints in Redis, 0 disables the
+    # cache (the writes invalidate them before, see app.infra.response_cache)
+    RESPONSE_CACHE_TTL: int = 60 * 60
+
+
+CELERY_QUEUE_DEFAULT = "celery"
+CELERY_QUEUE_MAIL_CRITICAL = "mail_critical"
+CELERY_QUEUE_MAIL_BULK = "mail_bulk"
+CELERY_QUEUE_DRIVE = "drive"
+CELERY_QUEUE_PERIODIC = "periodic"
+CELERY_QUEUES = [
+    CELERY_QUEUE_MAIL_CRITICAL,
+    CELERY_QUEUE_MAIL_BULK,
+    CELERY_QUEUE_DRIVE,
+    CELERY_QUEUE_PERIODIC,
+    CELERY_QUEUE_DEFAULT,
+]
 
 
 class CeleryConfig(BaseSettings):
@@ -112,8 +213,63 @@ class CeleryConfig(BaseSettings):
 
     accept_content: list = ["pickle", "json"]
     task_serializer: str = "pickle"
+    # the low latency worker runs with --prefetch-multiplier 1 (see scripts/celery.sh)
     worker_prefetch_multiplier: int = 4
 
+    """
+    Queues by task class, each one can be consumed by its own worker pool:
+    latency critical mails (OTP, password changed, account) are not queued behind a bulk
+    fan-out. Messages of a queue are ordered by priority (0-9, 9 first).
+    The default "celery" queue is kept as declared before (no priority).
+    """
+    task_default_queue: str = CELERY_QUEUE_DEFAULT
+    task_default_priority: int = 5
+    task_queues: ClassVar = (
+        Queue(
+            CELERY_QUEUE_DEFAULT, Exchange(CELERY_QUEUE_DEFAULT), routing_key=CELERY_QUEUE_DEFAULT
+        ),
+        *(
+            Queue(name, Exchange(name), routing_key=name, queue_arguments={"x-max-priority": 9})
+            for name in (
+                CELERY_QUEUE_MAIL_CRITICAL,
+                CELERY_QUEUE_MAIL_BULK,
+                CELERY_QUEUE_DRIVE,
+                CELERY_QUEUE_PERIODIC,
+            )
+        ),
+    )
+    # exact names first, then the glob patterns in order
+    task_routes: ClassVar = {
+        "app.infra.tasks.email.send_email_forgot_password_otp_task": {
+            "queue": CELERY_QUEUE_MAIL_CRITICAL,
+            "priority": 9,
+        },
+        "app.infra.tasks.email.send_email_password_changed_task": {
+            "queue": CELERY_QUEUE_MAIL_CRITICAL,
+            "priority": 8,
+        },
+        "app.infra.tasks.email.send_email_welcome_task": {
+            "queue": CELERY_QUEUE_MAIL_CRITICAL,
+            "priority": 6,
+        },
+        "app.infra.tasks.email.send_email_welcome_with_exist_account_task": {
+            "queue": CELERY_QUEUE_MAIL_CRITICAL,
+            "priority": 6,
+        },
+        # fan-out tasks before the batches they spawn
+        "app.infra.tasks.email.send_email_notification_subject_task*": {
+            "queue": CELERY_QUEUE_MAIL_BULK,
+            "priority": 6,
+        },
+        "app.infra.tasks.email.send_student_evaluation_subject_task": {
+            "queue": CELERY_QUEUE_MAIL_BULK,
+            "priority": 6,
+        },
+        "app.infra.tasks.email.*": {"queue": CELERY_QUEUE_MAIL_BULK, "priority": 3},
+        "app.infra.tasks.drive_file.*": {"queue": CELERY_QUEUE_DRIVE, "priority": 3},
+        "app.infra.tasks.periodic.*": {"queue": CELERY_QUEUE_PERIODIC, "priority": 5},
+    }
+
     # event_serializer = ['pickle']
     result_serializer: str = "json"
 
@@ -144,6 +300,10 @@ class CeleryConfig(BaseSettings):
         "app.infra.tasks.periodic.manage_form_absent",
         "app.infra.tasks.periodic.manage_form_evaluation",
         "app.infra.tasks.drive_file",
+        "app.infra.tasks.roll_call",
+        "app.infra.tasks.periodic.daily_bible",
+        "app.infra.tasks.audit_log",
+        "app.infra.tasks.search_index",
     ]
 
     """
@@ -166,6 +326,10 @@ class CeleryConfig(BaseSettings):
             "task": "app.infra.tasks.periodic.manage_form_evaluation.close_form_evaluation_task",
             "schedule": crontab(minute="59", hour=23, day_of_week=1, month_of_year="1-5,9-12"),
         },
+        "prefetch-daily-bible-every-day": {
+            "task": "app.infra.tasks.periodic.daily_bible.prefetch_daily_bible_task",
+            "schedule": crontab(minute="30", hour=23),
+        },
     }
 
 
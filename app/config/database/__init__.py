@@ -1,9 +1,126 @@
 """Database Module"""
 
+import logging
+import time
+
 from mongoengine import connect as mongo_engine_connect, disconnect_all
+from pymongo import ReadPreference, monitoring
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Keep connection pool statistics from pymongo's CMAP events, and log them at most every
+    MONGODB_POOL_STATS_LOG_SECONDS and at disconnect"""
+
+    def __init__(self):
+        self.stats = {
+            "created": 0,
+            "closed": 0,
+            "checked_out": 0,
+            "checked_in": 0,
+            "check_out_failed": 0,
+            "pool_cleared": 0,
+        }
+        self._logged_at = time.monotonic()
+
+    @property
+    def in_use(self) -> int:
+        return self.stats["checked_out"] - self.stats["checked_in"]
+
+    def log_stats(self) -> None:
+        self._logged_at = time.monotonic()
+        logger.info("Mongo pool: %s connections in use (%s)", self.in_use, self.stats)
+
+    def _maybe_log_stats(self) -> None:
+        if time.monotonic() - self._logged_at >= settings.MONGODB_POOL_STATS_LOG_SECONDS:
+            self.log_stats()
+
+    def pool_created(self, event):
+        logger.debug("Mongo pool created for %s: %s", event.address, event.options)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.stats["pool_cleared"] += 1
+        logger.warning("Mongo pool cleared for %s", event.address)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self.stats["created"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self.stats["closed"] += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self.stats["check_out_failed"] += 1
+        logger.warning(
+            "Mongo connection check out failed for %s: %s (%s)",
+            event.address,
+            event.reason,
+            self.stats,
+        )
+
+    def connection_checked_out(self, event):
+        self.stats["checked_out"] += 1
+        self._maybe_log_stats()
+
+    def connection_checked_in(self, event):
+        self.stats["checked_in"] += 1
+
+
+pool_stats_listener = PoolStatsListener()
+
+
+def get_connection_options() -> dict:
+    """
+    MongoClient options (pool, timeouts, compression, read preference) from settings
+    :return: dict
+    """
+    options = dict(
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=settings.MONGODB_SOCKET_TIMEOUT_MS,
+        read_preference=READ_PREFERENCES[settings.MONGODB_READ_PREFERENCE],
+    )
+    if settings.MONGODB_COMPRESSORS:
+        # zstd and snappy need the zstandard / python-snappy packages, zlib is builtin
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    if settings.MONGODB_POOL_MONITORING:
+        options["event_listeners"] = [pool_stats_listener]
+    return {key: value for key, value in options.items() if value is not None}
+
+
+def get_report_read_preference():
+    """
+    Read preference of list/report queries, which can be served by secondaries
+    :return: pymongo read preference
+    """
+    return READ_PREFERENCES[settings.MONGODB_REPORT_READ_PREFERENCE]
+
 
 def connect() -> None:
     """
@@ -13,7 +130,10 @@ def connect() -> None:
     print(settings.ENVIRONMENT)
     if settings.ENVIRONMENT == "testing" or settings.ENVIRONMENT == "local":
         return mongo_engine_connect(
-            settings.MONGODB_DATABASE, host=settings.MONGODB_HOST, port=settings.MONGODB_PORT
+            settings.MONGODB_DATABASE,
+            host=settings.MONGODB_HOST,
+            port=settings.MONGODB_PORT,
+            **get_connection_options(),
         )
     else:
         config = dict(
@@ -28,6 +148,7 @@ def connect() -> None:
         return mongo_engine_connect(
             settings.MONGODB_DATABASE,
             **config,
+            **get_connection_options(),
             alias="default",
         )
 
@@ -37,4 +158,6 @@ def disconnect() -> None:
     Disconnect database
     :return:
     """
+    if settings.MONGODB_POOL_MONITORING:
+        pool_stats_listener.log_stats()
     disconnect_all()
@@ -3,10 +3,12 @@ from pydantic import ConfigDict
 
 from app.domain.absent.enum import AbsentType, CreatedByEnum
 from app.domain.shared.entity import BaseEntity, IDModelMixin, DateTimeModelMixin
+from app.domain.shared.mongo_adapter import mongo_adapter, mongo_date
 from app.domain.student.field import PydanticStudentType
 from app.domain.subject.field import PydanticSubjectType
 from app.domain.student.entity import Student
 from app.domain.subject.subject_evaluation.entity import SubjectInEvaluation
+from app.shared.utils.general import validate_name
 
 
 class StudentAbsentInCreate(BaseEntity):
@@ -57,6 +59,12 @@ class AdminAbsentInResponse(AbsentResponseBase):
     status: bool
 
 
+ADMIN_ABSENT_ADAPTER = mongo_adapter(
+    AdminAbsentInResponse,
+    before={"student.full_name": validate_name, "student.date_of_birth": mongo_date},
+)
+
+
 class StudentAbsentInUpdate(BaseEntity):
     reason: str | None = None
 
@@ -25,3 +25,32 @@ class ManyCeleryResultsInResponse(BaseEntity):
 
 class TaskIdsRequest(BaseEntity):
     task_ids: conlist(str, max_length=20)
+
+
+class CeleryQueueMetrics(BaseEntity):
+    queue: str
+    # messages ready in the broker, None when it cannot be read
+    depth: int | None = None
+    consumers: int | None = None
+    tasks_started: int = 0
+    avg_wait_seconds: float | None = None
+    last_wait_seconds: float | None = None
+
+
+class CeleryQueuesInResponse(BaseEntity):
+    data: list[CeleryQueueMetrics]
+
+
+class RateLimitMetrics(BaseEntity):
+    bucket: str
+    rate_per_second: float
+    granted: int = 0
+    # calls which waited for their slot
+    delayed: int = 0
+    # celery tasks retried later rather than waiting
+    rescheduled: int = 0
+    avg_wait_seconds: float | None = None
+
+
+class RateLimitsInResponse(BaseEntity):
+    data: list[RateLimitMetrics]
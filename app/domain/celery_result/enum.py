@@ -7,3 +7,7 @@ class CeleryResultTag(str, ExtendedEnum):
     MANAGE_FORM = "manage_form"
     SEND_MAIL = "send_mail"
     DRIVE_FILE = "drive_file"
+    ROLL_CALL = "roll_call"
+    DAILY_BIBLE = "daily_bible"
+    AUDIT_LOG = "audit_log"
+    SEARCH_INDEX = "search_index"
@@ -0,0 +1,7 @@
+from app.shared.utils.general import ExtendedEnum
+
+
+class EmailDeliveryStatus(str, ExtendedEnum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
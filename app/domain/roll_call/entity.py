@@ -67,3 +67,9 @@ class StudentRollCallResultInResponse(BaseEntity):
 
 class RollCallBulkSheet(ImportSpreadsheetsPayload):
     subject_id: str
+
+
+class RollCallBulkResult(BaseEntity):
+    matched: int = 0
+    updated: int = 0
+    unknown_numerical_orders: list[int] = []
@@ -1,7 +1,16 @@
 from datetime import datetime, date, timezone
-from pydantic import BaseModel, field_validator, Field, ConfigDict, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    create_model,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 from fastapi import Query
-from typing import Optional
+from typing import Annotated, Optional
 import json
 
 from app.domain.shared.field import PydanticObjectId
@@ -55,6 +64,34 @@ class Pagination(BaseModel):
     total: Optional[int] = 0
     page_index: Optional[int] = 1
     total_pages: Optional[int] = None
+    # `after` of the next page in cursor mode, None on the last page
+    next_cursor: Optional[str] = None
+
+
+class _SetFieldsOnly(BaseModel):
+    @model_serializer(mode="wrap")
+    def _serialize_set_fields(self, handler, info: SerializationInfo):
+        data = handler(self)
+        keys = {
+            (self.model_fields[name].serialization_alias or name) if info.by_alias else name
+            for name in self.model_fields_set
+        }
+        return {key: value for key, value in data.items() if key in keys}
+
+
+def partial_model(model: type[BaseModel]) -> type[BaseModel]:
+    """`model` with every field optional, for the items of a list projected on a few fields
+
+    The validators of `model` are kept, they only run on the fields given, and only the fields
+    given are serialized (the fields not asked are left out rather than sent as nulls).
+    """
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = (
+            Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        )
+        fields[name] = (Optional[annotation], None)
+    return create_model(f"Partial{model.__name__}", __base__=(model, _SetFieldsOnly), **fields)
 
 
 class SearchRequest(BaseModel):
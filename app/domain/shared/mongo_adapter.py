@@ -0,0 +1,81 @@
+"""Response models validated straight from raw Mongo documents
+
+A list row used to go through four object graphs: the aggregate dict, a mongoengine
+document (from_mongo), the XInDB model (model_validate from its attributes), its dump, and
+the response model. With the repositories in raw mode (`raw=True`, dicts of the aggregate)
+a TypeAdapter of the response model validates the dict itself: `_id` become `id`, the
+ObjectIds strings, and the `before` functions run the normalizations of the XInDB
+validators on the raw values (e.g. validate_name on the full names).
+
+The references must be loaded beforehand (see select_related_raw).
+
+Example:
+    STUDENT_ADAPTER = mongo_adapter(Student, before={"full_name": validate_name})
+    data = [STUDENT_ADAPTER.validate_python(doc) for doc in docs]
+"""
+
+from datetime import date, datetime
+from typing import Annotated, Any, Callable, TypeVar
+
+from bson import ObjectId
+from pydantic import BaseModel, BeforeValidator, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def from_mongo_raw(value: Any) -> Any:
+    """`value` with the `_id` of its (sub)documents as `id`, and the ObjectIds as strings"""
+    if isinstance(value, dict):
+        return {
+            ("id" if key == "_id" else key): from_mongo_raw(item) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [from_mongo_raw(item) for item in value]
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+
+def select_fields(doc: dict, fields: list[str]) -> dict:
+    """The values of `fields` in the raw document `doc` (None when missing), for the
+    partial models"""
+    return {field: doc.get("_id" if field == "id" else field) for field in fields}
+
+
+def mongo_date(value: Any) -> Any:
+    """The date of a DateField, stored as a datetime (DateField.to_python)"""
+    if isinstance(value, datetime):
+        return date(value.year, value.month, value.day)
+    return value
+
+
+def _apply(value: Any, path: list[str], func: Callable[[Any], Any]) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _apply(item, path, func)
+        return
+    if not isinstance(value, dict) or value.get(path[0]) is None:
+        return
+    if len(path) == 1:
+        value[path[0]] = func(value[path[0]])
+    else:
+        _apply(value[path[0]], path[1:], func)
+
+
+def mongo_adapter(
+    model: type[M], before: dict[str, Callable[[Any], Any]] | None = None
+) -> TypeAdapter[M]:
+    """TypeAdapter validating `model` from a raw Mongo document
+
+    :param before: functions applied to the raw values, by dotted path ("student.full_name")
+    """
+
+    def prepare(doc: Any) -> Any:
+        if isinstance(doc, BaseModel):
+            return doc
+        doc = from_mongo_raw(doc)
+        for path, func in (before or {}).items():
+            _apply(doc, path.split("."), func)
+        return doc
+
+    return TypeAdapter(Annotated[model, BeforeValidator(prepare)])
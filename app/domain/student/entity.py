@@ -10,7 +10,9 @@ from app.domain.shared.entity import (
     IDModelMixin,
     DateTimeModelMixin,
     Pagination,
+    partial_model,
 )
+from app.domain.shared.mongo_adapter import mongo_adapter, mongo_date
 from app.domain.student.enum import SexEnum
 from app.shared.utils.general import (
     convert_valid_date,
@@ -93,9 +95,20 @@ class Student(StudentBase, DateTimeModelMixin):
     seasons_info: list[StudentSeason]
 
 
+PartialStudentInDB = partial_model(StudentInDB)
+PartialStudent = partial_model(Student)
+STUDENT_ADAPTER = mongo_adapter(
+    Student, before={"full_name": validate_name, "date_of_birth": mongo_date}
+)
+PARTIAL_STUDENT_ADAPTER = mongo_adapter(
+    PartialStudent, before={"full_name": validate_name, "date_of_birth": mongo_date}
+)
+
+
 class ManyStudentsInResponse(BaseEntity):
     pagination: Optional[Pagination] = None
-    data: Optional[List[Student]] = None
+    # partial items when the list is projected on a few fields
+    data: Optional[List[Student | PartialStudent]] = None
 
 
 class BaseStudentInStudentRequestResponse(BaseEntity):
@@ -3,6 +3,7 @@ from typing import Optional
 from pydantic import ConfigDict, field_validator, ValidationInfo
 
 from app.domain.shared.entity import BaseEntity, DateTimeModelMixin, IDModelMixin, Pagination
+from app.domain.shared.mongo_adapter import mongo_adapter, mongo_date
 from app.domain.lecturer.field import PydanticLecturerType
 from app.domain.lecturer.entity import Lecturer, LecturerInStudent
 from app.domain.student.entity import StudentSeason
@@ -54,6 +55,9 @@ class Subject(SubjectBase, DateTimeModelMixin):
     extra_emails: Optional[set[str]] = None
 
 
+SUBJECT_ADAPTER = mongo_adapter(Subject, before={"start_at": mongo_date})
+
+
 class SendNotificationRequest(BaseEntity):
     extra_emails: Optional[set[str]] = None
 
@@ -1,11 +1,19 @@
 from datetime import datetime, timezone
 from pydantic import ConfigDict
 
-from app.domain.shared.entity import BaseEntity, DateTimeModelMixin, IDModelMixin, Pagination
+from app.domain.shared.entity import (
+    BaseEntity,
+    DateTimeModelMixin,
+    IDModelMixin,
+    Pagination,
+    partial_model,
+)
+from app.domain.shared.mongo_adapter import mongo_adapter
 from app.domain.student.entity import StudentSeason
 from app.domain.student.field import PydanticStudentType
 from app.domain.subject.field import PydanticSubjectType
 from app.domain.subject.subject_evaluation.enum import QualityValueEnum, TypeQuestionEnum
+from app.shared.utils.general import validate_name
 
 
 class Quality(BaseEntity):
@@ -72,9 +80,20 @@ class SubjectEvaluationAdmin(SubjectEvaluationBase, DateTimeModelMixin):
     student: StudentInEvaluation
 
 
+PartialSubjectEvaluationInDB = partial_model(SubjectEvaluationInDB)
+PartialSubjectEvaluationAdmin = partial_model(SubjectEvaluationAdmin)
+SUBJECT_EVALUATION_ADMIN_ADAPTER = mongo_adapter(
+    SubjectEvaluationAdmin, before={"student.full_name": validate_name}
+)
+PARTIAL_SUBJECT_EVALUATION_ADMIN_ADAPTER = mongo_adapter(
+    PartialSubjectEvaluationAdmin, before={"student.full_name": validate_name}
+)
+
+
 class ManySubjectEvaluationAdminInResponse(BaseEntity):
     pagination: Pagination | None = None
-    data: list[SubjectEvaluationAdmin] | None = None
+    # partial items when the list is projected on a few fields
+    data: list[SubjectEvaluationAdmin | PartialSubjectEvaluationAdmin] | None = None
 
 
 class SubjectEvaluationInUpdate(BaseEntity):
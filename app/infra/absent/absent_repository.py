@@ -50,7 +50,8 @@ class AbsentRepository:
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[AbsentModel]:
+        raw: bool = False,
+    ) -> List[AbsentModel] | List[dict]:
         pipeline = [
             {"$sort": sort if sort else {"id": 1}},
         ]
@@ -60,6 +61,8 @@ class AbsentRepository:
 
         try:
             docs = AbsentModel.objects().aggregate(pipeline)
+            if raw:
+                return list(docs)
             return [AbsentModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
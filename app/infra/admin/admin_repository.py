@@ -5,7 +5,9 @@ from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
 from app.models.admin import AdminModel
+from app.infra.security.principal_cache import admin_principal_cache
 from app.domain.admin.entity import AdminInDB, AdminInUpdateTime
+from app.shared.utils.pagination import paginate_pipeline
 
 
 class AdminRepository:
@@ -61,6 +63,7 @@ class AdminRepository:
                 data.model_dump(exclude_none=True) if isinstance(data, AdminInUpdateTime) else data
             )
             AdminModel.objects(id=id).update_one(**data, upsert=False)
+            admin_principal_cache.invalidate(id=id)
             return True
         except Exception:
             return False
@@ -77,6 +80,7 @@ class AdminRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
     ) -> List[AdminModel]:
         pipeline = []
 
@@ -86,11 +90,7 @@ class AdminRepository:
         pipeline.append({"$match": match_pipe})
 
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"created_at": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
 
         try:
@@ -4,8 +4,12 @@ from typing import Optional, Dict, Union, List, Any
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.config.database import get_report_read_preference
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.entity import AuditLogInDB
+from app.infra.audit_log.audit_log_writer import audit_log_writer
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
 
 
 class AuditLogRepository:
@@ -25,6 +29,13 @@ class AuditLogRepository:
 
         return new_doc
 
+    def enqueue(self, audit_log: AuditLogInDB) -> None:
+        """
+        Buffer a new audit_log, written in batch shortly after (see audit_log_writer)
+        :param audit_log:
+        """
+        audit_log_writer.put(audit_log)
+
     def get_by_id(self, document_id: Union[str, ObjectId]) -> Optional[AuditLogModel]:
         """
         Get audit_log in db from id
@@ -52,6 +63,7 @@ class AuditLogRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
     ) -> List[AuditLogModel]:
         pipeline = []
 
@@ -59,19 +71,44 @@ class AuditLogRepository:
             pipeline.append({"$match": match_pipeline})
 
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"created_at": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
 
         try:
-            docs = AuditLogModel.objects().aggregate(pipeline)
+            docs = (
+                AuditLogModel.objects()
+                .read_preference(get_report_read_preference())
+                .aggregate(pipeline)
+            )
             return [AuditLogModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[List[AuditLogModel], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = paginate_pipeline(
+            sort or {"created_at": -1}, page_index, page_size, after=after
+        )
+        try:
+            docs, total = aggregate_with_total(
+                AuditLogModel.objects().read_preference(get_report_read_preference()),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            return [AuditLogModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
@@ -83,7 +120,11 @@ class AuditLogRepository:
         pipeline.append({"$count": "document_count"})
 
         try:
-            docs = AuditLogModel.objects().aggregate(pipeline)
+            docs = (
+                AuditLogModel.objects()
+                .read_preference(get_report_read_preference())
+                .aggregate(pipeline)
+            )
             return list(docs)[0]["document_count"]
         except Exception:
             return 0
@@ -0,0 +1,200 @@
+"""Buffered writer of the audit logs
+
+Logging an admin action must not cost the request an insert. Entries are put in a bounded
+in-process queue and a daemon thread writes them with one insert_many per batch, when
+AUDIT_LOG_BATCH_SIZE entries are pending or every AUDIT_LOG_FLUSH_SECONDS, at w=1 without
+journaling (an audit log lost by a crash of the primary is acceptable).
+
+A batch Mongo does not accept within AUDIT_LOG_WRITE_TIMEOUT_SECONDS is handed to a celery
+task, and when the broker is down too (or the buffer is full) it is appended to a local
+journal file, which is replayed at the next startup.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+import pymongo
+from bson import ObjectId, json_util
+from pymongo.errors import BulkWriteError, PyMongoError
+from pymongo.write_concern import WriteConcern
+
+from app.config import settings
+from app.domain.audit_log.entity import AuditLogInDB
+from app.models.audit_log import AuditLogModel
+
+logger = logging.getLogger(__name__)
+
+TRUNCATED_SUFFIX = "... ({} characters truncated)"
+
+
+def cap_description(description: str | None) -> str | None:
+    max_length = settings.AUDIT_LOG_DESCRIPTION_MAX_LENGTH
+    if description is None or len(description) <= max_length:
+        return description
+    return description[:max_length] + TRUNCATED_SUFFIX.format(len(description) - max_length)
+
+
+def to_document(audit_log: AuditLogInDB) -> dict:
+    """Raw document of `audit_log`, stamped with the time of the action
+
+    Raises:
+        ValidationError: `audit_log` is not a valid AuditLogModel
+    """
+    doc = AuditLogModel(**audit_log.model_dump())
+    doc.description = cap_description(doc.description)
+    doc.created_at = doc.created_at or datetime.now(timezone.utc)
+    # save() validated the entry in the request, the batch insert does not
+    doc.validate()
+    document = doc.to_mongo().to_dict()
+    # the id is fixed here, so that a batch written twice (retried, replayed) is deduplicated
+    document["_id"] = ObjectId()
+    return document
+
+
+def insert_audit_logs(documents: list[dict]) -> None:
+    """
+    Raises:
+        PyMongoError: the batch is not written within AUDIT_LOG_WRITE_TIMEOUT_SECONDS
+    """
+    if not documents:
+        return
+    collection = AuditLogModel._get_collection().with_options(
+        write_concern=WriteConcern(w=1, j=False)
+    )
+    with pymongo.timeout(settings.AUDIT_LOG_WRITE_TIMEOUT_SECONDS):
+        try:
+            collection.insert_many(documents, ordered=False)
+        except BulkWriteError as ex:
+            # replayed batches: the entries already written are duplicates
+            if any(error["code"] != 11000 for error in ex.details["writeErrors"]):
+                raise
+
+
+class AuditLogWriter:
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=settings.AUDIT_LOG_BUFFER_SIZE)
+        self._lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.AUDIT_LOG_BUFFER_SIZE > 0
+
+    def put(self, audit_log: AuditLogInDB) -> None:
+        document = to_document(audit_log)
+        if not self.enabled:
+            insert_audit_logs([document])
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            logger.warning("Audit log buffer is full, journaling the entry")
+            self._write_journal([document])
+
+    def _ensure_started(self) -> None:
+        # the thread of the parent is not running in a forked worker
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=settings.AUDIT_LOG_BUFFER_SIZE)
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _next_batch(self) -> list[dict]:
+        """Entries pending, waiting up to AUDIT_LOG_FLUSH_SECONDS for a full batch"""
+        deadline = time.monotonic() + settings.AUDIT_LOG_FLUSH_SECONDS
+        batch = []
+        while len(batch) < settings.AUDIT_LOG_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or self._stopped.is_set():
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list[dict]) -> None:
+        try:
+            insert_audit_logs(batch)
+        except PyMongoError as ex:
+            logger.warning(f"Cannot write {len(batch)} audit logs ({ex}), handing them to celery")
+            self._spill(batch)
+
+    def _spill(self, batch: list[dict]) -> None:
+        # imported here: the task module imports this one
+        from app.infra.tasks.audit_log import write_audit_logs_task
+
+        try:
+            write_audit_logs_task.delay(documents=batch)
+        except Exception as ex:
+            logger.error(f"Cannot hand {len(batch)} audit logs to celery ({ex}), journaling them")
+            self._write_journal(batch)
+
+    def _write_journal(self, batch: list[dict]) -> None:
+        with self._journal_lock:
+            try:
+                with open(settings.AUDIT_LOG_JOURNAL_PATH, "a", encoding="utf-8") as f:
+                    for document in batch:
+                        f.write(json_util.dumps(document) + "\n")
+            except OSError as ex:
+                logger.error(f"Lost {len(batch)} audit logs, cannot write the journal: {ex}")
+
+    def replay_journal(self) -> None:
+        """Write the entries journaled by a previous run"""
+        path = settings.AUDIT_LOG_JOURNAL_PATH
+        with self._journal_lock:
+            replaying = f"{path}.{os.getpid()}.replay"
+            try:
+                os.replace(path, replaying)
+            except FileNotFoundError:
+                # nothing journaled, or replayed by another worker
+                return
+        with open(replaying, encoding="utf-8") as f:
+            documents = [json_util.loads(line) for line in f if line.strip()]
+        try:
+            for i in range(0, len(documents), settings.AUDIT_LOG_BATCH_SIZE):
+                insert_audit_logs(documents[i : i + settings.AUDIT_LOG_BATCH_SIZE])
+        except PyMongoError as ex:
+            logger.warning(f"Cannot replay the audit log journal: {ex}")
+            self._write_journal(documents[i:])
+        else:
+            logger.info(f"Replayed {len(documents)} journaled audit logs")
+        os.remove(replaying)
+
+    def close(self) -> None:
+        """Stop the thread and write the entries still buffered"""
+        if self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._thread.join(timeout=settings.AUDIT_LOG_FLUSH_SECONDS + 1)
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for i in range(0, len(batch), settings.AUDIT_LOG_BATCH_SIZE):
+            self._flush(batch[i : i + settings.AUDIT_LOG_BATCH_SIZE])
+        self._pid = None
+
+
+audit_log_writer = AuditLogWriter()
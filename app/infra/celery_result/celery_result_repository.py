@@ -6,6 +6,8 @@ from typing import Any, List
 import pymongo
 
 from app.models.celery_result import CeleryResultModel
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
 
 
 class CeleryResultRepository:
@@ -18,17 +20,14 @@ class CeleryResultRepository:
         page_size: int = 20,
         match_pipeline: dict[str, Any] | None = None,
         sort: dict[str, int] | None = None,
+        after: str | None = None,
     ) -> list[CeleryResultModel]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
 
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"date_done": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"date_done": -1}, page_index, page_size, after=after)
         )
 
         try:
@@ -38,6 +37,31 @@ class CeleryResultRepository:
             print(e)
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int = 20,
+        match_pipeline: dict[str, Any] | None = None,
+        sort: dict[str, int] | None = None,
+        after: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[List[CeleryResultModel], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = paginate_pipeline(
+            sort or {"date_done": -1}, page_index, page_size, after=after
+        )
+        try:
+            docs, total = aggregate_with_total(
+                CeleryResultModel.objects(),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            return [CeleryResultModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: dict[str, Any] | None = None,
@@ -0,0 +1,148 @@
+"""Batched dereferencing of the references of a page (select_related)
+
+Each ReferenceField of a document is loaded lazily, with one query on its first access: a
+page of 100 subject evaluations showing their subject, its lecturer and the student costs
+300 queries. select_related gathers the referenced ids of the whole page, loads each
+referenced collection once with `$in`, and attaches the documents before the response is
+built, so the page costs one query per (collection, depth).
+
+select_related_raw does the same on the raw documents of a repository in raw mode, the
+references are replaced by the raw referenced documents.
+
+Example:
+    evaluations = subject_evaluation_repository.list(...)
+    select_related(evaluations, "subject.lecturer", "student")
+"""
+
+from typing import Iterable, TypeVar
+
+from bson import DBRef, ObjectId
+from mongoengine import Document, ListField, ReferenceField
+from mongoengine.base import BaseList
+
+D = TypeVar("D", bound=Document)
+
+
+def _get_id(value) -> ObjectId | None:
+    if isinstance(value, DBRef):
+        return value.id
+    if isinstance(value, ObjectId):
+        return value
+    return None
+
+
+def _get_reference_field(
+    doc: Document | type[Document], name: str
+) -> tuple[ReferenceField | None, bool]:
+    """ReferenceField `name` of `doc`, and whether it is a list of references"""
+    field = doc._fields.get(name)
+    if isinstance(field, ListField) and isinstance(field.field, ReferenceField):
+        return field.field, True
+    if isinstance(field, ReferenceField):
+        return field, False
+    return None, False
+
+
+def _load(
+    field: ReferenceField, ids: set[ObjectId], loaded: dict[tuple[str, ObjectId], Document]
+) -> None:
+    model = field.document_type
+    collection = model._get_collection_name()
+    missing = [pk for pk in ids if (collection, pk) not in loaded]
+    if missing:
+        for doc in model.objects(id__in=missing):
+            loaded[(collection, doc.pk)] = doc
+
+
+def _select_level(
+    docs: list[Document], name: str, loaded: dict[tuple[str, ObjectId], Document]
+) -> list[Document]:
+    """Attach the references `name` of `docs`, return the referenced documents"""
+    fields: dict[ReferenceField, set[ObjectId]] = {}
+    for doc in docs:
+        field, many = _get_reference_field(doc, name)
+        if field is None:
+            continue
+        values = doc._data.get(name) if many else [doc._data.get(name)]
+        ids = fields.setdefault(field, set())
+        ids.update(pk for pk in map(_get_id, values or []) if pk is not None)
+
+    for field, ids in fields.items():
+        _load(field, ids, loaded)
+
+    related = {}
+    for doc in docs:
+        field, many = _get_reference_field(doc, name)
+        if field is None or not doc._data.get(name):
+            continue
+        collection = field.document_type._get_collection_name()
+        values = doc._data[name] if many else [doc._data[name]]
+        # a reference to a missing document is left as is, it raises on access as before
+        values = [loaded.get((collection, _get_id(value)), value) for value in values]
+        if many:
+            values = BaseList(values, doc, name)
+            values._dereferenced = True
+            doc._data[name] = values
+        else:
+            doc._data[name] = values[0]
+        related.update((id(value), value) for value in values if isinstance(value, Document))
+    return list(related.values())
+
+
+def select_related(docs: Iterable[D], *paths: str) -> list[D]:
+    """Load the references `paths` (dotted for nested references) of `docs` in batches
+
+    :param paths: names of ReferenceField or ListField(ReferenceField), "subject.lecturer"
+        also loads the subjects
+    :return: `docs`, with their references attached
+    """
+    docs = list(docs)
+    # documents loaded by the previous paths are reused ("author", "attachments.author")
+    loaded: dict[tuple[str, ObjectId], Document] = {}
+    for path in paths:
+        level: list[Document] = docs
+        for name in path.split("."):
+            level = _select_level(level, name, loaded)
+            if not level:
+                break
+    return docs
+
+
+def select_related_raw(docs: list[dict], model: type[Document], *paths: str) -> list[dict]:
+    """select_related on raw documents of `model`
+
+    :param paths: names of the fields in `model` (not the names in Mongo)
+    :return: `docs`, their references replaced by the raw referenced documents
+    """
+    loaded: dict[tuple[str, ObjectId], dict] = {}
+    for path in paths:
+        level, level_model = docs, model
+        for name in path.split("."):
+            field, many = _get_reference_field(level_model, name)
+            if field is None:
+                break
+            key = level_model._fields[name].db_field
+            target = field.document_type
+            collection = target._get_collection_name()
+
+            ids = set()
+            for doc in level:
+                values = doc.get(key) if many else [doc.get(key)]
+                ids.update(pk for pk in map(_get_id, values or []) if pk is not None)
+            missing = [pk for pk in ids if (collection, pk) not in loaded]
+            if missing:
+                for related in target._get_collection().find({"_id": {"$in": missing}}):
+                    loaded[(collection, related["_id"])] = related
+
+            next_level = {}
+            for doc in level:
+                if not doc.get(key):
+                    continue
+                values = doc[key] if many else [doc[key]]
+                values = [loaded.get((collection, _get_id(value)), value) for value in values]
+                doc[key] = values if many else values[0]
+                next_level.update((id(value), value) for value in values if isinstance(value, dict))
+            level, level_model = list(next_level.values()), target
+            if not level:
+                break
+    return docs
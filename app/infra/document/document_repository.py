@@ -5,7 +5,11 @@ from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
 from app.models.document import DocumentModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.document.entity import DocumentInDB, DocumentInUpdateTime
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
+from app.shared.utils.search import search_stages
 
 
 class DocumentRepository:
@@ -22,6 +26,7 @@ class DocumentRepository:
         new_doc = DocumentModel(**document.model_dump())
         # and save it to db
         new_doc.save()
+        invalidate_response_cache(ResponseCacheTag.DOCUMENT)
 
         return new_doc
 
@@ -47,7 +52,9 @@ class DocumentRepository:
                 if isinstance(data, DocumentInUpdateTime)
                 else data
             )
+            data = {**data, **DocumentModel.get_updated_search_index(id, data)}
             DocumentModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.DOCUMENT)
             return True
         except Exception:
             return False
@@ -64,17 +71,16 @@ class DocumentRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
     ) -> List[DocumentModel]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
 
+        pipeline.extend(search_stages(search))
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"created_at": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
 
         try:
@@ -83,6 +89,32 @@ class DocumentRepository:
         except Exception:
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[List[DocumentModel], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = search_stages(search) + paginate_pipeline(
+            sort or {"created_at": -1}, page_index, page_size, after=after
+        )
+        try:
+            docs, total = aggregate_with_total(
+                DocumentModel.objects(),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            return [DocumentModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
@@ -102,6 +134,7 @@ class DocumentRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             DocumentModel.objects(id=id).delete()
+            invalidate_response_cache(ResponseCacheTag.DOCUMENT)
             return True
         except Exception:
             return False
@@ -2,6 +2,7 @@ import sib_api_v3_sdk
 from typing import Optional, Dict, Any, List, Union
 from pydantic import EmailStr
 from app.config import settings
+from app.infra.services.rate_limiter import RateLimitBucket, rate_limited
 
 
 class BrevoService:
@@ -14,6 +15,8 @@ class BrevoService:
         )
         self.contact = sib_api_v3_sdk.ContactsApi(sib_api_v3_sdk.ApiClient(configuration))
 
+    # one call per task (send_..._to_user_task): rescheduled when the bucket is far ahead
+    @rate_limited(RateLimitBucket.BREVO, reschedule=True)
     def _send(
         self,
         emails_to: Union[List[str], str],
@@ -55,6 +58,40 @@ class BrevoService:
         api_response = self.api_instance.send_transac_email(send_smtp_email)
         return api_response
 
+    @rate_limited(RateLimitBucket.BREVO)
+    def send_batch(
+        self,
+        template_id: int,
+        recipients: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """Send a template to several recipients in one API call (messageVersions)
+
+        :param recipients: {"email": ..., "params": {...}}, "params" (optional) are merged
+            into the common `params` for this recipient only
+        :return: message ids, one per recipient
+        """
+        if len(recipients) == 0:
+            raise Exception("Must have email to")
+
+        versions = [
+            sib_api_v3_sdk.SendSmtpEmailMessageVersions(
+                to=[sib_api_v3_sdk.SendSmtpEmailTo(email=recipient["email"])],
+                params={**(params or {}), **recipient["params"]}
+                if recipient.get("params")
+                else None,
+            )
+            for recipient in recipients
+        ]
+        send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
+            template_id=template_id,
+            params=params,
+            message_versions=versions,
+            reply_to={"email": settings.YSOF_EMAIL},
+        )
+        api_response = self.api_instance.send_transac_email(send_smtp_email)
+        return api_response.message_ids or [api_response.message_id]
+
     def send_student_notification_subject(self, email_to: str, params: dict) -> Any:
         resp = self._send(
             emails_to=email_to,
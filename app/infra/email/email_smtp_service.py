@@ -1,20 +1,165 @@
 from datetime import datetime
+import os
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.utils import make_msgid, formataddr
 import pytz
 from app.config import settings
 from app.infra.logging import get_logger
+from app.infra.services.rate_limiter import RateLimitBucket, rate_limited
 import ssl
 
 logger = get_logger()
 
 
+def is_connection_error(ex: OSError) -> bool:
+    """Socket errors and lost sessions, the other SMTP errors are answers of the server"""
+    return not isinstance(ex, smtplib.SMTPException) or isinstance(
+        ex, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)
+    )
+
+
+class SMTPConnection:
+    def __init__(self):
+        self.smtp = smtplib.SMTP(
+            host=settings.SMTP_MAIL_HOST,
+            port=settings.SMTP_MAIL_PORT,
+            timeout=settings.SMTP_TIMEOUT,
+        )
+        if settings.SMTP_STARTTLS:
+            self.smtp.starttls(context=ssl.create_default_context())
+        if settings.SMTP_MAIL_USER:
+            self.smtp.login(user=settings.SMTP_MAIL_USER, password=settings.SMTP_MAIL_PASSWORD)
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+    def alive(self) -> bool:
+        """NOOP when the connection was idle, the server may have closed it"""
+        if time.monotonic() - self.last_used < settings.SMTP_KEEPALIVE_SECONDS:
+            return True
+        try:
+            return self.smtp.noop()[0] == 250
+        except OSError:
+            return False
+
+    @rate_limited(RateLimitBucket.SMTP)
+    def send(self, msg: MIMEMultipart) -> dict:
+        res = self.smtp.send_message(msg)
+        self.sent += 1
+        self.last_used = time.monotonic()
+        return res
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except OSError:
+            self.smtp.close()
+
+
+class SMTPConnectionPool:
+    """Authenticated SMTP sessions kept open and reused by the threads of a process
+
+    A session sends at most SMTP_MAX_MESSAGES_PER_CONNECTION messages, and the messages of
+    the process are spaced to stay under SMTP_RATE_LIMIT_PER_MINUTE.
+    """
+
+    def __init__(self):
+        self._idle: list[SMTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(settings.SMTP_POOL_SIZE)
+        self._next_send_at = 0.0
+
+    def _acquire(self) -> SMTPConnection:
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.alive():
+                    return conn
+                conn.close()
+        return SMTPConnection()
+
+    def _release(self, conn: SMTPConnection):
+        if conn.sent >= settings.SMTP_MAX_MESSAGES_PER_CONNECTION:
+            conn.close()
+            return
+        with self._lock:
+            self._idle.append(conn)
+
+    def _throttle(self):
+        if settings.SMTP_RATE_LIMIT_PER_MINUTE <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_send_at - now
+            self._next_send_at = max(now, self._next_send_at) + (
+                60 / settings.SMTP_RATE_LIMIT_PER_MINUTE
+            )
+        if wait > 0:
+            time.sleep(wait)
+
+    def send_many(self, messages: list[MIMEMultipart]) -> dict[int, Exception]:
+        """Send the messages one after another over the same session(s)
+
+        :return: exceptions of the messages that could not be sent, by index
+        """
+        failures: dict[int, Exception] = {}
+        with self._slots:
+            conn = None
+            try:
+                for idx, msg in enumerate(messages):
+                    self._throttle()
+                    for retry in (False, True):
+                        try:
+                            if conn is None:
+                                conn = self._acquire()
+                            conn.send(msg)
+                            break
+                        except OSError as ex:  # smtplib.SMTPException included
+                            if not is_connection_error(ex):
+                                # refused by the server, the session is still usable
+                                failures[idx] = ex
+                                break
+                            # lost session: reconnect and send it once more
+                            if conn is not None:
+                                conn.close()
+                                conn = None
+                            if retry:
+                                failures[idx] = ex
+                    if conn is not None and conn.sent >= settings.SMTP_MAX_MESSAGES_PER_CONNECTION:
+                        conn.close()
+                        conn = None
+            finally:
+                if conn is not None:
+                    self._release(conn)
+        return failures
+
+    def send(self, msg: MIMEMultipart):
+        failures = self.send_many([msg])
+        if failures:
+            raise failures[0]
+
+
+_pool: SMTPConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Pool of the current process, sessions are not shared with forked celery workers"""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool, _pool_pid = SMTPConnectionPool(), os.getpid()
+        return _pool
+
+
 class EmailSMTPService:
-    def _send(
+    def _build_message(
         self, emails_to: list[str] | str, subject: str, plain_text: str, html: str | None = None
-    ):
+    ) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["From"] = formataddr(("YSOF", settings.YSOF_EMAIL))
         msg["To"] = emails_to if isinstance(emails_to, str) else ", ".join(emails_to)
@@ -28,16 +173,30 @@ class EmailSMTPService:
         msg.attach(MIMEText(plain_text, "plain"))
         if html:
             msg.attach(MIMEText(html, "html"))
+        return msg
 
-        with smtplib.SMTP(host=settings.SMTP_MAIL_HOST, port=settings.SMTP_MAIL_PORT) as service:
-            service.starttls(context=ssl.create_default_context())
-            service.login(user=settings.SMTP_MAIL_USER, password=settings.SMTP_MAIL_PASSWORD)
-            res = service.send_message(msg)
-        return res
+    def _send(
+        self, emails_to: list[str] | str, subject: str, plain_text: str, html: str | None = None
+    ):
+        get_smtp_pool().send(self._build_message(emails_to, subject, plain_text, html))
 
     def send_email_welcome(self, email: str, plain_text: str):
         self._send(emails_to=email, subject="YSOF - Tài khoản truy cập", plain_text=plain_text)
 
+    def send_email_welcome_many(self, emails: list[tuple[str, str]]) -> dict[int, Exception]:
+        """
+        :param emails: (email, plain text) of each welcome email
+        :return: exceptions of the emails that could not be sent, by index
+        """
+        return get_smtp_pool().send_many(
+            [
+                self._build_message(
+                    emails_to=email, subject="YSOF - Tài khoản truy cập", plain_text=plain_text
+                )
+                for email, plain_text in emails
+            ]
+        )
+
     def send_email_forgot_password_otp(self, email: str, plain_text: str):
         self._send(emails_to=email, subject="YSOF - Mã OTP đặt lại mật khẩu", plain_text=plain_text)
 
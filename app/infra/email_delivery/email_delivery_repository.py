@@ -0,0 +1,59 @@
+"""Email delivery repository module"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pymongo
+
+from app.domain.email_delivery.enum import EmailDeliveryStatus
+from app.models.email_delivery import EmailDeliveryModel
+
+
+class EmailDeliveryRepository:
+    def __init__(self):
+        pass
+
+    def set_status(
+        self,
+        template_id: int,
+        ref: str,
+        emails: List[str],
+        status: EmailDeliveryStatus,
+        message_ids: Optional[Dict[str, str]] = None,
+        error: Optional[str] = None,
+        attempt: bool = False,
+    ) -> None:
+        """
+        Upsert the delivery status of the recipients of an email in one bulk write
+        :param template_id:
+        :param ref:
+        :param emails:
+        :param status:
+        :param message_ids: provider message id by email
+        :param error:
+        :param attempt: count a new send attempt
+        :return:
+        """
+        if not emails:
+            return
+        now = datetime.now(timezone.utc)
+        operations = []
+        for email in emails:
+            update = {
+                "$set": {
+                    "status": status.value,
+                    "error": error,
+                    "updated_at": now,
+                },
+                "$setOnInsert": {"_cls": EmailDeliveryModel._class_name, "created_at": now},
+            }
+            if message_ids and email in message_ids:
+                update["$set"]["message_id"] = message_ids[email]
+            if attempt:
+                update["$inc"] = {"attempts": 1}
+            operations.append(
+                pymongo.UpdateOne(
+                    {"ref": ref, "template_id": template_id, "email": email}, update, upsert=True
+                )
+            )
+        EmailDeliveryModel._get_collection().bulk_write(operations, ordered=False)
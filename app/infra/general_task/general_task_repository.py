@@ -6,6 +6,9 @@ from bson import ObjectId
 
 from app.models.general_task import GeneralTaskModel
 from app.domain.general_task.entity import GeneralTaskInDB, GeneralTaskInUpdateTime
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
+from app.shared.utils.search import search_stages
 
 
 class GeneralTaskRepository:
@@ -53,6 +56,7 @@ class GeneralTaskRepository:
             )
             if isinstance(attachments, List):
                 data["attachments"] = [ObjectId(id) for id in attachments]
+            data = {**data, **GeneralTaskModel.get_updated_search_index(id, data)}
             GeneralTaskModel.objects(id=id).update_one(**data, upsert=False)
             return True
         except Exception:
@@ -70,17 +74,16 @@ class GeneralTaskRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
     ) -> List[GeneralTaskModel]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
 
+        pipeline.extend(search_stages(search))
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"created_at": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
 
         try:
@@ -89,6 +92,32 @@ class GeneralTaskRepository:
         except Exception:
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[List[GeneralTaskModel], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = search_stages(search) + paginate_pipeline(
+            sort or {"created_at": -1}, page_index, page_size, after=after
+        )
+        try:
+            docs, total = aggregate_with_total(
+                GeneralTaskModel.objects(),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            return [GeneralTaskModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
@@ -0,0 +1,60 @@
+"""Invalidations of the in-process caches, published on Redis
+
+A cache in the memory of each process (the current season, the authenticated admins and
+students) is dropped on the writes of any process: the writer publishes on a Redis channel,
+which a daemon thread of each process listens to.
+"""
+
+import os
+import time
+from threading import Lock, Thread
+from typing import Callable, Optional
+
+from app.config.redis import get_redis_client
+
+RECONNECT_SECONDS = 5
+
+
+class InvalidationListener:
+    """Thread of the process calling `on_message` with the data published on `channel`
+
+    `on_reset` drops the whole cache: when the thread starts (the cache inherited from a
+    parent process was not invalidated) and when Redis is disconnected.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_message: Callable[[bytes], None],
+        on_reset: Callable[[], None],
+        name: str,
+    ):
+        self.channel = channel
+        self.name = name
+        self._on_message = on_message
+        self._on_reset = on_reset
+        self._lock = Lock()
+        self._pid: Optional[int] = None
+
+    def start(self) -> None:
+        """Start the thread, once per process (forked celery workers included)"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._on_reset()
+            self._pid = os.getpid()
+        Thread(target=self._listen, name=self.name, daemon=True).start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    self._on_message(message["data"])
+            except Exception:
+                # invalidations may have been missed while disconnected
+                self._on_reset()
+                time.sleep(RECONNECT_SECONDS)
@@ -5,7 +5,10 @@ from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
 from app.models.lecturer import LecturerModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.lecturer.entity import LecturerInDB, LecturerInUpdateTime
+from app.shared.utils.pagination import paginate_pipeline
+from app.shared.utils.search import search_stages
 
 
 class LecturerRepository:
@@ -22,6 +25,7 @@ class LecturerRepository:
         new_doc = LecturerModel(**lecturer.model_dump())
         # and save it to db
         new_doc.save()
+        invalidate_response_cache(ResponseCacheTag.LECTURER)
 
         return new_doc
 
@@ -47,7 +51,9 @@ class LecturerRepository:
                 if isinstance(data, LecturerInUpdateTime)
                 else data
             )
+            data = {**data, **LecturerModel.get_updated_search_index(id, data)}
             LecturerModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.LECTURER)
             return True
         except Exception:
             return False
@@ -64,17 +70,16 @@ class LecturerRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
     ) -> List[LecturerModel]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append(match_pipeline)
 
+        pipeline.extend(search_stages(search))
         pipeline.extend(
-            [
-                {"$sort": sort if sort else {"created_at": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
 
         try:
@@ -102,6 +107,7 @@ class LecturerRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             LecturerModel.objects(id=id).delete()
+            invalidate_response_cache(ResponseCacheTag.LECTURER)
             return True
         except Exception:
             return False
@@ -0,0 +1,82 @@
+"""A page of a list and the total of its filter, in one round trip
+
+In "exact" mode the page and the count are the two branches of a single `$facet` stage,
+after the `$match` of the filter (which still uses the indexes). In "cached" mode, for the
+unbounded collections where an exact count on each page is not worth it, the total of a
+(collection, filter) is reused from Redis for LIST_TOTAL_CACHE_TTL seconds, and an empty
+filter is counted with estimated_document_count (collection metadata).
+
+Cursor pages (`after`) never use `$facet`: the stages of a `$facet` cannot use an index, so
+the range `$match` and `$sort` of a keyset page are run outside, and the total is the
+cached one.
+
+Example:
+    docs, total = aggregate_with_total(
+        AuditLogModel.objects(), match_pipeline, page_stages, total_mode=TotalMode.CACHED
+    )
+"""
+
+from mongoengine import QuerySet
+
+from app.config import settings
+from app.config.redis import get_redis_client
+from app.shared.utils.general import ExtendedEnum, get_list_total_redis_key
+
+
+class TotalMode(str, ExtendedEnum):
+    EXACT = "exact"
+    CACHED = "cached"
+
+
+def _count(queryset: QuerySet, match_pipeline: dict | None) -> int:
+    docs = list(queryset.aggregate([{"$match": match_pipeline or {}}, {"$count": "count"}]))
+    return docs[0]["count"] if docs else 0
+
+
+def _get_cached_total(queryset: QuerySet, match_pipeline: dict | None) -> int | None:
+    if not match_pipeline:
+        return queryset._document._get_collection().estimated_document_count()
+    key = get_list_total_redis_key(queryset._document._get_collection_name(), match_pipeline)
+    cached = get_redis_client().get(key)
+    return int(cached) if cached is not None else None
+
+
+def _cache_total(queryset: QuerySet, match_pipeline: dict | None, total: int) -> None:
+    if not match_pipeline:
+        return
+    key = get_list_total_redis_key(queryset._document._get_collection_name(), match_pipeline)
+    get_redis_client().setex(key, settings.LIST_TOTAL_CACHE_TTL, total)
+
+
+def aggregate_with_total(
+    queryset: QuerySet,
+    match_pipeline: dict | None,
+    page_stages: list[dict],
+    total_mode: TotalMode = TotalMode.EXACT,
+    cursor: bool = False,
+) -> tuple[list[dict], int]:
+    """Raw documents of the page, and the total of `match_pipeline`
+
+    :param queryset: queryset of the model, with its read preference
+    :param page_stages: $sort/$skip/$limit stages (see paginate_pipeline)
+    :param cursor: `page_stages` are the ones of a cursor page
+    """
+    match_stages = [{"$match": match_pipeline}] if match_pipeline else []
+    total = None
+    if cursor or total_mode == TotalMode.CACHED:
+        total = _get_cached_total(queryset, match_pipeline)
+
+    if total is not None or cursor:
+        docs = list(queryset.aggregate(match_stages + page_stages))
+        if total is None:
+            total = _count(queryset, match_pipeline)
+            _cache_total(queryset, match_pipeline, total)
+        return docs, total
+
+    facet = {"$facet": {"data": page_stages, "total": [{"$count": "count"}]}}
+    result = next(iter(queryset.aggregate(match_stages + [facet])), None)
+    docs = result["data"] if result else []
+    total = result["total"][0]["count"] if result and result["total"] else 0
+    if total_mode == TotalMode.CACHED:
+        _cache_total(queryset, match_pipeline, total)
+    return docs, total
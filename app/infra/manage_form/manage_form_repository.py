@@ -1,6 +1,7 @@
 from bson import ObjectId
 from typing import Any
 from app.models.manage_form import ManageFormModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.manage_form.entity import ManageFormUpdateWithTime, ManageFormInDB
 
 
@@ -18,6 +19,7 @@ class ManageFormRepository:
         new_doc = ManageFormModel(**doc.model_dump())
         # and save it to db
         new_doc.save()
+        invalidate_response_cache(ResponseCacheTag.MANAGE_FORM)
         return new_doc
 
     def update(self, id: ObjectId, data: ManageFormUpdateWithTime | dict[str, Any]) -> bool:
@@ -28,6 +30,7 @@ class ManageFormRepository:
                 else data
             )
             ManageFormModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.MANAGE_FORM)
             return True
         except Exception:
             return False
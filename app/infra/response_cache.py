@@ -0,0 +1,205 @@
+"""Response cache of the read-mostly endpoints, invalidated by tags
+
+Seasons, subjects, lecturers, evaluation questions and the manage forms change a few times a
+week but are read on nearly every page load. An endpoint opts in with `cache_response`, with
+the tags of the data of its response, above `response_decorator`:
+
+    @router.get("", response_model=list[Season])
+    @cache_response(ResponseCacheTag.SEASON)
+    @response_decorator()
+    def get_list_seasons(...):
+
+The body of a 200 response is kept in Redis for RESPONSE_CACHE_TTL seconds, keyed by the
+path, the normalized query, the scope of the caller (roles and seasons, see `_get_scope`)
+and the tokens of the tags. The repositories replace the tokens of a tag on each write
+(`invalidate_response_cache`), so the entries computed before are never read again; a
+response computed during the write is stored under the former token, and is not either.
+
+The responses carry an ETag (hash of the body): a request whose If-None-Match matches gets a
+304 without body, also when the cache is disabled. The authentication dependencies still run
+on each request.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import uuid
+from enum import Enum
+from typing import Any, NamedTuple, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+from app.config.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+# not an ExtendedEnum: app.shared.utils.general imports the season repository, which
+# invalidates this cache
+class ResponseCacheTag(str, Enum):
+    SEASON = "season"
+    SUBJECT = "subject"
+    LECTURER = "lecturer"
+    DOCUMENT = "document"
+    SUBJECT_EVALUATION_QUESTION = "subject_evaluation_question"
+    MANAGE_FORM = "manage_form"
+
+
+class _Entry(NamedTuple):
+    etag: str
+    body: bytes
+
+
+def _enabled() -> bool:
+    return settings.RESPONSE_CACHE_TTL > 0
+
+
+def _get_tag_key(tag: ResponseCacheTag) -> str:
+    return f"response-cache:tag:{tag.value}"
+
+
+def _get_tokens(tags: tuple[ResponseCacheTag, ...]) -> list[str]:
+    redis_client = get_redis_client()
+    keys = [_get_tag_key(tag) for tag in tags]
+    tokens = redis_client.mget(keys)
+    missing = [key for key, token in zip(keys, tokens) if token is None]
+    if missing:
+        # first use of the tags (or after clear_all_cache), another process may race us
+        pipeline = redis_client.pipeline()
+        for key in missing:
+            pipeline.set(key, uuid.uuid4().hex, nx=True)
+        pipeline.execute()
+        tokens = redis_client.mget(keys)
+    return [token.decode() if isinstance(token, bytes) else token for token in tokens]
+
+
+def _get_scope(kwargs: dict[str, Any]) -> str:
+    """What the responses may depend on in the caller: the roles and latest season of an
+    admin (e.g. seasons allowed), the seasons of a student (e.g. subjects of its season)"""
+    admin = kwargs.get("current_admin")
+    if admin is not None:
+        return f"admin:{','.join(sorted(map(str, admin.roles)))}:{admin.latest_season}"
+    student = kwargs.get("current_student")
+    if student is not None:
+        return f"student:{','.join(str(info.season) for info in student.seasons_info)}"
+    return ""
+
+
+def _get_key(
+    request: Request, tags: tuple[ResponseCacheTag, ...], kwargs: dict[str, Any]
+) -> Optional[str]:
+    """Redis key of the response, None when the cache is disabled or Redis unavailable"""
+    if not _enabled():
+        return None
+    try:
+        tokens = _get_tokens(tags)
+    except Exception as ex:
+        logger.warning(f"Response cache unavailable ({ex})")
+        return None
+    query = sorted(request.query_params.multi_items())
+    normalized = repr((request.url.path, query, _get_scope(kwargs), tokens))
+    return f"response-cache:{hashlib.sha1(normalized.encode()).hexdigest()}"
+
+
+def _lookup(
+    request: Request, tags: tuple[ResponseCacheTag, ...], kwargs: dict[str, Any]
+) -> tuple[Optional[str], Optional[_Entry]]:
+    """Redis key of the response, and its cached entry"""
+    key = _get_key(request, tags, kwargs)
+    if key is None:
+        return None, None
+    try:
+        value = get_redis_client().get(key)
+    except Exception as ex:
+        logger.warning(f"Response cache unavailable ({ex})")
+        return None, None
+    if value is None:
+        return key, None
+    value = value.decode() if isinstance(value, bytes) else value
+    etag, body = value.split("\n", 1)
+    return key, _Entry(etag, body.encode())
+
+
+def _set(key: Optional[str], entry: _Entry) -> None:
+    if key is None:
+        return
+    try:
+        get_redis_client().setex(
+            key, settings.RESPONSE_CACHE_TTL, f"{entry.etag}\n{entry.body.decode()}"
+        )
+    except Exception as ex:
+        logger.warning(f"Response cache unavailable ({ex})")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # weak comparison (RFC 9110 13.1.2)
+    return "*" in candidates or etag in [candidate.removeprefix("W/") for candidate in candidates]
+
+
+def _build_response(request: Request, entry: _Entry) -> Response:
+    # private: the endpoints are authenticated; no-cache: the client revalidates each time
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _to_entry(response: Any) -> Optional[_Entry]:
+    """Entry of a successful JSON response, None for the others (left as they are)"""
+    if not (isinstance(response, Response) and response.status_code == 200):
+        return None
+    if response.media_type != "application/json":
+        return None
+    return _Entry(f'"{hashlib.sha1(response.body).hexdigest()}"', bytes(response.body))
+
+
+def cache_response(*tags: ResponseCacheTag):
+    """Cache the responses of the endpoint until a write of the `tags`, with ETags
+
+    :param tags: the data of the response, its entries are dropped on their writes
+    """
+
+    def decorator(f):
+        # the endpoint also receives the request (the route, the query, If-None-Match)
+        signature = inspect.signature(f)
+        request_parameter = inspect.Parameter(
+            "cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+        )
+
+        @functools.wraps(f)
+        def wrapper(*args, cache_request: Request, **kwargs):
+            key, entry = _lookup(cache_request, tags, kwargs)
+            if entry is None:
+                response = f(*args, **kwargs)
+                entry = _to_entry(response)
+                if entry is None:
+                    return response
+                _set(key, entry)
+            return _build_response(cache_request, entry)
+
+        wrapper.__signature__ = signature.replace(
+            parameters=[*signature.parameters.values(), request_parameter]
+        )
+        return wrapper
+
+    return decorator
+
+
+def invalidate_response_cache(*tags: ResponseCacheTag) -> None:
+    """Drop the cached responses of `tags`, after a write of their data"""
+    if not _enabled():
+        return
+    try:
+        pipeline = get_redis_client().pipeline()
+        for tag in tags:
+            pipeline.set(_get_tag_key(tag), uuid.uuid4().hex)
+        pipeline.execute()
+    except Exception as ex:
+        # the entries expire after RESPONSE_CACHE_TTL
+        logger.warning(f"Response cache invalidation failed ({ex})")
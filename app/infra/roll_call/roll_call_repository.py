@@ -1,12 +1,21 @@
-from typing import List, Optional
-from app.domain.subject.entity import SubjectInDB, SubjectShortResponse
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from pymongo import ReplaceOne
+
+from app.config.database import get_report_read_preference
+from app.domain.absent.enum import AbsentType
+from app.domain.subject.entity import SubjectShortResponse
 from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.models.subject import SubjectModel
 from app.models.subject_registration import SubjectRegistrationModel
 from app.models.student import StudentModel
 from app.models.subject_evaluation import SubjectEvaluationModel
 from app.models.absent import AbsentModel
+from app.models.roll_call_summary import RollCallSummaryModel
 from app.domain.roll_call.entity import (
+    RollCallBulkResult,
     StudentRollCallResult,
     StudentRollCallResultInStudentResponse,
     StudentRollCallResultInResponse,
@@ -19,43 +28,213 @@ class RollCallRepository:
     def __init__(self):
         pass
 
-    def update_bulk(self, numerical_orders: set[int], subject: SubjectModel, current_season: int):
+    def update_bulk(
+        self, numerical_orders: set[int], subject: SubjectModel, current_season: int
+    ) -> RollCallBulkResult:
         """
         Updates attend_zoom in SubjectRegistrationModel based on numerical_orders
         for a given subject and season.
 
+        Numerical orders are resolved to student ids with one query, then attend_zoom
+        is applied with two update_many calls (True for attended students, False for
+        the rest of the subject's registrations).
+
         Args:
-            numerical_orders (list[int]): List of student numerical orders who attended zoom.
+            numerical_orders (set[int]): Student numerical orders who attended zoom.
             subject (SubjectModel): Subject to update registrations for.
             current_season (int): The current season to filter students.
+
+        Returns:
+            RollCallBulkResult: Counts of matched and updated registrations, and the
+            numerical orders which don't belong to any student of the season.
         """
-        # Find students registered for the subject and in the current season
-        registrations: List[SubjectRegistrationModel] = SubjectRegistrationModel.objects(
-            subject=subject.id,
-            student__in=StudentModel.objects(seasons_info__elemMatch={"season": current_season}),
+        attended_ids: List[ObjectId] = []
+        known_numerical_orders: set[int] = set()
+        if numerical_orders:
+            cursor = StudentModel._get_collection().find(
+                {
+                    "seasons_info": {
+                        "$elemMatch": {
+                            "season": current_season,
+                            "numerical_order": {"$in": list(numerical_orders)},
+                        }
+                    }
+                },
+                {"_id": 1, "seasons_info": 1},
+            )
+            for doc in cursor:
+                attended_ids.append(doc["_id"])
+                known_numerical_orders.update(
+                    info["numerical_order"]
+                    for info in doc.get("seasons_info", [])
+                    if info.get("season") == current_season
+                )
+
+        collection = SubjectRegistrationModel._get_collection()
+        attended = collection.update_many(
+            {"subject": subject.id, "student": {"$in": attended_ids}},
+            {"$set": {"attend_zoom": True}},
         )
+        not_attended = collection.update_many(
+            {"subject": subject.id, "student": {"$nin": attended_ids}},
+            {"$set": {"attend_zoom": False}},
+        )
+
+        subject.status = StatusSubjectEnum.COMPLETED
+        subject.save()
+        invalidate_response_cache(ResponseCacheTag.SUBJECT)
+
+        self.refresh_summaries(
+            season=current_season,
+            student_ids=collection.distinct("student", {"subject": subject.id}),
+        )
+
+        # Note: a numerical_order of a student who didn't register the subject is skipped,
+        # as we only update existing registrations
+        return RollCallBulkResult(
+            matched=attended.matched_count,
+            updated=attended.modified_count + not_attended.modified_count,
+            unknown_numerical_orders=sorted(numerical_orders - known_numerical_orders),
+        )
+
+    def _get_roll_call_states(
+        self,
+        subject_ids: List[ObjectId],
+        student_ids: Optional[List[ObjectId]] = None,
+    ) -> Dict[Tuple[ObjectId, ObjectId], SubjectRollCallResult]:
+        """
+        Load registrations, evaluations and absents of the given subjects with one `$in`
+        query per collection and join them in memory.
+
+        Args:
+            subject_ids (List[ObjectId]): Subjects to compute results for.
+            student_ids (Optional[List[ObjectId]]): Restrict to these students, all if None.
 
-        # Update attend_zoom for each registration
-        for registration in registrations:
-            registration.update(attend_zoom=False)
+        Returns:
+            Dict[Tuple[ObjectId, ObjectId], SubjectRollCallResult]: Results keyed by
+            (student_id, subject_id), only for registered pairs.
+        """
+        conditions: Dict[str, Any] = {"subject": {"$in": subject_ids}}
+        if student_ids is not None:
+            conditions["student"] = {"$in": student_ids}
+        projection = {"_id": 0, "student": 1, "subject": 1}
+
+        evaluated = {
+            (doc["student"], doc["subject"])
+            for doc in SubjectEvaluationModel._get_collection().find(conditions, projection)
+        }
+        absent_types = {
+            (doc["student"], doc["subject"]): doc.get("type", AbsentType.NO_ATTEND)
+            for doc in AbsentModel._get_collection().find(
+                {**conditions, "status": True}, {**projection, "type": 1}
+            )
+        }
+
+        states = {}
+        for doc in SubjectRegistrationModel._get_collection().find(
+            conditions, {**projection, "attend_zoom": 1}
+        ):
+            key = (doc["student"], doc["subject"])
+            states[key] = SubjectRollCallResult(
+                attend_zoom=bool(doc.get("attend_zoom")),
+                evaluation=key in evaluated,
+                absent_type=absent_types.get(key),
+                result=None,  # Will be computed by the property
+            )
+        return states
 
-            student: StudentModel = registration.student
-            # Find the season info for the current season
-            season_info = next(
-                (info for info in student.seasons_info if info.season == current_season), None
+    def _get_completed_subject_ids(self, season: int) -> List[ObjectId]:
+        return [
+            doc["_id"]
+            for doc in SubjectModel._get_collection().find(
+                {"status": StatusSubjectEnum.COMPLETED, "season": season}, {"_id": 1}
             )
+        ]
 
-            if season_info:
-                # Set attend_zoom to True if student's numerical_order
-                # is in numerical_orders, else False
-                attend_zoom = season_info.numerical_order in numerical_orders
-                registration.update(attend_zoom=attend_zoom)
+    def refresh_summaries(
+        self, season: int, student_ids: Optional[List[ObjectId]] = None
+    ) -> Dict[ObjectId, dict]:
+        """
+        Recompute the materialized RollCallSummary documents of the given students from
+        registrations, evaluations and absents. Without student_ids, every student of the
+        season is rebuilt and summaries of students no longer in the season are removed.
 
-        subject.status = StatusSubjectEnum.COMPLETED
-        subject.save()
+        Args:
+            season (int): The season to compute summaries for.
+            student_ids (Optional[List[ObjectId]]): Students to refresh, all if None.
 
-        # Note: If a numerical_order in numerical_orders doesn't exist in registrations,
-        # it is automatically skipped as we only process existing registrations
+        Returns:
+            Dict[ObjectId, dict]: The written summary documents keyed by student id.
+        """
+        full_rebuild = student_ids is None
+        if full_rebuild:
+            student_ids = [
+                doc["_id"]
+                for doc in StudentModel._get_collection().find(
+                    {"seasons_info.season": season}, {"_id": 1}
+                )
+            ]
+
+        completed_subject_ids = self._get_completed_subject_ids(season)
+        states = (
+            self._get_roll_call_states(
+                subject_ids=completed_subject_ids,
+                student_ids=None if full_rebuild else student_ids,
+            )
+            if completed_subject_ids and student_ids
+            else {}
+        )
+
+        now = datetime.now(timezone.utc)
+        summaries = {}
+        for student_id in student_ids:
+            subjects = [
+                {"subject": subject_id, **states[(student_id, subject_id)].model_dump(mode="json")}
+                for subject_id in completed_subject_ids
+                if (student_id, subject_id) in states
+            ]
+            summaries[student_id] = {
+                "_cls": RollCallSummaryModel._class_name,
+                "student": student_id,
+                "season": season,
+                "subjects": subjects,
+                "subject_completed": sum(doc["result"] == "completed" for doc in subjects),
+                "subject_not_completed": sum(doc["result"] == "no_complete" for doc in subjects),
+                "subject_registered": len(subjects),
+                "updated_at": now,
+            }
+
+        collection = RollCallSummaryModel._get_collection()
+        if summaries:
+            collection.bulk_write(
+                [
+                    ReplaceOne({"student": student_id, "season": season}, doc, upsert=True)
+                    for student_id, doc in summaries.items()
+                ],
+                ordered=False,
+            )
+        if full_rebuild:
+            collection.delete_many({"season": season, "student": {"$nin": student_ids}})
+        return summaries
+
+    def delete_summaries(self, student_id: ObjectId) -> None:
+        RollCallSummaryModel._get_collection().delete_many({"student": student_id})
+
+    def _get_subject_results(
+        self, summary: dict, subject_ids: List[ObjectId]
+    ) -> Dict[ObjectId, SubjectRollCallResult]:
+        """Subject results of a summary document, ordered as subject_ids"""
+        states = {doc["subject"]: doc for doc in summary.get("subjects", [])}
+        return {
+            subject_id: SubjectRollCallResult(
+                attend_zoom=states[subject_id]["attend_zoom"],
+                evaluation=states[subject_id]["evaluation"],
+                absent_type=states[subject_id].get("absent_type"),
+                result=None,  # Will be computed by the property
+            )
+            for subject_id in subject_ids
+            if subject_id in states
+        }
 
     def get_roll_call_results(
         self,
@@ -66,14 +245,24 @@ class RollCallRepository:
         sort: Optional[dict[str, int]] = None,
     ) -> StudentRollCallResultInResponse:
         """
-        Get roll call results for completed subjects.
+        Get roll call results for completed subjects from the materialized RollCallSummary.
+        The summary of each subject is computed over the whole season, not only the page.
         """
         # Get completed subjects
-        completed_subjects = SubjectModel.objects(status=StatusSubjectEnum.COMPLETED, season=season)
-        if not completed_subjects:
+        completed_subject_ids = self._get_completed_subject_ids(season)
+        if not completed_subject_ids:
             return []
 
-        # Get students based on match pipeline
+        # The summary counts every student of the season: materialize the summaries which are
+        # not built yet (e.g. before the first rebuild) for the whole season, not the page
+        summary_count = RollCallSummaryModel._get_collection().count_documents({"season": season})
+        student_count = StudentModel._get_collection().count_documents(
+            {"seasons_info.season": season}
+        )
+        if summary_count < student_count:
+            self.refresh_summaries(season=season)
+
+        # Get students based on match pipeline, joined with their roll call summaries
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
@@ -87,71 +276,74 @@ class RollCallRepository:
                     {"$limit": page_size},
                 ]
             )
+        pipeline.append(
+            {
+                "$lookup": {
+                    "from": RollCallSummaryModel._get_collection_name(),
+                    "localField": "_id",
+                    "foreignField": "student",
+                    "as": "roll_call_summaries",
+                }
+            }
+        )
 
-        students = StudentModel.objects().aggregate(pipeline)
-        if not students:
-            return []
+        students = list(
+            StudentModel.objects().read_preference(get_report_read_preference()).aggregate(pipeline)
+        )
 
-        # Process each student
-        results = []
-        total = 0
+        summaries = {}
+        missing_student_ids = []
+        for student in students:
+            summary = next(
+                (doc for doc in student.pop("roll_call_summaries") if doc["season"] == season),
+                None,
+            )
+            if summary is None:
+                missing_student_ids.append(student["_id"])
+            else:
+                summaries[student["_id"]] = summary
+        # Materialize summaries which are not built yet
+        if missing_student_ids:
+            summaries.update(self.refresh_summaries(season=season, student_ids=missing_student_ids))
 
         summary = {}
-        for subject in completed_subjects:
-            summary[str(subject.id)] = {
+        for subject_id in completed_subject_ids:
+            summary[str(subject_id)] = {
                 "absent": 0,
                 "completed": 0,
                 "no_complete": 0,
             }
+        cursor = (
+            RollCallSummaryModel.objects()
+            .read_preference(get_report_read_preference())
+            .aggregate(
+                [
+                    {"$match": {"season": season}},
+                    {"$unwind": "$subjects"},
+                    {
+                        "$group": {
+                            "_id": {"subject": "$subjects.subject", "result": "$subjects.result"},
+                            "count": {"$sum": 1},
+                        }
+                    },
+                ]
+            )
+        )
+        for record in cursor:
+            subject_id = str(record["_id"]["subject"])
+            if subject_id not in summary:
+                continue
+            result = record["_id"]["result"]
+            if result not in ["completed", "no_complete"]:
+                result = "absent"
+            summary[subject_id][result] += record["count"]
 
+        results = []
         for student in students:
             student_model = StudentModel.from_mongo(student)
-            total += 1
-            subject_completed = 0
-            subject_not_completed = 0
-            subject_registered = 0
-            # Get student's subject registrations
-            subject_results = {}
-            for subject in completed_subjects:
-                # Check registration
-                registration = SubjectRegistrationModel.objects(
-                    student=student_model.id, subject=subject.id
-                ).first()
-
-                if not registration:
-                    continue
-
-                subject_registered += 1
-                # Check evaluation
-                evaluation = SubjectEvaluationModel.objects(
-                    student=student_model.id, subject=subject.id
-                ).first()
-
-                # Check absent
-                absent = AbsentModel.objects(
-                    student=student_model.id, subject=subject.id, status=True
-                ).first()
-
-                # Ensure attend_zoom is a boolean
-                attend_zoom = False
-                if registration and hasattr(registration, "attend_zoom"):
-                    attend_zoom = bool(registration.attend_zoom)
-
-                subject_results[str(subject.id)] = SubjectRollCallResult(
-                    attend_zoom=attend_zoom,
-                    evaluation=bool(evaluation),
-                    absent_type=absent.type if absent else None,
-                    result=None,  # Will be computed by the property
-                )
-                if subject_results[str(subject.id)].result == "completed":
-                    subject_completed += 1
-                    summary[str(subject.id)]["completed"] += 1
-                elif subject_results[str(subject.id)].result == "no_complete":
-                    subject_not_completed += 1
-                    summary[str(subject.id)]["no_complete"] += 1
-                else:
-                    summary[str(subject.id)]["absent"] += 1
-
+            subject_results = self._get_subject_results(
+                summaries[student_model.id], completed_subject_ids
+            )
             results.append(
                 StudentRollCallResult(
                     id=str(student_model.id),
@@ -160,10 +352,14 @@ class RollCallRepository:
                     ),
                     holy_name=student_model.holy_name,
                     full_name=student_model.full_name,
-                    subjects=subject_results,
-                    subject_completed=subject_completed,
-                    subject_not_completed=subject_not_completed,
-                    subject_registered=subject_registered,
+                    subjects={str(id): result for id, result in subject_results.items()},
+                    subject_completed=sum(
+                        result.result == "completed" for result in subject_results.values()
+                    ),
+                    subject_not_completed=sum(
+                        result.result == "no_complete" for result in subject_results.values()
+                    ),
+                    subject_registered=len(subject_results),
                 )
             )
 
@@ -178,73 +374,47 @@ class RollCallRepository:
         season: int,
     ) -> StudentRollCallResultInStudentResponse:
         """
-        Get roll call results for a single student.
+        Get roll call results for a single student from the materialized RollCallSummary.
         """
         # Get completed subjects
-        completed_subjects = SubjectModel.objects.filter(
-            status=StatusSubjectEnum.COMPLETED, season=season
-        ).order_by("-start_at")
+        completed_subjects = list(
+            SubjectModel._get_collection()
+            .find(
+                {"status": StatusSubjectEnum.COMPLETED, "season": season},
+                {"_id": 1, "title": 1, "code": 1},
+            )
+            .sort("start_at", -1)
+        )
         if not completed_subjects:
             return None
 
-        # Get student
-        student = StudentModel.objects(id=student_id).first()
-        if not student:
-            return None
-        # Process student
-        subject_completed = 0
-        subject_not_completed = 0
-        subject_registered = 0
-        subject_results: list[SubjectRollCallResultInStudent] = []
-
-        for subject in completed_subjects:
-            # Check registration
-            registration = SubjectRegistrationModel.objects(
-                student=student.id, subject=subject.id
-            ).first()
-
-            if not registration:
-                continue
-
-            subject_registered += 1
-
-            # Check evaluation
-            evaluation = SubjectEvaluationModel.objects(
-                student=student.id, subject=subject.id
-            ).first()
-
-            # Check absent
-            absent = AbsentModel.objects(
-                student=student.id, subject=subject.id, status=True
-            ).first()
-
-            # Ensure attend_zoom is a boolean
-            attend_zoom = False
-            if registration and hasattr(registration, "attend_zoom"):
-                attend_zoom = bool(registration.attend_zoom)
-
-            subject_results.append(
-                SubjectRollCallResultInStudent(
-                    subject=SubjectShortResponse(
-                        **SubjectInDB.model_validate(subject).model_dump(
-                            exclude=({"lecturer", "attachments"})
-                        ),
-                    ),
-                    attend_zoom=attend_zoom,
-                    evaluation=bool(evaluation),
-                    absent_type=absent.type if absent else None,
-                    result=None,  # Will be computed by the property
-                )
+        student_id = ObjectId(student_id)
+        summary = RollCallSummaryModel._get_collection().find_one(
+            {"student": student_id, "season": season}
+        )
+        if summary is None:
+            # Get student
+            if not StudentModel._get_collection().find_one({"_id": student_id}, {"_id": 1}):
+                return None
+            summary = self.refresh_summaries(season=season, student_ids=[student_id])[student_id]
+
+        subject_results = self._get_subject_results(
+            summary, [subject["_id"] for subject in completed_subjects]
+        )
+        subjects: list[SubjectRollCallResultInStudent] = [
+            SubjectRollCallResultInStudent(
+                subject=SubjectShortResponse(
+                    id=str(subject["_id"]), title=subject["title"], code=subject["code"]
+                ),
+                **subject_results[subject["_id"]].model_dump(),
             )
-
-            if subject_results[-1].result == "completed":
-                subject_completed += 1
-            elif subject_results[-1].result == "no_complete":
-                subject_not_completed += 1
+            for subject in completed_subjects
+            if subject["_id"] in subject_results
+        ]
 
         return StudentRollCallResultInStudentResponse(
-            subjects=subject_results,
-            subject_completed=subject_completed,
-            subject_not_completed=subject_not_completed,
-            subject_registered=subject_registered,
+            subjects=subjects,
+            subject_completed=sum(result.result == "completed" for result in subjects),
+            subject_not_completed=sum(result.result == "no_complete" for result in subjects),
+            subject_registered=len(subjects),
         )
@@ -7,6 +7,7 @@ import pymongo
 from fastapi import HTTPException
 
 from app.models.season import SeasonModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.season.entity import SeasonInDB, SeasonInUpdate, SeasonInUpdateTime
 
 from pymongo.client_session import ClientSession
@@ -29,6 +30,7 @@ class SeasonRepository:
         # create season instance
         new_doc = SeasonModel(**season.model_dump()).save(session=session)
         # and save it to db
+        invalidate_response_cache(ResponseCacheTag.SEASON)
         return new_doc
 
     def get_by_id(self, season_id: Union[str, ObjectId]) -> Optional[SeasonModel]:
@@ -52,6 +54,7 @@ class SeasonRepository:
                 data.model_dump(exclude_none=True) if isinstance(data, SeasonInUpdateTime) else data
             )
             SeasonModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.SEASON)
             return True
         except Exception:
             return False
@@ -103,6 +106,7 @@ class SeasonRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             SeasonModel.objects(id=id).delete()
+            invalidate_response_cache(ResponseCacheTag.SEASON)
             return True
         except Exception:
             return False
@@ -139,6 +143,7 @@ class SeasonRepository:
             for season in entities
         ]
         SeasonModel._get_collection().bulk_write(operations, session=session)
+        invalidate_response_cache(ResponseCacheTag.SEASON)
         return True
 
     def find_one(self, conditions: Dict[str, Union[str, bool, ObjectId]]) -> Optional[SeasonModel]:
@@ -0,0 +1,117 @@
+"""bcrypt hashing out of the request threads
+
+A bcrypt hash costs about 250 ms of CPU and holds the GIL, so a burst of logins hashing in
+the request threads pins every worker of the thread pool and stalls the other endpoints.
+Hashes run on a bounded pool of processes instead, and when too many are already pending
+new ones are rejected at once (PasswordHasherBusy) rather than queued for seconds.
+The module only imports passlib and the settings, it is what the spawned processes of the
+pool load.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from passlib.context import CryptContext
+
+from app.config import settings
+
+T = TypeVar("T")
+
+# min = max = default rounds: hashes of another cost need an update (rehashed at login)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_pending = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+class PasswordHasherBusy(Exception):
+    """Too many hashes are pending, the caller should retry later"""
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return pwd_context.verify(password, hashed)
+
+
+def _verify_and_update(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(password, hashed)
+
+
+def _pool_enabled() -> bool:
+    return settings.PASSWORD_HASH_WORKERS > 0
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: forking a process running threads (uvicorn, mongo pools) is unsafe
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _run(func: Callable[..., T], *args) -> T:
+    if not _pending.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        if not _pool_enabled():
+            return func(*args)
+        return _get_executor().submit(func, *args).result()
+    finally:
+        _pending.release()
+
+
+def hash_password(password: str) -> str:
+    """
+    Raises:
+        PasswordHasherBusy: too many hashes are pending
+    """
+    return _run(_hash, password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    """
+    Raises:
+        PasswordHasherBusy: too many hashes are pending
+    """
+    return _run(_verify, password, hashed)
+
+
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    """Verify `password`, and give its new hash when `hashed` is not of the configured cost
+
+    Raises:
+        PasswordHasherBusy: too many hashes are pending
+    """
+    return _run(_verify_and_update, password, hashed)
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash `passwords` (bulk imports), in the same order
+
+    Batches are not limited by PASSWORD_HASH_MAX_PENDING, but they are submitted a few at a
+    time so that the hashes of logins are not queued behind a whole import.
+    """
+    if len(passwords) < 2 or not _pool_enabled():
+        return [_hash(password) for password in passwords]
+
+    hashes = []
+    size = settings.PASSWORD_HASH_WORKERS
+    for i in range(0, len(passwords), size):
+        hashes.extend(_get_executor().map(_hash, passwords[i : i + size]))
+    return hashes
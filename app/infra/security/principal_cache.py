@@ -0,0 +1,140 @@
+import logging
+from threading import Lock
+from typing import Any, NamedTuple, Optional, Set, Union
+
+from bson import ObjectId, json_util
+from cachetools import TTLCache
+
+from app.config import settings
+from app.config.redis import get_redis_client
+from app.infra.invalidation_listener import InvalidationListener
+
+logger = logging.getLogger(__name__)
+
+
+class Principal(NamedTuple):
+    """An authenticated user: the raw Mongo document and its validated entity."""
+
+    document: dict
+    entity: Any
+
+
+class PrincipalCache:
+    """Short lived cache of authenticated admins/students keyed by email.
+
+    The first tier lives in the process, the second one (optional) in Redis and only holds
+    the raw document, so that a cache hit needs neither a Mongo round-trip nor a validation.
+    Entries are dropped on every write of the account (see `invalidate`), in the memory of
+    every process: the invalidations are published on a Redis channel, which a thread of
+    each process listens to. When Redis is unreachable, the other processes keep the
+    account for at most AUTH_PRINCIPAL_CACHE_TTL seconds.
+    """
+
+    def __init__(self, kind: str, maxsize: int = 4096):
+        self.kind = kind
+        self.ttl = settings.AUTH_PRINCIPAL_CACHE_TTL
+        self.enabled = self.ttl > 0
+        self._principals: TTLCache = TTLCache(maxsize=maxsize, ttl=max(self.ttl, 1))
+        self._emails: TTLCache = TTLCache(maxsize=maxsize, ttl=max(self.ttl, 1))
+        self._lock = Lock()
+        self._listener = InvalidationListener(
+            self.channel,
+            on_message=self._on_invalidation,
+            on_reset=self.clear,
+            name=f"principal-{kind}-listener",
+        )
+
+    @property
+    def use_redis(self) -> bool:
+        return self.enabled and settings.AUTH_PRINCIPAL_CACHE_REDIS
+
+    def _redis_key(self, email: str) -> str:
+        return f"principal:{self.kind}:{email}"
+
+    def _redis_id_key(self, id: str) -> str:
+        return f"principal:{self.kind}:id:{id}"
+
+    @property
+    def channel(self) -> str:
+        return f"principal:{self.kind}:invalidate"
+
+    def get(self, email: str) -> Optional[Principal]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._principals.get(email)
+
+    def get_document(self, email: str) -> Optional[dict]:
+        """Raw document from the Redis tier, cached by another process."""
+        if not self.use_redis:
+            return None
+        raw = get_redis_client().get(self._redis_key(email))
+        return json_util.loads(raw) if raw else None
+
+    def set(self, email: str, principal: Principal, share: bool = True):
+        if not self.enabled:
+            return
+        self._listener.start()
+        id = str(principal.document["_id"])
+        with self._lock:
+            self._principals[email] = principal
+            self._emails[id] = email
+        if share and self.use_redis:
+            redis_client = get_redis_client()
+            redis_client.setex(
+                self._redis_key(email), self.ttl, json_util.dumps(principal.document)
+            )
+            redis_client.setex(self._redis_id_key(id), self.ttl, email)
+
+    def invalidate(self, id: Union[str, ObjectId, None] = None, email: Optional[str] = None):
+        """Drop the account cached under `email` and under the email it was cached with (found
+        by `id`), e.g. its former email after a change of email"""
+        if not self.enabled or not (id or email):
+            return
+        id = str(id) if id else None
+        emails = self._drop(id, email)
+        if self.use_redis:
+            redis_client = get_redis_client()
+            if id:
+                cached_email = redis_client.get(self._redis_id_key(id))
+                if cached_email:
+                    emails.add(
+                        cached_email.decode() if isinstance(cached_email, bytes) else cached_email
+                    )
+            redis_client.delete(
+                *[self._redis_key(email) for email in emails],
+                *([self._redis_id_key(id)] if id else []),
+            )
+        try:
+            get_redis_client().publish(self.channel, json_util.dumps({"id": id, "email": email}))
+        except Exception as ex:
+            logger.warning(f"Cannot publish the invalidation of {email or id}: {ex}")
+
+    def _drop(self, id: Optional[str], email: Optional[str]) -> Set[str]:
+        """Drop the account from the memory of this process
+
+        :return: the emails dropped, `email` and the one cached for `id`
+        """
+        emails = {email} if email else set()
+        with self._lock:
+            if id:
+                cached_email = self._emails.pop(id, None)
+                if cached_email:
+                    emails.add(cached_email)
+            for email in emails:
+                self._principals.pop(email, None)
+        return emails
+
+    def _on_invalidation(self, data: bytes) -> None:
+        """An account written by another process"""
+        data = json_util.loads(data)
+        self._drop(data["id"], data["email"])
+
+    def clear(self):
+        with self._lock:
+            self._principals.clear()
+            self._emails.clear()
+
+
+admin_principal_cache = PrincipalCache("admin")
+student_principal_cache = PrincipalCache("student")
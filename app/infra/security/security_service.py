@@ -6,20 +6,26 @@ from typing import Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from mongoengine import Document
 
 from app.config import settings
 from app.domain.admin.entity import AdminInDB
 from app.domain.auth.entity import TokenData
 from app.domain.shared.enum import AdminRole
 from app.infra.admin.admin_repository import AdminRepository
+from app.infra.security import password_hasher
+from app.infra.security.principal_cache import (
+    Principal,
+    PrincipalCache,
+    admin_principal_cache,
+    student_principal_cache,
+)
 from app.models.admin import AdminModel
 from app.shared.common_exception import forbidden_exception
 from app.infra.student.student_repository import StudentRepository
 from app.models.student import StudentModel
 from app.domain.student.entity import StudentInDB
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme_student = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/student/auth/login", scheme_name="Student Oauth2"
 )
@@ -33,9 +39,26 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+password_hasher_busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Hệ thống đang bận, vui lòng thử lại sau.",
+    headers={"Retry-After": "1"},
+)
+
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_hasher.verify_password(plain_password, hashed_password)
+    except password_hasher.PasswordHasherBusy:
+        raise password_hasher_busy_exception
+
+
+def verify_and_update_password(plain_password, hashed_password) -> tuple[bool, Optional[str]]:
+    """Verify the password, with its new hash when the bcrypt cost of the settings changed"""
+    try:
+        return password_hasher.verify_and_update_password(plain_password, hashed_password)
+    except password_hasher.PasswordHasherBusy:
+        raise password_hasher_busy_exception
 
 
 def verify_token(token: str) -> Optional[TokenData]:
@@ -51,63 +74,110 @@ def verify_token(token: str) -> Optional[TokenData]:
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    try:
+        return password_hasher.hash_password(password)
+    except password_hasher.PasswordHasherBusy:
+        raise password_hasher_busy_exception
+
+
+def _get_principal(
+    email: str, cache: PrincipalCache, model, entity, get_by_email
+) -> tuple[Document, Principal]:
+    """Return a fresh document of the user (never shared between requests) and its
+    validated entity, from the principal cache when possible."""
+    principal: Principal | None = cache.get(email)
+    if principal is not None:
+        return model._from_son(principal.document), principal
+
+    document = cache.get_document(email)
+    if document is not None:
+        user = model._from_son(document)
+        principal = Principal(document=document, entity=entity.model_validate(user))
+        cache.set(email, principal, share=False)
+        return user, principal
+
+    user = get_by_email(email=email)
+    if user is None:
+        raise credentials_exception
+    principal = Principal(document=user.to_mongo().to_dict(), entity=entity.model_validate(user))
+    cache.set(email, principal)
+    return user, principal
 
 
-def _get_current_admin(
+def _get_current_admin_principal(
     token: str = Depends(oauth2_scheme_admin),
     admin_repository: AdminRepository = Depends(AdminRepository),
-) -> AdminModel:
+) -> tuple[AdminModel, Principal]:
     token_data = verify_token(token=token)
-    admin: AdminModel = admin_repository.get_by_email(email=token_data.email)
-    if admin is None:
-        raise credentials_exception
+    return _get_principal(
+        email=token_data.email,
+        cache=admin_principal_cache,
+        model=AdminModel,
+        entity=AdminInDB,
+        get_by_email=admin_repository.get_by_email,
+    )
+
+
+def _get_current_admin(
+    current: tuple[AdminModel, Principal] = Depends(_get_current_admin_principal),
+) -> AdminModel:
+    admin, _ = current
     return admin
 
 
 def get_current_active_admin(
-    admin: AdminModel = Depends(_get_current_admin),
+    current: tuple[AdminModel, Principal] = Depends(_get_current_admin_principal),
 ) -> AdminModel:
-    current_user = AdminInDB.model_validate(admin)
-    if not current_user.active():
+    admin, principal = current
+    if not principal.entity.active():
         raise forbidden_exception
     return admin
 
 
 def get_current_admin(
-    admin: AdminModel = Depends(_get_current_admin),
+    current: tuple[AdminModel, Principal] = Depends(_get_current_admin_principal),
 ) -> AdminModel:
-    current_user = AdminInDB.model_validate(admin)
-    if current_user.disabled():
+    admin, principal = current
+    if principal.entity.disabled():
         raise HTTPException(status_code=403, detail="Tài khoản của bạn đã bị khóa")
     return admin
 
 
-def _get_current_student(
+def _get_current_student_principal(
     token: str = Depends(oauth2_scheme_student),
     student_repository: StudentRepository = Depends(StudentRepository),
-) -> StudentModel:
+) -> tuple[StudentModel, Principal]:
     token_data = verify_token(token=token)
-    student: StudentModel = student_repository.get_by_email(email=token_data.email)
-    if student is None:
-        raise credentials_exception
+    return _get_principal(
+        email=token_data.email,
+        cache=student_principal_cache,
+        model=StudentModel,
+        entity=StudentInDB,
+        get_by_email=student_repository.get_by_email,
+    )
+
+
+def _get_current_student(
+    current: tuple[StudentModel, Principal] = Depends(_get_current_student_principal),
+) -> StudentModel:
+    student, _ = current
     return student
 
 
 def get_current_active_student(
-    student: StudentModel = Depends(_get_current_student),
+    current: tuple[StudentModel, Principal] = Depends(_get_current_student_principal),
 ) -> StudentModel:
-    current_user = StudentInDB.model_validate(student)
-    if not current_user.active():
+    student, principal = current
+    if not principal.entity.active():
         raise forbidden_exception
     return student
 
 
 def get_current_student(
-    student: StudentModel = Depends(_get_current_student),
+    current: tuple[StudentModel, Principal] = Depends(_get_current_student_principal),
 ) -> StudentModel:
-    current_user = StudentInDB.model_validate(student)
-    if current_user.disabled():
+    student, principal = current
+    if principal.entity.disabled():
         raise HTTPException(status_code=403, detail="Tài khoản của bạn đã bị khóa")
     return student
 
@@ -139,10 +209,9 @@ def authorization(admin: AdminModel, roles: list[AdminRole], require_active: boo
     Raises:
         forbidden_exception: _description_
     """
-    admin_in_db: AdminInDB = AdminInDB.model_validate(admin)
-    if not any(role in admin.roles for role in roles) or (
-        require_active and not admin_in_db.active()
-    ):
+    if not any(role in admin.roles for role in roles):
+        raise forbidden_exception
+    if require_active and not AdminInDB.model_validate(admin).active():
         raise forbidden_exception
 
 
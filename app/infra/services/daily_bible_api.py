@@ -0,0 +1,101 @@
+"""Client of the mass reading API of ktcgkpv.org"""
+
+import re
+from datetime import date
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.domain.daily_bible.entity import DailyBibleResponse
+from app.domain.daily_bible.enum import LiturgicalSeason
+
+URL = "https://ktcgkpv.org/readings/mass-reading"
+HEADERS = {
+    "X-Requested-With": "XMLHttpRequest",
+    "Content-Type": "text/plain",
+}
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 10)
+RETRIES = 2
+BACKOFF_FACTOR = 0.5
+# worst case of `fetch`: every attempt times out, with the backoffs between the retries
+MAX_FETCH_SECONDS = (RETRIES + 1) * sum(TIMEOUT) + sum(
+    BACKOFF_FACTOR * 2**retry for retry in range(RETRIES)
+)
+
+# Fallback patterns of special days (no "gospel" entries, only an html "special_content")
+EPITOMIZE_PATTERN = re.compile(
+    r'<div class="gospel reading division">.*?'
+    r'<div class="division-header"><span>Tin Mừng</span></div>.*?'
+    r'<p class="gospel\[epitomize\] epitomize">([^<]+)</p>',
+    re.DOTALL,
+)
+REFERENCE_PATTERN = re.compile(
+    r'<div class="gospel reading division">.*?'
+    r'<div class="division-header"><span>Tin Mừng</span></div>.*?'
+    r'<div class="gospel\[indexing\] right-indexing sel-transparent dropdown">.*?'
+    r'<span class="btn dropdown-toggle" data-toggle="dropdown">([^<]+)\s*'
+    r'<i class="fa fa-caret-down"[^>]*></i></span>',
+    re.DOTALL,
+)
+
+# Connections are kept alive and shared by every request of the process
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+        ),
+    ),
+)
+
+
+class DailyBibleAPIService:
+    def fetch(self, day: Optional[date] = None) -> requests.Response:
+        """Mass reading of the given day, default to today (time zone of the upstream)"""
+        payload = f"seldate={day.isoformat()}" if day else "seldate="
+        return _session.post(URL, headers=HEADERS, data=payload, timeout=TIMEOUT)
+
+    def parse(self, data: dict) -> DailyBibleResponse:
+        """Extract the gospel of the response
+
+        Raises:
+            KeyError, ValueError, IndexError: invalid response format
+        """
+        resp = data["data"]["mass_reading"][0]
+
+        season_key = resp["date_info"]["season"]
+        season_value = LiturgicalSeason[season_key].value  # Map key to value
+
+        try:
+            return DailyBibleResponse(
+                epitomize_text=resp["gospel"][0]["INDEXING"],
+                gospel_ref=resp["gospel"][0]["EPITOMIZE"],
+                season=season_value,
+            )
+        except IndexError as e:
+            if "special_content" not in resp:
+                raise e
+
+        epitomize_match = EPITOMIZE_PATTERN.search(resp["special_content"])
+        epitomize_text = (
+            epitomize_match.group(1).strip().strip("&nbsp;") if epitomize_match else None
+        )
+        # Find reference text
+        reference_match = REFERENCE_PATTERN.search(resp["special_content"])
+        reference_text = (
+            reference_match.group(1).strip().strip("&nbsp;") if reference_match else None
+        )
+        return DailyBibleResponse(
+            epitomize_text=reference_text,
+            gospel_ref=epitomize_text,
+            season=season_value,
+        )
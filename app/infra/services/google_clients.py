@@ -0,0 +1,76 @@
+"""Process wide Google API clients
+
+Credentials are loaded once and refreshed in one place for the whole process. Discovery
+resources are built from the documents shipped with google-api-python-client
+(static_discovery), once per thread: a Resource wraps an httplib2.Http, which is not
+thread safe, so each thread of the pool gets its own authorized http.
+"""
+
+import functools
+import threading
+
+import google.auth
+from fastapi import HTTPException, status
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import Resource, build
+
+from app.config import settings
+from app.infra.services.rate_limiter import RateLimitBucket, RateLimitExceeded, rate_limited
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive",
+    "https://www.googleapis.com/auth/drive.file",
+]
+
+google_busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Hệ thống đang bận, vui lòng thử lại sau.",
+    headers={"Retry-After": str(settings.RATE_LIMIT_MAX_WAIT_SECONDS)},
+)
+
+_credentials: Credentials | None = None
+_credentials_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_credentials() -> Credentials:
+    """Service account credentials of the process, refreshed when expired"""
+    global _credentials
+    with _credentials_lock:
+        if _credentials is None:
+            _credentials, _ = google.auth.load_credentials_from_file(
+                settings.KEY_PATH_GCLOUD, scopes=SCOPES
+            )
+        if not _credentials.valid:
+            _credentials.refresh(Request())
+        return _credentials
+
+
+def get_service(name: str, version: str, credentials: Credentials) -> Resource:
+    """Discovery resource of the current thread"""
+    services: dict = _local.__dict__.setdefault("services", {})
+    cached = services.get((name, version))
+    if cached is None or cached[0] is not credentials:
+        resource = build(
+            name, version, credentials=credentials, static_discovery=True, cache_discovery=False
+        )
+        cached = services[(name, version)] = (credentials, resource)
+    return cached[1]
+
+
+def google_rate_limited(func):
+    """Take a slot of the Google bucket before each call, a 503 when a request would wait
+    longer than RATE_LIMIT_MAX_WAIT_SECONDS"""
+    limited = rate_limited(RateLimitBucket.GOOGLE)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return limited(*args, **kwargs)
+        except RateLimitExceeded:
+            raise google_busy_exception
+
+    return wrapper
@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, BackgroundTasks
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from app.infra.services.google_clients import get_service, google_rate_limited
 from app.infra.services.google_drive_api import GoogleDriveAPIService
 import logging
 from app.domain.upload.enum import RolePermissionGoogleEnum, TypePermissionGoogleEnum
@@ -17,8 +17,12 @@ class GoogleDocumentAPIService:
     ):
         self.google_drive_api_service = google_drive_api_service
         self.background_tasks = background_tasks
-        self.service = build("docs", "v1", credentials=self.google_drive_api_service._creds)
 
+    @property
+    def service(self):
+        return get_service("docs", "v1", credentials=self.google_drive_api_service._creds)
+
+    @google_rate_limited
     def create(self, name: str, email_owner: str):
         try:
             document_meta = {"title": name}
@@ -1,7 +1,6 @@
 from typing import Optional
 
-import google.auth
-from googleapiclient.discovery import build
+from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseUpload
 import io
@@ -11,29 +10,28 @@ import logging
 from app.config import settings
 from app.domain.upload.entity import AddPermissionDriveFile, GoogleDriveAPIRes
 from app.domain.upload.enum import RolePermissionGoogleEnum, TypePermissionGoogleEnum
+from app.infra.services.google_clients import (
+    get_credentials,
+    get_service,
+    google_rate_limited,
+)
 
 logger = logging.getLogger(__name__)
 
 
-SCOPES = [
-    "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/documents",
-    "https://www.googleapis.com/auth/drive",
-    "https://www.googleapis.com/auth/drive.file",
-]
-
-
 class GoogleDriveAPIService:
-    def __init__(self):
-        self._creds = self._get_oauth_token()
-        self.service = build("drive", "v3", credentials=self._creds)
+    @property
+    def _creds(self):
+        return self._get_oauth_token()
+
+    @property
+    def service(self) -> Resource:
+        return get_service("drive", "v3", credentials=self._creds)
 
     def _get_oauth_token(self):
         creds = None
         try:
-            creds, _ = google.auth.load_credentials_from_file(
-                settings.KEY_PATH_GCLOUD, scopes=SCOPES
-            )
+            creds = get_credentials()
         except Exception:
             logger.error("Failed to retrieve default credentials gcloud.")
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
@@ -42,6 +40,7 @@ class GoogleDriveAPIService:
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
         return creds
 
+    @google_rate_limited
     def create(
         self, file: UploadFile, name: Optional[str] = None, folder_id: Optional[str] = None
     ) -> GoogleDriveAPIRes:
@@ -81,6 +80,7 @@ class GoogleDriveAPIService:
                 logger.error(f"An error occurred when uploading the file: {error}")
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def delete(self, file_id: str):
         try:
             self.service.files().delete(fileId=file_id).execute()
@@ -95,6 +95,7 @@ class GoogleDriveAPIService:
                 logger.error(f"An error occurred when deleting the file: {error}")
                 raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def update_file_name(self, file_id: str, new_name: str):
         try:
             # Replace "New_File_Name" with the desired new name
@@ -111,6 +112,7 @@ class GoogleDriveAPIService:
                 logger.error(f"An error occurred when deleting the file: {error}")
                 raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def get(self, file_id: str, fields: str = "id,mimeType,name"):
         try:
             res = self.service.files().get(fileId=file_id, fields=fields).execute()
@@ -126,6 +128,7 @@ class GoogleDriveAPIService:
                 logger.error(f"An error occurred when get the file: {error}")
                 raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def change_file_folder_parents(
         self, file_id: str, previous_parents: list[str] | None = None, folder_id: str | None = None
     ):
@@ -148,6 +151,7 @@ class GoogleDriveAPIService:
                 logger.error(f"An error occurred when uploading the file: {error}")
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def add_permission(
         self,
         file_id: str,
@@ -165,6 +169,7 @@ class GoogleDriveAPIService:
             logger.error(f"An error occurred when change permission the file: {error}")
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def add_multi_permissions(self, file_id: str, permissions: list[AddPermissionDriveFile]):
         try:
 
@@ -190,6 +195,7 @@ class GoogleDriveAPIService:
             logger.error(f"An error occurred when change permission the file: {error}")
             raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
 
+    @google_rate_limited
     def duplicate_file(self, source_file_id: str, new_file_name: str):
         try:
             body = {"name": new_file_name}
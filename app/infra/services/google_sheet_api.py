@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, BackgroundTasks
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from app.infra.services.google_clients import get_service, google_rate_limited
 from app.infra.services.google_drive_api import GoogleDriveAPIService
 import logging
 from app.domain.upload.enum import RolePermissionGoogleEnum, TypePermissionGoogleEnum
@@ -18,10 +18,14 @@ class GoogleSheetAPIService:
     ):
         self.google_drive_api_service = google_drive_api_service
         self.background_tasks = background_tasks
-        self.service = build(
+
+    @property
+    def service(self):
+        return get_service(
             "sheets", "v4", credentials=self.google_drive_api_service._creds
         ).spreadsheets()
 
+    @google_rate_limited
     def create(self, name: str, email_owner: str):
         try:
             spreadsheet_meta = {"properties": {"title": name}}
@@ -56,6 +60,7 @@ class GoogleSheetAPIService:
 
         return GoogleDriveAPIRes.model_validate(file_info)
 
+    @google_rate_limited
     def get_data_from_spreadsheet(self, url: str, sheet_name: str) -> list[str]:
         id = extract_id_spreadsheet_from_url(url)
         try:
@@ -105,6 +110,7 @@ class GoogleSheetAPIService:
             logger.error(f"An error occurred: {error}")
             raise HTTPException(status_code=400, detail=f"An error occurred: {error}")
 
+    @google_rate_limited
     def update_cell_text(
         self, spreadsheet_id: str, sheet_name: str, cell_range: str, new_text: str
     ):
@@ -131,6 +137,7 @@ class GoogleSheetAPIService:
         return row, col
 
     # Add a protected range to a sheet
+    @google_rate_limited
     def protect_range(
         self,
         spreadsheet_id: str,
@@ -0,0 +1,180 @@
+"""Rate limits of the outbound calls shared by every process, in Redis
+
+Each provider has a named bucket paced with GCRA (generic cell rate algorithm): the bucket
+only stores the theoretical arrival time (TAT) of the next call, and a call is allowed when
+it is at most `burst` emission intervals ahead of now. The TAT is updated in a WATCH/MULTI
+transaction and the clock is the one of Redis, so workers on several hosts share the pace.
+
+A call over the limit waits for its slot. When the call is the only side effect of its
+celery task (`reschedule=True`) and the wait would be longer than
+RATE_LIMIT_MAX_BLOCK_SECONDS, the task is rescheduled (retry with a countdown) instead of
+holding the worker. Calls made in a loop or after other calls must block: a retry runs the
+whole task again. Calls made outside celery tasks (the request threads) wait at most
+RATE_LIMIT_MAX_WAIT_SECONDS, further slots are not taken and RateLimitExceeded is raised.
+
+Example:
+    @rate_limited(RateLimitBucket.GOOGLE)
+    def get(self, file_id: str):
+        ...
+"""
+
+import functools
+import logging
+import time
+
+from celery import current_task
+from redis import WatchError
+
+from app.config import settings
+from app.config.redis import get_redis_client
+from app.shared.utils.general import ExtendedEnum
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBucket(str, ExtendedEnum):
+    BREVO = "brevo"
+    SMTP = "smtp"
+    GOOGLE = "google"
+
+
+def get_rate_limit_redis_key(bucket: str) -> str:
+    return f"rate_limit:{bucket}"
+
+
+def get_rate_limit_stats_redis_key(bucket: str) -> str:
+    return f"rate_limit:{bucket}:stats"
+
+
+class RateLimitExceeded(Exception):
+    """The slot of a call made outside a celery task is further than RATE_LIMIT_MAX_WAIT_SECONDS"""
+
+
+class RateLimiter:
+    def __init__(self, bucket: str, rate: float, burst: int = 1):
+        """
+        :param bucket: name of the bucket, shared by the processes
+        :param rate: calls per second, 0 disables the limit
+        :param burst: calls allowed at once after an idle time
+        """
+        self.bucket = bucket
+        self.rate = rate
+        self.burst = max(1, burst)
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take the next slot of the bucket
+
+        :param max_wait: do not take a slot further than `max_wait` seconds
+        :return: seconds to wait before the call, None when over `max_wait` (nothing taken)
+        """
+        interval = 1 / self.rate
+        key = get_rate_limit_redis_key(self.bucket)
+        redis_client = get_redis_client()
+        with redis_client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    seconds, microseconds = pipe.time()
+                    now = seconds + microseconds / 1_000_000
+                    tat = max(float(pipe.get(key) or 0), now) + interval
+                    wait = max(0.0, tat - now - self.burst * interval)
+                    if max_wait is not None and wait > max_wait:
+                        pipe.unwatch()
+                        self._record(rescheduled=1)
+                        return None
+                    pipe.multi()
+                    pipe.set(key, tat, px=int((tat - now) * 1000) + 1000)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+        self._record(granted=1, delayed=1 if wait else 0, wait=wait)
+        return wait
+
+    def _record(self, granted: int = 0, delayed: int = 0, rescheduled: int = 0, wait=0.0):
+        try:
+            pipe = get_redis_client().pipeline()
+            key = get_rate_limit_stats_redis_key(self.bucket)
+            pipe.hincrby(key, "granted", granted)
+            pipe.hincrby(key, "delayed", delayed)
+            pipe.hincrby(key, "rescheduled", rescheduled)
+            pipe.hincrbyfloat(key, "wait_seconds", wait)
+            pipe.execute()
+        except Exception as ex:
+            # metrics never fail a call
+            logger.warning(f"Cannot record the rate limit stats of {self.bucket}: {ex}")
+
+    def acquire(self, reschedule: bool = False):
+        """Wait for a slot, or reschedule the current celery task when it is too far
+
+        :raises RateLimitExceeded: outside a celery task, the slot is too far
+        """
+        if not self.enabled:
+            return
+        task = current_task
+        if not (task and not task.request.called_directly):
+            # a request thread: fail fast rather than holding it
+            wait = self.reserve(max_wait=settings.RATE_LIMIT_MAX_WAIT_SECONDS)
+            if wait is None:
+                raise RateLimitExceeded(self.bucket)
+        elif not reschedule:
+            wait = self.reserve()
+        else:
+            wait = self.reserve(max_wait=settings.RATE_LIMIT_MAX_BLOCK_SECONDS)
+            if wait is None:
+                raise task.retry(
+                    countdown=settings.RATE_LIMIT_MAX_BLOCK_SECONDS,
+                    max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+                )
+        if wait:
+            time.sleep(wait)
+
+
+def get_rate_limiter(bucket: RateLimitBucket) -> RateLimiter:
+    rate = {
+        RateLimitBucket.BREVO: settings.RATE_LIMIT_BREVO_PER_SECOND,
+        RateLimitBucket.SMTP: settings.RATE_LIMIT_SMTP_PER_SECOND,
+        RateLimitBucket.GOOGLE: settings.RATE_LIMIT_GOOGLE_PER_SECOND,
+    }[bucket]
+    return RateLimiter(bucket.value, rate=rate, burst=int(rate))
+
+
+def rate_limited(bucket: RateLimitBucket, reschedule: bool = False):
+    """Take a slot of `bucket` before each call of the decorated function"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            get_rate_limiter(bucket).acquire(reschedule=reschedule)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_rate_limit_metrics() -> list[dict]:
+    redis_client = get_redis_client()
+    metrics = []
+    for bucket in RateLimitBucket:
+        stats = redis_client.hgetall(get_rate_limit_stats_redis_key(bucket.value))
+        stats = {
+            (key.decode() if isinstance(key, bytes) else key): float(value)
+            for key, value in stats.items()
+        }
+        delayed = int(stats.get("delayed", 0))
+        metrics.append(
+            dict(
+                bucket=bucket.value,
+                rate_per_second=get_rate_limiter(bucket).rate,
+                granted=int(stats.get("granted", 0)),
+                delayed=delayed,
+                rescheduled=int(stats.get("rescheduled", 0)),
+                avg_wait_seconds=stats["wait_seconds"] / delayed if delayed else None,
+            )
+        )
+    return metrics
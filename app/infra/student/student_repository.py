@@ -3,8 +3,12 @@
 from typing import Optional, Dict, Union, List, Any
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
+from app.config.database import get_report_read_preference
 from app.models.student import StudentModel
+from app.infra.security.principal_cache import student_principal_cache
 from app.domain.student.entity import StudentInDB, StudentInUpdate
 from app.domain.subject.entity import (
     _SubjectRegistrationInResponse,
@@ -12,6 +16,9 @@ from app.domain.subject.entity import (
     StudentInSubject,
 )
 from app.domain.shared.entity import Pagination
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
+from app.shared.utils.search import search_stages
 
 
 class StudentRepository:
@@ -64,7 +71,9 @@ class StudentRepository:
     def update(self, id: ObjectId, data: Union[StudentInUpdate, Dict[str, Any]]) -> bool:
         try:
             data = data.model_dump(exclude_none=True) if isinstance(data, StudentInUpdate) else data
+            data = {**data, **StudentModel.get_updated_search_index(id, data)}
             StudentModel.objects(id=id).update_one(**data, upsert=False)
+            student_principal_cache.invalidate(id=id)
             return True
         except Exception:
             return False
@@ -81,27 +90,65 @@ class StudentRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[StudentModel]:
+        after: Optional[str] = None,
+        search: Optional[str] = None,
+        projection: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+    ) -> List[StudentModel] | List[dict]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
-        pipeline.append(
-            {"$sort": sort if sort else {"created_at": -1}},
+        pipeline.extend(search_stages(search))
+        pipeline.extend(
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
-        if isinstance(page_size, int):
-            pipeline.extend(
-                [
-                    {"$skip": page_size * (page_index - 1)},
-                    {"$limit": page_size},
-                ]
-            )
+        if projection:
+            pipeline.append({"$project": projection})
 
         try:
-            docs = StudentModel.objects().aggregate(pipeline)
+            docs = (
+                StudentModel.objects()
+                .read_preference(get_report_read_preference())
+                .aggregate(pipeline)
+            )
+            if raw:
+                return list(docs)
             return [StudentModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int | None = None,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        projection: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+    ) -> tuple[List[StudentModel] | List[dict], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = search_stages(search) + paginate_pipeline(
+            sort or {"created_at": -1}, page_index, page_size, after=after
+        )
+        if projection:
+            page_stages.append({"$project": projection})
+        try:
+            docs, total = aggregate_with_total(
+                StudentModel.objects().read_preference(get_report_read_preference()),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            if raw:
+                return docs, total
+            return [StudentModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
@@ -113,7 +160,11 @@ class StudentRepository:
         pipeline.append({"$count": "document_count"})
 
         try:
-            docs = StudentModel.objects().aggregate(pipeline)
+            docs = (
+                StudentModel.objects()
+                .read_preference(get_report_read_preference())
+                .aggregate(pipeline)
+            )
             return list(docs)[0]["document_count"]
         except Exception:
             return 0
@@ -121,17 +172,81 @@ class StudentRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             StudentModel.objects(id=id).delete()
+            student_principal_cache.invalidate(id=id)
             return True
         except Exception:
             return False
 
-    def find_one(self, conditions: Dict[str, Union[str, bool, ObjectId]]) -> Optional[StudentModel]:
+    def find_one(
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, int]] = None,
+    ) -> Optional[StudentModel]:
         try:
-            doc = StudentModel._get_collection().find_one(conditions)
+            doc = StudentModel._get_collection().find_one(conditions, projection)
             return StudentModel.from_mongo(doc) if doc else None
         except Exception:
             return None
 
+    def find_by_emails(self, emails: List[str]) -> Dict[str, StudentModel]:
+        """
+        Students having one of the emails, in one query
+        :param emails:
+        :return: students by email
+        """
+        cursor = StudentModel._get_collection().find({"email": {"$in": emails}})
+        return {doc["email"]: StudentModel._from_son(doc) for doc in cursor}
+
+    def get_numerical_orders(self, season: int) -> set[int]:
+        """
+        Numerical orders (MSHV) already given in a season
+        :param season:
+        :return:
+        """
+        cursor = StudentModel._get_collection().find(
+            {"seasons_info.season": season}, {"seasons_info": 1}
+        )
+        return {
+            info["numerical_order"]
+            for doc in cursor
+            for info in doc.get("seasons_info", [])
+            if info.get("season") == season
+        }
+
+    def insert_many(self, documents: List[dict]) -> List[dict]:
+        """
+        Insert raw documents (unordered: a failed document does not stop the others)
+        :param documents: StudentModel.to_mongo() of the students
+        :return: write errors, "index" is the position of the failed document
+        """
+        try:
+            StudentModel._get_collection().insert_many(
+                [{**doc, **StudentModel.get_search_index(doc)} for doc in documents], ordered=False
+            )
+        except BulkWriteError as e:
+            return e.details["writeErrors"]
+        return []
+
+    def bulk_update(self, updates: List[tuple[ObjectId, dict]]) -> List[dict]:
+        """
+        Apply an update document to each student (unordered)
+        :param updates: (student id, update document)
+        :return: write errors, "index" is the position of the failed update
+        """
+        if not updates:
+            return []
+        try:
+            StudentModel._get_collection().bulk_write(
+                [UpdateOne({"_id": id}, update, upsert=False) for id, update in updates],
+                ordered=False,
+            )
+            errors = []
+        except BulkWriteError as e:
+            errors = e.details["writeErrors"]
+        for id, _ in updates:
+            student_principal_cache.invalidate(id=id)
+        return errors
+
     def list_subject_registrations(
         self,
         page_index: int = 1,
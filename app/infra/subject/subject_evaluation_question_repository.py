@@ -5,6 +5,7 @@ from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
 from app.models.subject_evaluation import SubjectEvaluationQuestionModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.subject.subject_evaluation.entity import (
     SubjectEvaluationQuestionInDB,
     SubjectEvaluationQuestionInUpdateTime,
@@ -25,6 +26,7 @@ class SubjectEvaluationQuestionRepository:
         new_doc = SubjectEvaluationQuestionModel(**doc.model_dump())
         # and save it to db
         new_doc.save()
+        invalidate_response_cache(ResponseCacheTag.SUBJECT_EVALUATION_QUESTION)
 
         return new_doc
 
@@ -55,6 +57,7 @@ class SubjectEvaluationQuestionRepository:
                 else data
             )
             SubjectEvaluationQuestionModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.SUBJECT_EVALUATION_QUESTION)
             return True
         except Exception:
             return False
@@ -103,6 +106,7 @@ class SubjectEvaluationQuestionRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             SubjectEvaluationQuestionModel.objects(id=id).delete()
+            invalidate_response_cache(ResponseCacheTag.SUBJECT_EVALUATION_QUESTION)
             return True
         except Exception:
             return False
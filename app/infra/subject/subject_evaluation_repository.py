@@ -8,6 +8,8 @@ from app.domain.subject.subject_evaluation.entity import (
     SubjectEvaluationInDB,
     SubjectEvaluationInUpdateTime,
 )
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.pagination import paginate_pipeline
 
 
 class SubjectEvaluationRepository:
@@ -28,10 +30,12 @@ class SubjectEvaluationRepository:
         return new_doc
 
     def find_one(
-        self, conditions: list[str, str | bool | ObjectId]
+        self,
+        conditions: list[str, str | bool | ObjectId],
+        projection: Optional[Dict[str, int]] = None,
     ) -> SubjectEvaluationModel | None:
         try:
-            doc = SubjectEvaluationModel._get_collection().find_one(conditions)
+            doc = SubjectEvaluationModel._get_collection().find_one(conditions, projection)
             return SubjectEvaluationModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -62,28 +66,56 @@ class SubjectEvaluationRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[SubjectEvaluationModel]:
-
+        after: Optional[str] = None,
+        projection: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+    ) -> List[SubjectEvaluationModel] | List[dict]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
-        pipeline.append(
-            {"$sort": sort if sort else {"subject": -1}},
+        pipeline.extend(
+            paginate_pipeline(sort or {"subject": -1}, page_index, page_size, after=after)
         )
-        if page_size:
-            pipeline.extend(
-                [
-                    {"$skip": page_size * (page_index - 1)},
-                    {"$limit": page_size},
-                ]
-            )
+        if projection:
+            pipeline.append({"$project": projection})
 
         try:
             docs = SubjectEvaluationModel.objects().aggregate(pipeline)
+            if raw:
+                return list(docs)
             return [SubjectEvaluationModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
 
+    def list_with_total(
+        self,
+        page_index: int = 1,
+        page_size: int | None = None,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        after: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        projection: Optional[Dict[str, int]] = None,
+        raw: bool = False,
+    ) -> tuple[List[SubjectEvaluationModel] | List[dict], int]:
+        """Page of `list` and total of `count_list` in one round trip, see aggregate_with_total"""
+        page_stages = paginate_pipeline(sort or {"subject": -1}, page_index, page_size, after=after)
+        if projection:
+            page_stages.append({"$project": projection})
+        try:
+            docs, total = aggregate_with_total(
+                SubjectEvaluationModel.objects(),
+                match_pipeline,
+                page_stages,
+                total_mode=total_mode,
+                cursor=after is not None,
+            )
+            if raw:
+                return docs, total
+            return [SubjectEvaluationModel.from_mongo(doc) for doc in docs], total
+        except Exception:
+            return [], 0
+
     def count_list(
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
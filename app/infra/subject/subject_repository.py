@@ -6,7 +6,10 @@ from bson import ObjectId
 import pymongo
 
 from app.models.subject import SubjectModel
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
 from app.domain.subject.entity import SubjectInDB, SubjectInUpdateTime
+from app.shared.utils.general import clear_student_roll_call_cache
+from app.shared.utils.pagination import paginate_pipeline
 
 
 class SubjectRepository:
@@ -23,6 +26,7 @@ class SubjectRepository:
         new_doc = SubjectModel(**subject.model_dump())
         # and save it to db
         new_doc.save()
+        invalidate_response_cache(ResponseCacheTag.SUBJECT)
 
         return new_doc
 
@@ -49,6 +53,8 @@ class SubjectRepository:
                 else data
             )
             SubjectModel.objects(id=id).update_one(**data, upsert=False)
+            invalidate_response_cache(ResponseCacheTag.SUBJECT)
+            self._clear_roll_call_cache(self._get_seasons([id]))
             return True
         except Exception:
             return False
@@ -65,22 +71,19 @@ class SubjectRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[SubjectModel]:
+        after: Optional[str] = None,
+        raw: bool = False,
+    ) -> List[SubjectModel] | List[dict]:
         pipeline = []
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
-        pipeline.append(
-            {"$sort": sort if sort else {"created_at": -1}},
+        pipeline.extend(
+            paginate_pipeline(sort or {"created_at": -1}, page_index, page_size, after=after)
         )
-        if page_size:
-            pipeline.extend(
-                [
-                    {"$skip": page_size * (page_index - 1)},
-                    {"$limit": page_size},
-                ]
-            )
         try:
             docs = SubjectModel.objects().aggregate(pipeline)
+            if raw:
+                return list(docs)
             return [SubjectModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
@@ -103,7 +106,10 @@ class SubjectRepository:
 
     def delete(self, id: ObjectId) -> bool:
         try:
+            seasons = self._get_seasons([id])
             SubjectModel.objects(id=id).delete()
+            invalidate_response_cache(ResponseCacheTag.SUBJECT)
+            self._clear_roll_call_cache(seasons)
             return True
         except Exception:
             return False
@@ -145,6 +151,18 @@ class SubjectRepository:
                 for season in entities
             ]
             SubjectModel._get_collection().bulk_write(operations)
+            invalidate_response_cache(ResponseCacheTag.SUBJECT)
+            self._clear_roll_call_cache({subject.season for subject in entities})
             return True
         except Exception:
             return False
+
+    def _get_seasons(self, ids: List[Union[str, ObjectId]]) -> List[int]:
+        return SubjectModel._get_collection().distinct(
+            "season", {"_id": {"$in": [ObjectId(id) for id in ids]}}
+        )
+
+    def _clear_roll_call_cache(self, seasons) -> None:
+        # the cached roll call results of the students hold the titles and codes of the subjects
+        for season in seasons:
+            clear_student_roll_call_cache(season)
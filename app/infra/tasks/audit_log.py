@@ -0,0 +1,11 @@
+from app.domain.celery_result.enum import CeleryResultTag
+from app.infra.audit_log.audit_log_writer import insert_audit_logs
+from celery_config import celery_app_with_error_handler
+from celery_config.celery_worker import logger
+
+
+@celery_app_with_error_handler(CeleryResultTag.AUDIT_LOG)
+def write_audit_logs_task(documents: list[dict]):
+    """Write the audit logs an API process could not write in time"""
+    insert_audit_logs(documents)
+    logger.info(f"[write_audit_logs_task] wrote {len(documents)} audit logs")
@@ -1,13 +1,17 @@
+import time
 from datetime import timedelta
 
 from bson import ObjectId
 from celery import group
+from sib_api_v3_sdk.rest import ApiException
 
 from app.config import settings
 from app.domain.celery_result.enum import CeleryResultTag
+from app.domain.email_delivery.enum import EmailDeliveryStatus
 from app.infra.admin.admin_repository import AdminRepository
 from app.infra.email.brevo_service import BrevoService
 from app.infra.email.email_smtp_service import EmailSMTPService
+from app.infra.email_delivery.email_delivery_repository import EmailDeliveryRepository
 from app.infra.subject.subject_registration_repository import SubjectRegistrationRepository
 from app.infra.subject.subject_repository import SubjectRepository
 from app.models.admin import AdminModel
@@ -22,9 +26,11 @@ from static.email.entity import Template, TemplateContent
 email_smtp_service = EmailSMTPService()
 brevo_service = BrevoService()
 
+# Brevo answers worth retrying: rate limited or server errors
+BREVO_RETRY_STATUSES = {429, 500, 502, 503, 504}
 
-@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
-def send_email_welcome_task(email: str, password: str, full_name: str, is_admin: bool = False):
+
+def _welcome_plain_text(email: str, password: str, full_name: str, is_admin: bool = False):
     plain_text = EMAIL_TEMPLATE[Template.WELCOME][TemplateContent.PLAIN_TEXT]
     plain_text = plain_text.replace("{{full_name}}", full_name)
     plain_text = plain_text.replace("{{password}}", password)
@@ -32,23 +38,64 @@ def send_email_welcome_task(email: str, password: str, full_name: str, is_admin:
     plain_text = plain_text.replace(
         "{{url}}", settings.FE_ADMIN_BASE_URL if is_admin else settings.FE_STUDENT_BASE_URL
     )
-    email_smtp_service.send_email_welcome(email=email, plain_text=plain_text)
+    return plain_text
 
 
-@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
-def send_email_welcome_with_exist_account_task(
+def _welcome_with_exist_account_plain_text(
     email: str, season: int, full_name: str, is_admin: bool = False
 ):
     plain_text = EMAIL_TEMPLATE[Template.WELCOME_WITH_EXIST_ACCOUNT][TemplateContent.PLAIN_TEXT]
     plain_text = plain_text.replace("{{full_name}}", full_name)
-    plain_text = plain_text.replace("{{season}}", season)
+    plain_text = plain_text.replace("{{season}}", str(season))
     plain_text = plain_text.replace("{{email}}", email)
     plain_text = plain_text.replace(
         "{{url}}", settings.FE_ADMIN_BASE_URL if is_admin else settings.FE_STUDENT_BASE_URL
     )
+    return plain_text
+
+
+def _send_welcome_batch(plain_text, recipients: list[dict]):
+    """Send to every recipient over one SMTP session, a failure does not stop the batch"""
+    failures = email_smtp_service.send_email_welcome_many(
+        [(recipient["email"], plain_text(**recipient)) for recipient in recipients]
+    )
+    for ex in failures.values():
+        logger.error(ex)
+    if failures:
+        failed = [recipients[idx]["email"] for idx in failures]
+        raise Exception(f"Failed to send {len(failed)}/{len(recipients)} emails: {failed}")
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def send_email_welcome_task(email: str, password: str, full_name: str, is_admin: bool = False):
+    plain_text = _welcome_plain_text(
+        email=email, password=password, full_name=full_name, is_admin=is_admin
+    )
     email_smtp_service.send_email_welcome(email=email, plain_text=plain_text)
 
 
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def send_email_welcome_with_exist_account_task(
+    email: str, season: int, full_name: str, is_admin: bool = False
+):
+    plain_text = _welcome_with_exist_account_plain_text(
+        email=email, season=season, full_name=full_name, is_admin=is_admin
+    )
+    email_smtp_service.send_email_welcome(email=email, plain_text=plain_text)
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def send_email_welcome_batch_task(recipients: list[dict]):
+    """recipients: kwargs (email, password, full_name) of send_email_welcome_task"""
+    _send_welcome_batch(_welcome_plain_text, recipients)
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def send_email_welcome_with_exist_account_batch_task(recipients: list[dict]):
+    """recipients: kwargs (email, season, full_name) of the single email task"""
+    _send_welcome_batch(_welcome_with_exist_account_plain_text, recipients)
+
+
 @celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
 def send_email_forgot_password_otp_task(
     email: str, otp: str, full_name: str, is_admin: bool = False
@@ -123,10 +170,7 @@ def send_email_notification_subject_task(subject_id: str):
     emails_to: list[str] = [doc.email for doc in docs]
     emails_to.extend(emails_admin)
 
-    job = group(
-        [send_email_notification_subject_to_user_task.s(email, params) for email in emails_to]
-    )
-    job.apply_async()
+    _send_brevo_by_batch(settings.STUDENT_NOTIFICATION_SUBJECT, subject_id, emails_to, params)
 
 
 @celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
@@ -171,8 +215,7 @@ def send_email_notification_subject_task_for_extra_mails(subject_id: str, emails
         documents=documents if len(documents) > 0 else None,
     )
 
-    job = group([send_email_notification_subject_to_user_task.s(email, params) for email in emails])
-    job.apply_async()
+    _send_brevo_by_batch(settings.STUDENT_NOTIFICATION_SUBJECT, subject_id, emails, params)
 
 
 @celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
@@ -216,12 +259,99 @@ def send_student_evaluation_subject_task(subject_id: str):
     emails_to: list[str] = [doc.student.email for doc in docs]
     emails_to.extend(emails_admin)
 
-    job = group(
-        [send_student_evaluation_subject_to_user_task.s(email, params) for email in emails_to]
+    _send_brevo_by_batch(
+        settings.STUDENT_SUBJECT_EVALUATION_TEMPLATE, subject_id, emails_to, params
     )
-    job.apply_async()
 
 
 @celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
 def send_student_evaluation_subject_to_user_task(email: str, params: dict):
     brevo_service.send_student_evaluation_subject(email_to=email, params=params)
+
+
+def _send_brevo_by_batch(template_id: int, ref: str, emails: list[str], params: dict):
+    """One task (and one Brevo API call) per BREVO_BATCH_SIZE recipients"""
+    emails = list(dict.fromkeys(emails))
+    size = max(1, settings.BREVO_BATCH_SIZE)
+    job = group(
+        [
+            send_brevo_batch_task.s(
+                template_id, ref, [{"email": email} for email in emails[i : i + size]], params
+            )
+            for i in range(0, len(emails), size)
+        ]
+    )
+    job.apply_async()
+
+
+def _send_brevo_with_retry(template_id: int, recipients: list[dict], params: dict) -> list[str]:
+    for attempt in range(settings.BREVO_BATCH_RETRIES + 1):
+        try:
+            return brevo_service.send_batch(template_id, recipients, params)
+        except ApiException as ex:
+            if ex.status not in BREVO_RETRY_STATUSES or attempt == settings.BREVO_BATCH_RETRIES:
+                raise
+            logger.warning(f"[send_brevo_batch] {ex.status}, retry in {2**attempt}s")
+            time.sleep(2**attempt)
+
+
+def _brevo_error(ex: Exception) -> str:
+    if isinstance(ex, ApiException):
+        return f"{ex.status} {ex.body or ex.reason}"
+    return str(ex)
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def send_brevo_batch_task(template_id: int, ref: str, recipients: list[dict], params: dict):
+    """Send a Brevo template to a chunk of recipients ({"email", "params"?}) in one call
+
+    The delivery status of each recipient is kept in EmailDeliveries. When Brevo rejects
+    the whole chunk (e.g. an invalid address), the recipients are sent one by one so only
+    the faulty ones fail.
+    """
+    email_delivery_repository = EmailDeliveryRepository()
+    emails = [recipient["email"] for recipient in recipients]
+    email_delivery_repository.set_status(
+        template_id, ref, emails, EmailDeliveryStatus.PENDING, attempt=True
+    )
+
+    try:
+        message_ids = _send_brevo_with_retry(template_id, recipients, params)
+        email_delivery_repository.set_status(
+            template_id,
+            ref,
+            emails,
+            EmailDeliveryStatus.SENT,
+            message_ids=dict(zip(emails, message_ids)) if len(message_ids) == len(emails) else None,
+        )
+        return
+    except Exception as ex:
+        rejected = isinstance(ex, ApiException) and ex.status not in BREVO_RETRY_STATUSES
+        if not rejected or len(recipients) == 1:
+            email_delivery_repository.set_status(
+                template_id, ref, emails, EmailDeliveryStatus.FAILED, error=_brevo_error(ex)
+            )
+            raise
+
+    failed: list[str] = []
+    for recipient in recipients:
+        try:
+            message_ids = _send_brevo_with_retry(template_id, [recipient], params)
+            email_delivery_repository.set_status(
+                template_id,
+                ref,
+                [recipient["email"]],
+                EmailDeliveryStatus.SENT,
+                message_ids={recipient["email"]: message_ids[0]},
+            )
+        except Exception as ex:
+            failed.append(recipient["email"])
+            email_delivery_repository.set_status(
+                template_id,
+                ref,
+                [recipient["email"]],
+                EmailDeliveryStatus.FAILED,
+                error=_brevo_error(ex),
+            )
+    if failed:
+        raise Exception(f"Failed to send {len(failed)}/{len(recipients)} emails: {failed}")
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from app.config.redis import get_redis_client
+from app.domain.celery_result.enum import CeleryResultTag
+from app.infra.services.daily_bible_api import DailyBibleAPIService
+from app.shared.utils.general import (
+    get_daily_bible_redis_key,
+    get_today,
+    get_ttl_until_end_of,
+)
+from celery_config import celery_app_with_error_handler
+from celery_config.celery_worker import logger
+
+
+@celery_app_with_error_handler(CeleryResultTag.DAILY_BIBLE)
+def prefetch_daily_bible_task():
+    """Cache tomorrow's reading before midnight, so that no request has to fetch it"""
+    tomorrow = get_today() + timedelta(days=1)
+    logger.info(f"[prefetch_daily_bible_task] fetching {tomorrow}...")
+    daily_bible_api_service = DailyBibleAPIService()
+    response = daily_bible_api_service.fetch(day=tomorrow)
+    response.raise_for_status()
+    quotes = daily_bible_api_service.parse(response.json())
+    get_redis_client().setex(
+        get_daily_bible_redis_key(tomorrow),
+        get_ttl_until_end_of(tomorrow + timedelta(days=1)),
+        quotes.model_dump_json(),
+    )
+    logger.info(f"[prefetch_daily_bible_task] cached {tomorrow}: {quotes.epitomize_text}")
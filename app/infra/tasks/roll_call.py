@@ -0,0 +1,15 @@
+from app.domain.celery_result.enum import CeleryResultTag
+from app.infra.roll_call.roll_call_repository import RollCallRepository
+from app.shared.utils.general import clear_student_roll_call_cache, get_current_season_value
+from celery_config import celery_app_with_error_handler
+from celery_config.celery_worker import logger
+
+
+@celery_app_with_error_handler(CeleryResultTag.ROLL_CALL)
+def rebuild_roll_call_summary_task(season: int | None = None):
+    """Rebuild the materialized roll call summaries of a season, default to the current one"""
+    season = season or get_current_season_value()
+    logger.info(f"[rebuild_roll_call_summary_task] rebuilding season {season}...")
+    summaries = RollCallRepository().refresh_summaries(season=season)
+    clear_student_roll_call_cache(season=season)
+    logger.info(f"[rebuild_roll_call_summary_task] rebuilt {len(summaries)} summaries")
@@ -0,0 +1,15 @@
+from app.domain.celery_result.enum import CeleryResultTag
+from app.models.document import DocumentModel
+from app.models.general_task import GeneralTaskModel
+from app.models.lecturer import LecturerModel
+from app.models.student import StudentModel
+from celery_config import celery_app_with_error_handler
+from celery_config.celery_worker import logger
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEARCH_INDEX)
+def rebuild_search_index_task():
+    """Backfill the search index (search_words, search_tokens) of the searchable collections"""
+    for model in (StudentModel, LecturerModel, DocumentModel, GeneralTaskModel):
+        count = model.rebuild_search_index()
+        logger.info(f"[rebuild_search_index_task] indexed {count} {model._get_collection_name()}")
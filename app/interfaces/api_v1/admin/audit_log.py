@@ -25,6 +25,7 @@ def get_list_audit_logs(
     list_audit_logs_use_case: ListAuditLogsUseCase = Depends(ListAuditLogsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 100,
+    after: Optional[str] = Query(None, title="Cursor of the next page (next_cursor)"),
     search: Optional[str] = Query(None, title="Search"),
     sort: Optional[Sort] = Sort.DESC,
     sort_by: Optional[str] = "created_at",
@@ -47,6 +48,7 @@ def get_list_audit_logs(
         endpoint=endpoint,
         type=type,
         sort=sort_query,
+        after=after,
     )
     response = list_audit_logs_use_case.execute(request_object=req_object)
     return response
@@ -4,7 +4,9 @@ from fastapi import Body, Depends, APIRouter
 from fastapi.params import Query
 
 from app.domain.celery_result.entity import (
+    CeleryQueuesInResponse,
     ManyCeleryResultsInResponse,
+    RateLimitsInResponse,
     TaskIdsRequest,
 )
 from app.domain.celery_result.enum import CeleryResultTag
@@ -15,6 +17,14 @@ from app.use_cases.celery_result.list import (
     ListCeleryResultsUseCase,
     ListCeleryResultsRequestObject,
 )
+from app.use_cases.celery_result.queue_metrics import (
+    GetCeleryQueuesRequestObject,
+    GetCeleryQueuesUseCase,
+)
+from app.use_cases.celery_result.rate_limits import (
+    GetRateLimitsRequestObject,
+    GetRateLimitsUseCase,
+)
 from app.use_cases.celery_result.mark_resolved_failed import (
     MarkResolvedFailedRequestObject,
     MarkResolvedFailedUseCase,
@@ -32,6 +42,7 @@ def get_list_celery_results_fail(
     list_celery_results_use_case: ListCeleryResultsUseCase = Depends(ListCeleryResultsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 20,
+    after: Optional[str] = Query(None, title="Cursor of the next page (next_cursor)"),
     name: Optional[str] = Query(None, title="Name"),
     sort: Optional[Sort] = Sort.DESC,
     sort_by: Optional[str] = "date_done",
@@ -48,12 +59,47 @@ def get_list_celery_results_fail(
         name=name,
         tag=tag,
         sort=sort_query,
+        after=after,
         resolved=resolved,
     )
     response = list_celery_results_use_case.execute(request_object=req_object)
     return response
 
 
+@router.get(
+    "/queues",
+    response_model=CeleryQueuesInResponse,
+)
+@response_decorator()
+def get_celery_queues(
+    get_celery_queues_use_case: GetCeleryQueuesUseCase = Depends(GetCeleryQueuesUseCase),
+    current_admin=Depends(get_current_active_admin),
+):
+    """Depth (messages ready) and wait time of the tasks of each celery queue"""
+    authorization(current_admin, [AdminRole.ADMIN])
+
+    req_object = GetCeleryQueuesRequestObject.builder()
+    response = get_celery_queues_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get(
+    "/rate-limits",
+    response_model=RateLimitsInResponse,
+)
+@response_decorator()
+def get_rate_limits(
+    get_rate_limits_use_case: GetRateLimitsUseCase = Depends(GetRateLimitsUseCase),
+    current_admin=Depends(get_current_active_admin),
+):
+    """Calls granted, delayed and rescheduled by the rate limit of each provider"""
+    authorization(current_admin, [AdminRole.ADMIN])
+
+    req_object = GetRateLimitsRequestObject.builder()
+    response = get_rate_limits_use_case.execute(request_object=req_object)
+    return response
+
+
 @router.post(
     "/mark-resolved-failed",
 )
@@ -148,6 +148,7 @@ def get_list_documents(
     list_documents_use_case: ListDocumentsUseCase = Depends(ListDocumentsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 20,
+    after: Optional[str] = Query(None, title="Cursor of the next page (next_cursor)"),
     search: Optional[str] = Query(None, title="Search"),
     label: Optional[list[str]] = Query(None, title="Labels"),
     roles: Optional[list[str]] = Query(None, title="Roles"),
@@ -174,6 +175,7 @@ def get_list_documents(
         season=season,
         type=type,
         sort=sort_query,
+        after=after,
     )
     response = list_documents_use_case.execute(request_object=req_object)
     return response
@@ -83,6 +83,7 @@ def get_list_general_tasks(
     list_general_tasks_use_case: ListGeneralTasksUseCase = Depends(ListGeneralTasksUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 20,
+    after: Optional[str] = Query(None, title="Cursor of the next page (next_cursor)"),
     search: Optional[str] = Query(None, title="Search"),
     label: Optional[list[str]] = Query(None, title="Labels"),
     roles: Optional[list[str]] = Query(None, title="Roles"),
@@ -109,6 +110,7 @@ def get_list_general_tasks(
         type=type,
         roles=roles,
         sort=sort_query,
+        after=after,
     )
     response = list_general_tasks_use_case.execute(request_object=req_object)
     return response
@@ -15,6 +15,7 @@ from app.infra.security.security_service import (
     get_current_admin,
 )
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 from app.use_cases.lecturer.list import ListLecturersUseCase, ListLecturersRequestObject
 from app.use_cases.lecturer.update import (
     UpdateLecturerUseCase,
@@ -40,6 +41,7 @@ router = APIRouter()
     dependencies=[Depends(get_current_admin)],
     response_model=Lecturer,
 )
+@cache_response(ResponseCacheTag.LECTURER)
 @response_decorator()
 def get_lecturer_by_id(
     lecturer_id: str = Path(..., title="Lecturer id"),
@@ -68,11 +70,13 @@ def create_lecturer(
     response_model=ManyLecturersInResponse,
     dependencies=[Depends(get_current_admin)],
 )
+@cache_response(ResponseCacheTag.LECTURER)
 @response_decorator()
 def get_list_lecturers(
     list_lecturers_use_case: ListLecturersUseCase = Depends(ListLecturersUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 20,
+    after: Optional[str] = Query(None, title="Cursor of the next page (next_cursor)"),
     search: Optional[str] = Query(None, title="Search"),
     sort: Optional[Sort] = Sort.DESC,
     sort_by: Optional[str] = "id",
@@ -85,7 +89,11 @@ def get_list_lecturers(
     sort_query = {sort_by: 1 if sort is sort.ASCE else -1}
 
     req_object = ListLecturersRequestObject.builder(
-        page_index=page_index, page_size=page_size, search=search, sort=sort_query
+        page_index=page_index,
+        page_size=page_size,
+        search=search,
+        sort=sort_query,
+        after=after,
     )
     response = list_lecturers_use_case.execute(request_object=req_object)
     return response
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Body, Query
 from app.infra.security.security_service import authorization, get_current_active_admin
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 
 from app.models.admin import AdminModel
 
@@ -44,6 +45,7 @@ def manage_form(
 
 
 @router.get("", response_model=CommonResponse)
+@cache_response(ResponseCacheTag.MANAGE_FORM)
 @response_decorator()
 def get_form(
     type: FormType = Query(..., title="Form type"),
@@ -1,7 +1,11 @@
 from typing import Annotated
 from fastapi import APIRouter, Body, Depends, Query
 
-from app.domain.roll_call.entity import RollCallBulkSheet, StudentRollCallResultInResponse
+from app.domain.roll_call.entity import (
+    RollCallBulkResult,
+    RollCallBulkSheet,
+    StudentRollCallResultInResponse,
+)
 from app.domain.shared.enum import AdminRole, Sort
 from app.infra.security.security_service import authorization, get_current_active_admin
 from app.models.admin import AdminModel
@@ -20,7 +24,7 @@ from app.use_cases.roll_call.get_results import (
 router = APIRouter()
 
 
-@router.post("/by-sheet")
+@router.post("/by-sheet", response_model=RollCallBulkResult)
 @response_decorator()
 def roll_call_by_sheet(
     payload: RollCallBulkSheet = Body(...),
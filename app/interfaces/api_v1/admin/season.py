@@ -5,6 +5,7 @@ from app.domain.season.entity import Season, SeasonInCreate, SeasonInUpdate
 from app.domain.shared.enum import AdminRole, Sort
 from app.infra.security.security_service import authorization, get_current_active_admin
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 from app.use_cases.season.create import (
     CreateSeasonRequestObject,
     CreateSeasonUseCase,
@@ -43,6 +44,7 @@ def create_season(
     "",
     response_model=list[Season],
 )
+@cache_response(ResponseCacheTag.SEASON)
 @response_decorator()
 def get_list_seasons(
     list_seasons_use_case: ListSeasonsUseCase = Depends(ListSeasonsUseCase),
@@ -69,6 +71,7 @@ def get_list_seasons(
     "/current",
     response_model=Season,
 )
+@cache_response(ResponseCacheTag.SEASON)
 @response_decorator()
 def get_current_season(
     get_season_use_case: GetCurrentSeasonCase = Depends(GetCurrentSeasonCase),
@@ -81,6 +84,7 @@ def get_current_season(
     "/{season_id}",
     response_model=Season,
 )
+@cache_response(ResponseCacheTag.SEASON)
 @response_decorator()
 def get_season_by_id(
     season_id: str = Path(..., title="Season id"),
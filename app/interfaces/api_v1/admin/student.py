@@ -13,6 +13,7 @@ from app.domain.student.entity import (
 from app.domain.shared.enum import AdminRole, Sort
 from app.infra.security.security_service import authorization, get_current_active_admin
 from app.shared.decorator import response_decorator
+from app.shared.utils.projection import validate_fields
 from app.use_cases.student_admin.list import ListStudentsUseCase, ListStudentsRequestObject
 from app.use_cases.student_admin.update import UpdateStudentUseCase, UpdateStudentRequestObject
 from app.use_cases.student_admin.get import (
@@ -84,7 +85,9 @@ def get_list_students(
     sort_by: Optional[str] = "numerical_order",
     group: Optional[int] = None,
     season: int | None = None,
+    fields: Optional[list[str]] = Query(None, title="Fields of the students, default to all"),
 ):
+    validate_fields(fields, Student)
     if sort_by in ["numerical_order", "season", "group"]:
         sort_by = f"seasons_info.{sort_by}"
     sort_query = {sort_by: 1 if sort is sort.ASCE else -1}
@@ -96,6 +99,7 @@ def get_list_students(
         sort=sort_query,
         group=group,
         season=season,
+        fields=fields,
     )
     response = list_students_use_case.execute(request_object=req_object)
     return response
@@ -17,6 +17,7 @@ from app.infra.security.security_service import (
     get_current_admin,
 )
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 from app.use_cases.subject.generate_question_spreadsheet import (
     GenerateQuestionSpreadsheetRequestObject,
     GenerateQuestionSpreadsheetUseCase,
@@ -145,6 +146,7 @@ def get_subject_evaluation(
 
 
 @router.get("/list-short", response_model=list[SubjectShortResponse])
+@cache_response(ResponseCacheTag.SUBJECT, ResponseCacheTag.SEASON)
 @response_decorator()
 def get_list_subjects_short(
     list_subjects_short_use_case: ListSubjectsShortUseCase = Depends(ListSubjectsShortUseCase),
@@ -180,6 +182,7 @@ def get_list_subjects_short(
     dependencies=[Depends(get_current_admin)],
     response_model=Subject,
 )
+@cache_response(ResponseCacheTag.SUBJECT, ResponseCacheTag.LECTURER, ResponseCacheTag.DOCUMENT)
 @response_decorator()
 def get_subject_by_id(
     subject_id: str = Path(..., title="Subject id"),
@@ -207,6 +210,12 @@ def create_subject(
 
 
 @router.get("", response_model=list[Subject])
+@cache_response(
+    ResponseCacheTag.SUBJECT,
+    ResponseCacheTag.LECTURER,
+    ResponseCacheTag.DOCUMENT,
+    ResponseCacheTag.SEASON,
+)
 @response_decorator()
 def get_list_subjects(
     list_subjects_use_case: ListSubjectsUseCase = Depends(ListSubjectsUseCase),
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Query, Path
-from typing import Annotated
+from typing import Annotated, Optional
 from app.infra.security.security_service import get_current_active_admin
 from app.shared.decorator import response_decorator
 from app.domain.subject.subject_evaluation.entity import (
@@ -19,6 +19,7 @@ from app.use_cases.subject_evaluation.list import (
     ListSubjectEvaluationUseCase,
 )
 from app.domain.shared.enum import Sort
+from app.shared.utils.projection import validate_fields
 
 router = APIRouter()
 
@@ -73,10 +74,12 @@ def get_all_subject_evaluation(
     search: str | None = Query(None, title="Search"),
     sort: Sort = Sort.ASCE,
     sort_by: str = "numerical_order",
+    fields: Optional[list[str]] = Query(None, title="Fields of the evaluations, default to all"),
     list_subject_evaluation_use_case: ListSubjectEvaluationUseCase = Depends(
         ListSubjectEvaluationUseCase
     ),
 ):
+    validate_fields(fields, SubjectEvaluationAdmin)
     sort_query = {sort_by: 1 if sort is sort.ASCE else -1}
     req_object = ListSubjectEvaluationRequestObject.builder(
         page_index=page_index,
@@ -84,6 +87,7 @@ def get_all_subject_evaluation(
         search=search,
         sort=sort_query,
         subject_id=subject_id,
+        fields=fields,
     )
     response = list_subject_evaluation_use_case.execute(request_object=req_object)
     return response
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Body, Depends, Path
 from app.domain.shared.enum import AdminRole
 from app.infra.security.security_service import authorization, get_current_active_admin
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 
 from app.models.admin import AdminModel
 from app.shared.constant import SUPER_ADMIN
@@ -55,6 +56,7 @@ def create_subject_evaluation_question(
     dependencies=[Depends(get_current_active_admin)],
     response_model=SubjectEvaluationQuestion,
 )
+@cache_response(ResponseCacheTag.SUBJECT_EVALUATION_QUESTION)
 @response_decorator()
 def get_subject_evaluation_question(
     subject_id: str = Path(..., title="Subject id"),
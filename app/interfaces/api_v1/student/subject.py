@@ -5,6 +5,7 @@ from app.domain.subject.entity import Subject, SubjectInStudent
 from app.domain.shared.enum import Sort
 from app.infra.security.security_service import get_current_student
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 from app.use_cases.student_endpoint.subject.get import (
     GetSubjectStudentCase,
     GetSubjectStudentRequestObject,
@@ -24,6 +25,7 @@ router = APIRouter()
     dependencies=[Depends(get_current_student)],
     response_model=SubjectInStudent,
 )
+@cache_response(ResponseCacheTag.SUBJECT, ResponseCacheTag.LECTURER, ResponseCacheTag.DOCUMENT)
 @response_decorator()
 def get_subject_by_id(
     subject_id: str = Path(..., title="Subject id"),
@@ -35,6 +37,7 @@ def get_subject_by_id(
 
 
 @router.get("", response_model=list[SubjectInStudent])
+@cache_response(ResponseCacheTag.SUBJECT, ResponseCacheTag.LECTURER, ResponseCacheTag.DOCUMENT)
 @response_decorator()
 def get_list_subjects(
     list_subjects_use_case: ListSubjectsStudentUseCase = Depends(ListSubjectsStudentUseCase),
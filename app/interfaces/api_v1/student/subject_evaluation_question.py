@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Path
 
 from app.infra.security.security_service import get_current_student
 from app.shared.decorator import response_decorator
+from app.infra.response_cache import ResponseCacheTag, cache_response
 
 from app.domain.subject.subject_evaluation.entity import SubjectEvaluationQuestion
 from app.use_cases.subject_evaluation_question.get import (
@@ -17,6 +18,7 @@ router = APIRouter()
     dependencies=[Depends(get_current_student)],
     response_model=SubjectEvaluationQuestion,
 )
+@cache_response(ResponseCacheTag.SUBJECT_EVALUATION_QUESTION)
 @response_decorator()
 def get_subject_evaluation_question(
     subject_id: str = Path(..., title="Subject id"),
@@ -5,6 +5,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from app.interfaces.api import api_router
 from app.config import settings, database
+from app.infra.audit_log.audit_log_writer import audit_log_writer
 from app.interfaces.error_handler import (
     ApplicationLevelException,
 )
@@ -24,8 +25,10 @@ docs_paths = (
 async def lifespan(app: FastAPI):
     # Startup logic
     database.connect()
+    audit_log_writer.replay_journal()
     yield
     # Shutdown logic
+    audit_log_writer.close()
     database.disconnect()
 
 
@@ -1,8 +1,12 @@
 from datetime import datetime, timezone
-from mongoengine import Document, StringField, DateTimeField, IntField, ListField, ReferenceField
+from mongoengine import StringField, DateTimeField, IntField, ListField, ReferenceField
 
+from app.models.searchable import SearchableModel
+
+
+class DocumentModel(SearchableModel):
+    search_fields = ("name",)
 
-class DocumentModel(Document):
     file_id = StringField(required=True)
     mimeType = StringField()
     name = StringField(required=True)
@@ -36,7 +40,7 @@ class DocumentModel(Document):
 
     meta = {
         "collection": "Documents",
-        "indexes": ["file_id", "type", "season"],
+        "indexes": ["file_id", "type", "season", "search_tokens"],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -0,0 +1,38 @@
+from mongoengine import Document, StringField, EmailField, DateTimeField, IntField, EnumField
+
+from app.domain.email_delivery.enum import EmailDeliveryStatus
+
+
+class EmailDeliveryModel(Document):
+    """Delivery status of a transactional email (Brevo template) to one recipient"""
+
+    email = EmailField(required=True)
+    template_id = IntField(required=True)
+    # what the email is about, e.g. the subject id of a notification
+    ref = StringField(required=True)
+    status = EnumField(EmailDeliveryStatus, required=True)
+    message_id = StringField()
+    error = StringField()
+    attempts = IntField(default=0)
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+
+    @classmethod
+    def from_mongo(cls, data: dict, id_str=False):
+        """We must convert _id into "id"."""
+        if not data:
+            return data
+        id = data.pop("_id", None) if not id_str else str(data.pop("_id", None))
+        if "_cls" in data:
+            data.pop("_cls", None)
+        return cls(**dict(data, id=id))
+
+    meta = {
+        "collection": "EmailDeliveries",
+        "indexes": [
+            {"fields": ["ref", "template_id", "email"], "unique": True},
+            "status",
+        ],
+        "allow_inheritance": True,
+        "index_cls": False,
+    }
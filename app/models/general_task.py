@@ -1,6 +1,5 @@
 from datetime import datetime, timezone
 from mongoengine import (
-    Document,
     StringField,
     DateTimeField,
     IntField,
@@ -9,8 +8,12 @@ from mongoengine import (
     DateField,
 )
 
+from app.models.searchable import SearchableModel
+
+
+class GeneralTaskModel(SearchableModel):
+    search_fields = ("title",)
 
-class GeneralTaskModel(Document):
     title = StringField(required=True)
     short_desc = StringField()
     description = StringField(required=True)
@@ -46,7 +49,7 @@ class GeneralTaskModel(Document):
 
     meta = {
         "collection": "GeneralTasks",
-        "indexes": ["title", "short_desc", "end_at"],
+        "indexes": ["title", "short_desc", "end_at", "search_tokens"],
         "allow_inheritance": True,
         "index_cls": False,
     }
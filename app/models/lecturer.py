@@ -1,8 +1,12 @@
 from datetime import datetime, timezone
-from mongoengine import Document, StringField, DateTimeField, ListField, IntField
+from mongoengine import StringField, DateTimeField, ListField, IntField
 
+from app.models.searchable import SearchableModel
+
+
+class LecturerModel(SearchableModel):
+    search_fields = ("holy_name", "full_name")
 
-class LecturerModel(Document):
     title = StringField(required=True)
     holy_name = StringField()
     full_name = StringField(required=True)
@@ -32,7 +36,7 @@ class LecturerModel(Document):
 
     meta = {
         "collection": "Lecturers",
-        "indexes": ["full_name", "holy_name"],
+        "indexes": ["full_name", "holy_name", "search_tokens"],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from mongoengine import (
+    Document,
+    EmbeddedDocument,
+    EmbeddedDocumentListField,
+    ReferenceField,
+    ObjectIdField,
+    BooleanField,
+    StringField,
+    IntField,
+    DateTimeField,
+    EnumField,
+)
+
+from app.domain.absent.enum import AbsentType
+
+
+class SubjectRollCallState(EmbeddedDocument):
+    subject = ObjectIdField(required=True)
+    attend_zoom = BooleanField(default=False)
+    evaluation = BooleanField(default=False)
+    absent_type = EnumField(AbsentType)
+    result = StringField()
+
+
+class RollCallSummaryModel(Document):
+    """Materialized roll call results of a student in a season, only for completed subjects."""
+
+    student = ReferenceField("StudentModel", required=True)
+    season = IntField(required=True)
+    subjects = EmbeddedDocumentListField(SubjectRollCallState)
+    subject_completed = IntField(default=0)
+    subject_not_completed = IntField(default=0)
+    subject_registered = IntField(default=0)
+
+    updated_at = DateTimeField()
+
+    @classmethod
+    def from_mongo(cls, data: dict, id_str=False):
+        """We must convert _id into "id"."""
+        if not data:
+            return data
+        id = data.pop("_id", None) if not id_str else str(data.pop("_id", None))
+        if "_cls" in data:
+            data.pop("_cls", None)
+        return cls(**dict(data, id=id))
+
+    def save(self, *args, **kwargs):
+        self.updated_at = datetime.now(timezone.utc)
+        return super(RollCallSummaryModel, self).save(*args, **kwargs)
+
+    meta = {
+        "collection": "RollCallSummary",
+        "indexes": [{"fields": ["student", "season"], "unique": True}, "season"],
+        "allow_inheritance": True,
+        "index_cls": False,
+    }
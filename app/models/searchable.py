@@ -0,0 +1,81 @@
+from typing import Any, Iterable
+
+from bson import ObjectId
+from mongoengine import Document, IntField, ListField, StringField
+from pymongo import UpdateOne
+
+from app.shared.utils.search import get_search_index
+
+REBUILD_BATCH_SIZE = 500
+
+
+class SearchableModel(Document):
+    """Document searched with search_match (see app.shared.utils.search)
+
+    The subclasses list their searchable fields in `search_fields`, and add "search_tokens" to
+    their indexes. The search index is kept at each save(), the repositories updating these
+    fields with update_one() or raw writes add the one of get_search_index().
+    """
+
+    search_fields: tuple[str, ...] = ()
+
+    search_words = ListField(StringField())
+    search_tokens = ListField(StringField())
+    # relevance to a search, only set by the list aggregations (never stored)
+    search_score = IntField()
+
+    meta = {"abstract": True}
+
+    @classmethod
+    def get_search_index(cls, values: dict[str, Any]) -> dict[str, list[str]]:
+        """search_words and search_tokens of a document with these (raw) values"""
+        return get_search_index(*(values.get(field) for field in cls.search_fields))
+
+    @classmethod
+    def get_updated_search_index(
+        cls, id: ObjectId | str, data: dict[str, Any]
+    ) -> dict[str, list[str]]:
+        """Search index of the document `id` after the update `data`, {} when it is kept"""
+        if not any(field in data for field in cls.search_fields):
+            return {}
+        current = cls._get_collection().find_one(
+            {"_id": ObjectId(id)}, dict.fromkeys(cls.search_fields, 1)
+        )
+        return cls.get_search_index({**(current or {}), **data})
+
+    def set_search_index(self) -> None:
+        index = self.get_search_index({field: getattr(self, field) for field in self.search_fields})
+        self.search_words = index["search_words"]
+        self.search_tokens = index["search_tokens"]
+        self.search_score = None
+
+    def save(self, *args, **kwargs):
+        self.set_search_index()
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def rebuild_search_index(cls) -> int:
+        """Backfill the search index of every document, return the number of documents"""
+        collection = cls._get_collection()
+        count = 0
+        for batch in _batched(collection.find({}, dict.fromkeys(cls.search_fields, 1))):
+            collection.bulk_write(
+                [
+                    UpdateOne({"_id": doc["_id"]}, {"$set": cls.get_search_index(doc)})
+                    for doc in batch
+                ],
+                ordered=False,
+            )
+            count += len(batch)
+        return count
+
+
+def _batched(docs: Iterable[dict]) -> Iterable[list[dict]]:
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) == REBUILD_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,6 +1,5 @@
 import datetime
 from mongoengine import (
-    Document,
     StringField,
     EmailField,
     DateTimeField,
@@ -12,6 +11,7 @@ from mongoengine import (
 )
 
 from app.shared.common_exception import CustomException
+from app.models.searchable import SearchableModel
 
 
 class SeasonInfo(EmbeddedDocument):
@@ -20,7 +20,9 @@ class SeasonInfo(EmbeddedDocument):
     season = IntField(required=True)
 
 
-class StudentModel(Document):
+class StudentModel(SearchableModel):
+    search_fields = ("holy_name", "full_name", "diocese")
+
     seasons_info = EmbeddedDocumentListField(SeasonInfo)
     email = EmailField(required=True, unique=True)
 
@@ -97,6 +99,7 @@ class StudentModel(Document):
         "indexes": [
             "email",
             "status",
+            "search_tokens",
             {"fields": ("seasons_info.numerical_order", "seasons_info.season"), "unique": True},
         ],
         "allow_inheritance": True,
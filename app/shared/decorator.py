@@ -3,10 +3,9 @@ import time
 import random
 import logging
 from fastapi import HTTPException
-from fastapi.encoders import jsonable_encoder
-from starlette.responses import JSONResponse
 
 from app.interfaces.error_handler import ApplicationLevelException
+from app.shared.json_response import FastJSONResponse
 from app.shared.response_object import ResponseSuccess, ResponseFailure
 
 
@@ -27,7 +26,7 @@ def response_decorator():
             if isinstance(response, ResponseSuccess):
                 # handle response success object
                 val = response.value
-                return JSONResponse(content=jsonable_encoder(val, by_alias=True))
+                return FastJSONResponse(content=val)
                 # return response.value
             elif isinstance(response, ResponseFailure):
                 # handle response failure error
@@ -56,7 +55,7 @@ def response_decorator():
                     # System error http status code
                     raise HTTPException(status_code=500, detail=response.message)
             else:
-                return JSONResponse(content=jsonable_encoder(response))
+                return FastJSONResponse(content=response)
 
         return wrapper
 
@@ -0,0 +1,56 @@
+"""JSON responses of the use cases, serialized straight to bytes
+
+`JSONResponse(content=jsonable_encoder(value))` walks the pydantic models into dicts, then
+encodes them again with the stdlib json: a roll call page (300 students x their subjects) or
+a 500 rows list spends most of its time there. A model is instead dumped to bytes by
+pydantic-core (model_dump_json, the same serializers as jsonable_encoder), and the other
+values (lists of models, dicts) by orjson, which hands the models to pydantic.
+
+The documents are the same as before; only the spelling of some floats differs (1e-05 vs
+1e-5), and NaN/inf are sent as null instead of failing. A value neither can serialize falls
+back to jsonable_encoder. See benchmarks.json_response for the comparison of both paths.
+"""
+
+import logging
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    # sets, Decimal, ... encoded as before
+    return jsonable_encoder(value, by_alias=True)
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Raises:
+        TypeError: `content` cannot be serialized (orjson.JSONEncodeError is a TypeError)
+        PydanticSerializationError: a field of a model cannot be serialized
+    """
+    if isinstance(content, BaseModel):
+        # model_dump_json, without decoding the bytes to a str
+        return content.__pydantic_serializer__.to_json(content, by_alias=True)
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def render_json_compat(content: Any) -> bytes:
+    """The former path: jsonable_encoder, then the stdlib json of JSONResponse"""
+    return JSONResponse(content=jsonable_encoder(content, by_alias=True)).body
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        try:
+            return render_json(content)
+        except (TypeError, PydanticSerializationError) as ex:
+            logger.warning(f"Fast JSON serialization failed ({ex}), using jsonable_encoder")
+            return render_json_compat(content)
@@ -6,6 +6,7 @@ from app.shared import response_object as res, request_object as req
 
 from app.infra.logging import get_logger
 from app.config import settings
+from app.shared.utils.pagination import InvalidCursor
 
 logger = get_logger()
 
@@ -39,6 +40,8 @@ class UseCase:
             if not (result or isinstance(result, res.ResponseSuccess)):
                 return result
             return res.ResponseSuccess(result)
+        except InvalidCursor as exc:
+            return res.ResponseFailure.build_parameters_error(str(exc))
         except Exception as exc:
             print(traceback.format_exc())
             if IS_PRODUCTION:
@@ -1,18 +1,29 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
+from threading import Lock
 from fastapi import HTTPException
 from typing import Optional, Union, Tuple
 import calendar
+import hashlib
 import re
+import uuid
 import pytz
+from bson import json_util
+from cachetools import TTLCache
 from redis import Redis
 from app.config import settings
 from app.config.redis import get_redis_client
+from app.infra.invalidation_listener import InvalidationListener
 from app.infra.season.season_repository import SeasonRepository
 
 TTL_30_DAYS = 60 * 60 * 24 * 30
 TTL_5_DAYS = 60 * 60 * 24 * 5
 
+CURRENT_SEASON_REDIS_KEY = "season"
+CURRENT_SEASON_CHANNEL = "season:invalidate"
+_current_season_cache = TTLCache(maxsize=1, ttl=max(settings.CURRENT_SEASON_CACHE_TTL, 1))
+_current_season_lock = Lock()
+
 
 class ExtendedEnum(Enum):
     """
@@ -103,11 +114,49 @@ def extract_id_spreadsheet_from_url(url: str) -> str:
 
 
 def get_current_season_value() -> int:
+    if _current_season_cache_enabled():
+        _current_season_listener.start()
+        with _current_season_lock:
+            season = _current_season_cache.get(CURRENT_SEASON_REDIS_KEY)
+        if season is not None:
+            return season
+
+    redis_client: Redis = get_redis_client()
+    season = redis_client.get(CURRENT_SEASON_REDIS_KEY)
+    if season is None:
+        season = SeasonRepository().get_current_season().season
+        redis_client.setex(CURRENT_SEASON_REDIS_KEY, TTL_30_DAYS, season)
+    season = int(season)
+
+    if _current_season_cache_enabled():
+        with _current_season_lock:
+            _current_season_cache[CURRENT_SEASON_REDIS_KEY] = season
+    return season
+
+
+def invalidate_current_season_cache() -> None:
+    """Drop the cached current season in Redis and in the memory of every process"""
+    _clear_current_season_cache()
     redis_client: Redis = get_redis_client()
-    if not redis_client.exists("season"):
-        season: int = SeasonRepository().get_current_season().season
-        redis_client.setex("season", TTL_30_DAYS, season)
-    return int(redis_client.get("season"))
+    redis_client.delete(CURRENT_SEASON_REDIS_KEY)
+    redis_client.publish(CURRENT_SEASON_CHANNEL, "invalidate")
+
+
+def _current_season_cache_enabled() -> bool:
+    return settings.CURRENT_SEASON_CACHE_TTL > 0
+
+
+def _clear_current_season_cache() -> None:
+    with _current_season_lock:
+        _current_season_cache.clear()
+
+
+_current_season_listener = InvalidationListener(
+    CURRENT_SEASON_CHANNEL,
+    on_message=lambda _: _clear_current_season_cache(),
+    on_reset=_clear_current_season_cache,
+    name="current-season-listener",
+)
 
 
 def clear_all_cache():
@@ -178,6 +227,18 @@ def get_ttl_until_midnight():
     return max(int(ttl), 1)
 
 
+def get_today() -> date:
+    """Today in the time zone of the application"""
+    return datetime.now(pytz.timezone(settings.TIMEZONE)).date()
+
+
+def get_ttl_until_end_of(day: date) -> int:
+    """Seconds until the end of `day` in the time zone of the application"""
+    tz = pytz.timezone(settings.TIMEZONE)
+    end = tz.localize(datetime.combine(day + timedelta(days=1), datetime.min.time()))
+    return max(int((end - datetime.now(tz)).total_seconds()), 1)
+
+
 def get_dict_exclude_field(d: dict, excluded_keys: list[str]) -> dict:
     return {k: v for k, v in d.items() if k not in excluded_keys}
 
@@ -185,3 +246,58 @@ def get_dict_exclude_field(d: dict, excluded_keys: list[str]) -> dict:
 def get_subject_extra_emails_redis_key(subject_id: str) -> str:
     """Generate Redis key for storing subject extra emails"""
     return f"subject:extra_emails:{subject_id}"
+
+
+def get_daily_bible_redis_key(day: date) -> str:
+    """Generate Redis key for storing the gospel of a day"""
+    return f"daily-bible-quotes:{day.isoformat()}"
+
+
+def get_daily_bible_lock_redis_key(day: date) -> str:
+    """Generate Redis key of the lock held while fetching the gospel of a day"""
+    return f"daily-bible-quotes:lock:{day.isoformat()}"
+
+
+def get_roll_call_season_token_redis_key(season: int | str) -> str:
+    """Generate Redis key of the generation token of the cached roll call results of a season"""
+    return f"roll-call:season:{season}:token"
+
+
+def get_roll_call_season_token(season: int | str, redis_client: Optional[Redis] = None) -> str:
+    """Generation token of the cached roll call results of a season, created on first use"""
+    redis_client = redis_client or get_redis_client()
+    key = get_roll_call_season_token_redis_key(season)
+    token = redis_client.get(key)
+    if token is None:
+        # another process may race us
+        redis_client.set(key, uuid.uuid4().hex, nx=True)
+        token = redis_client.get(key)
+    return token.decode() if isinstance(token, bytes) else token
+
+
+def get_student_roll_call_redis_key(student_id: str, season: int | str, token: str) -> str:
+    """Generate Redis key for storing roll call results of a student in a season, under the
+    generation token of the season (see get_roll_call_season_token)"""
+    return f"roll-call:student:{student_id}:{season}:{token}"
+
+
+def clear_student_roll_call_cache(season: int, student_ids: Optional[list] = None) -> None:
+    """Drop cached roll call results of the given students, or of every student in the season
+
+    The whole season is dropped by replacing its generation token: the results cached under
+    the former one are never read again, and expire after ROLL_CALL_CACHE_TTL.
+    """
+    redis_client: Redis = get_redis_client()
+    if student_ids is None:
+        redis_client.set(get_roll_call_season_token_redis_key(season), uuid.uuid4().hex)
+        return
+    token = get_roll_call_season_token(season, redis_client)
+    keys = [get_student_roll_call_redis_key(str(id), season, token) for id in student_ids]
+    if keys:
+        redis_client.delete(*keys)
+
+
+def get_list_total_redis_key(collection: str, match_pipeline: Optional[dict]) -> str:
+    """Generate Redis key for storing the total of a list, by collection and normalized filter"""
+    normalized = json_util.dumps(match_pipeline or {}, sort_keys=True)
+    return f"list-total:{collection}:{hashlib.sha1(normalized.encode()).hexdigest()}"
@@ -0,0 +1,143 @@
+"""Keyset (cursor) pagination of the list endpoints
+
+`$skip` walks every skipped document, so a deep page of a big collection (Logs, celery
+results) costs as much as reading all the pages before it. In cursor mode the client sends
+back the opaque `after` token of the previous page instead of a page_index: the token holds
+the sort values and the `_id` of the last document, and the next page is a range `$match` on
+the sort key (backed by its index) followed by a `$limit`. `_id` is appended to the sort as
+the tie breaker, so documents with the same sort value are neither repeated nor skipped.
+The sort keys must be single valued: an array is sorted by its min/max element, which a
+range `$match` does not follow.
+
+Example:
+    pipeline.extend(paginate_pipeline(sort, page_index, page_size, after=after))
+    ...
+    pagination.next_cursor = next_cursor(sort, docs, page_size)
+"""
+
+import base64
+import binascii
+from datetime import date, datetime, time
+from typing import Any
+
+from bson import json_util
+from bson.errors import InvalidBSON
+from mongoengine import Document
+from mongoengine.base import BaseDocument
+
+
+class InvalidCursor(ValueError):
+    """The `after` token is malformed or was issued for another sort"""
+
+
+def keyset_sort(sort: dict[str, int]) -> dict[str, int]:
+    """`sort` with `_id` as the tie breaker, in the direction of the last key"""
+    if "_id" in sort:
+        return dict(sort)
+    return {**sort, "_id": list(sort.values())[-1] if sort else 1}
+
+
+def _get_value(doc: dict | BaseDocument, key: str) -> Any:
+    if key == "_id":
+        return doc.pk if isinstance(doc, Document) else doc.get("_id")
+    value = doc
+    for part in key.split("."):
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, BaseDocument):
+            # keys are the names in Mongo, a key of no field is null there
+            name = value._reverse_db_field_map.get(part)
+            value = getattr(value, name) if name else None
+        else:
+            return None
+    if isinstance(value, Document):
+        return value.pk
+    # DateField values are stored as datetimes
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, time())
+    return value
+
+
+def encode_cursor(sort: dict[str, int], doc: dict | BaseDocument) -> str:
+    """Token of the page after `doc` (the last document of a page)"""
+    sort = keyset_sort(sort)
+    payload = {"sort": list(sort.items()), "values": [_get_value(doc, key) for key in sort]}
+    return base64.urlsafe_b64encode(json_util.dumps(payload).encode()).decode()
+
+
+def decode_cursor(sort: dict[str, int], token: str) -> list[Any]:
+    """Sort values of the last document of the previous page
+
+    Raises:
+        InvalidCursor: malformed token, or issued for another sort
+    """
+    try:
+        payload = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+        issued_sort, values = payload["sort"], payload["values"]
+    except (binascii.Error, InvalidBSON, ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor")
+    sort = keyset_sort(sort)
+    if [list(item) for item in sort.items()] != issued_sort or len(values) != len(sort):
+        raise InvalidCursor("The cursor was issued for another sort")
+    return values
+
+
+def _after_condition(key: str, direction: int, value: Any) -> dict | None:
+    # nulls (and missing fields) sort before any value
+    if value is None:
+        return {key: {"$ne": None}} if direction == 1 else None
+    if direction == 1:
+        return {key: {"$gt": value}}
+    # $not keeps the nulls, which come after the values in a descending sort
+    return {key: {"$not": {"$gte": value}}}
+
+
+def keyset_match(sort: dict[str, int], values: list[Any]) -> dict:
+    """Documents after `values` in the order of `sort`"""
+    sort = keyset_sort(sort)
+    keys = list(sort.items())
+    branches = []
+    for i, (key, direction) in enumerate(keys):
+        condition = _after_condition(key, direction, values[i])
+        if condition is None:
+            continue
+        branches.append({**{k: values[j] for j, (k, _) in enumerate(keys[:i])}, **condition})
+    if not branches:
+        # nothing sorts after the last document
+        return {"_id": {"$exists": False}}
+    return branches[0] if len(branches) == 1 else {"$or": branches}
+
+
+def paginate_pipeline(
+    sort: dict[str, int],
+    page_index: int | None = 1,
+    page_size: int | None = None,
+    after: str | None = None,
+) -> list[dict]:
+    """$sort and pagination stages of a list: after the `after` cursor, else at page_index
+
+    Both modes sort on the same keys, so the cursor of a page_index page can be followed.
+
+    Raises:
+        InvalidCursor: see decode_cursor
+    """
+    if after is None:
+        stages: list[dict] = [{"$sort": keyset_sort(sort)}]
+        if page_size:
+            stages.extend([{"$skip": page_size * ((page_index or 1) - 1)}, {"$limit": page_size}])
+        return stages
+
+    stages = [
+        {"$match": keyset_match(sort, decode_cursor(sort, after))},
+        {"$sort": keyset_sort(sort)},
+    ]
+    if page_size:
+        stages.append({"$limit": page_size})
+    return stages
+
+
+def next_cursor(sort: dict[str, int], docs: list, page_size: int | None) -> str | None:
+    """Token of the next page, None on the last one"""
+    if not page_size or len(docs) < page_size:
+        return None
+    return encode_cursor(sort, docs[-1])
@@ -0,0 +1,31 @@
+"""Projection of the list endpoints on the fields asked by the client
+
+A table showing a few columns asks them with `fields=`, the other fields (long texts,
+password hashes) are neither read from Mongo nor validated. The items of such a page are
+partial (see partial_model): the fields not asked are left out of the response rather than
+sent as nulls.
+"""
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+
+def validate_fields(fields: list[str] | None, entity: type[BaseModel]) -> None:
+    """
+    Raises:
+        HTTPException: 400, a field is not one of `entity`
+    """
+    invalid = set(fields or []) - set(entity.model_fields)
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid fields: {', '.join(sorted(invalid))}")
+
+
+def get_projection(fields: list[str] | None, sort: dict[str, int] | None = None) -> dict | None:
+    """$project of `fields` (and of the sort keys, read by the cursor), None for every field"""
+    if not fields:
+        return None
+    projection = {field: 1 for field in fields if field != "id"}
+    for key in sort or {}:
+        projection.setdefault(key.split(".")[0], 1)
+    # _id is always projected, an empty $project is rejected
+    return projection or {"_id": 1}
@@ -0,0 +1,92 @@
+"""Diacritic-insensitive search on names and titles
+
+An unanchored case-insensitive `$regex` scans the whole collection, and "nguyen" does not
+match "Nguyễn". The searchable fields of a document are folded at write time (accents and
+case removed, "đ" -> "d") into:
+- `search_words`: the folded words, for the relevance of a result
+- `search_tokens`: every prefix of these words (edge n-grams), with a multikey index
+
+A search matches the documents having a token for each of its words (`$all`, backed by the
+index), i.e. each word of the search starts a word of the document. Results are ordered by
+`search_score`, the number of words of the search which are whole words of the document,
+then by the sort asked.
+
+Example:
+    match_pipeline = {**match_pipeline, **search_match(search)}
+    sort = search_sort(sort, search)
+    pipeline.extend(search_stages(search) + paginate_pipeline(sort, ...))
+"""
+
+import re
+import unicodedata
+
+# prefixes are cut there, a longer word of a search matches on its first characters
+MAX_TOKEN_LENGTH = 15
+
+SEARCH_SCORE = "search_score"
+
+_NOT_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def fold(text: str | None) -> str:
+    """`text` without accents nor case: "Nguyễn Văn Đức" -> "nguyen van duc" """
+    if not text:
+        return ""
+    text = text.lower().replace("đ", "d")
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def get_words(text: str | None) -> list[str]:
+    """Folded words of `text`, without duplicates, in order"""
+    return list(dict.fromkeys(word for word in _NOT_WORD.split(fold(text)) if word))
+
+
+def get_search_index(*values: str | None) -> dict[str, list[str]]:
+    """`search_words` and `search_tokens` of a document, from its searchable values"""
+    words = get_words(" ".join(value for value in values if value))
+    tokens = dict.fromkeys(
+        word[:length] for word in words for length in range(1, min(len(word), MAX_TOKEN_LENGTH) + 1)
+    )
+    return {"search_words": words, "search_tokens": list(tokens)}
+
+
+def _get_search_words(search: str | None) -> list[str]:
+    return [word[:MAX_TOKEN_LENGTH] for word in get_words(search)]
+
+
+def search_match(search: str | None) -> dict:
+    """$match of the documents having a word starting with each word of `search`
+
+    Empty for a search without words (only punctuation), which filters nothing.
+    """
+    words = _get_search_words(search)
+    return {"search_tokens": {"$all": words}} if words else {}
+
+
+def search_stages(search: str | None) -> list[dict]:
+    """$addFields of the relevance (search_score) of the documents to `search`"""
+    words = get_words(search)
+    if not words:
+        return []
+    return [
+        {
+            "$addFields": {
+                SEARCH_SCORE: {
+                    "$size": {
+                        "$filter": {
+                            "input": {"$ifNull": ["$search_words", []]},
+                            "cond": {"$in": ["$$this", words]},
+                        }
+                    }
+                }
+            }
+        }
+    ]
+
+
+def search_sort(sort: dict[str, int] | None, search: str | None) -> dict[str, int] | None:
+    """`sort` after the relevance, when there is a search"""
+    if not get_words(search):
+        return sort
+    return {SEARCH_SCORE: -1, **(sort or {})}
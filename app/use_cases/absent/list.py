@@ -1,14 +1,11 @@
 from bson import ObjectId
 from fastapi import Depends
 from app.shared import request_object, use_case
-from app.domain.subject.entity import SubjectInDB
-from app.domain.lecturer.entity import LecturerInDB
 from app.infra.absent.absent_repository import AbsentRepository
 from app.models.absent import AbsentModel
-from app.domain.absent.entity import AbsentInDB, AdminAbsentInResponse
-from app.domain.student.entity import Student, StudentInDB
+from app.domain.absent.entity import ADMIN_ABSENT_ADAPTER
 from app.infra.subject.subject_repository import SubjectRepository
-from app.domain.subject.subject_evaluation.entity import LecturerInEvaluation, SubjectInEvaluation
+from app.infra.dereference import select_related_raw
 
 
 class ListAbsentRequestObject(request_object.ValidRequestObject):
@@ -37,20 +34,9 @@ class ListAbsentUseCase(use_case.UseCase):
         self.subject_repository = subject_repository
 
     def process_request(self, req_object: ListAbsentRequestObject):
-        absents: list[AbsentModel] = self.absent_repository.list(
-            match_pipeline={"subject": ObjectId(req_object.subject_id)}
+        absents: list[dict] = self.absent_repository.list(
+            match_pipeline={"subject": ObjectId(req_object.subject_id)}, raw=True
         )
+        select_related_raw(absents, AbsentModel, "subject.lecturer", "student")
 
-        return [
-            AdminAbsentInResponse(
-                **AbsentInDB.model_validate(absent).model_dump(exclude={"student", "subject"}),
-                subject=SubjectInEvaluation(
-                    **SubjectInDB.model_validate(absent.subject).model_dump(exclude=({"lecturer"})),
-                    lecturer=LecturerInEvaluation(
-                        **LecturerInDB.model_validate(absent.subject.lecturer).model_dump()
-                    ),
-                ),
-                student=Student(**StudentInDB.model_validate(absent.student).model_dump()),
-            )
-            for absent in absents
-        ]
+        return [ADMIN_ABSENT_ADAPTER.validate_python(absent) for absent in absents]
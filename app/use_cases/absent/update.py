@@ -1,11 +1,13 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from bson import ObjectId
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB
 from app.infra.subject.subject_repository import SubjectRepository
 from app.models.subject import SubjectModel
+from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.roll_call.roll_call_repository import RollCallRepository
 from app.models.student import StudentModel
-from app.shared.utils.general import get_current_season_value
+from app.shared.utils.general import clear_student_roll_call_cache, get_current_season_value
 from app.infra.manage_form.manage_form_repository import ManageFormRepository
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
@@ -72,19 +74,19 @@ class UpdateAbsentRequestObject(request_object.ValidRequestObject):
 class UpdateAbsentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         student_repository: StudentRepository = Depends(StudentRepository),
         absent_repository: AbsentRepository = Depends(AbsentRepository),
+        roll_call_repository: RollCallRepository = Depends(RollCallRepository),
     ):
         self.absent_repository = absent_repository
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
+        self.roll_call_repository = roll_call_repository
 
     def process_request(self, req_object: UpdateAbsentRequestObject):
         is_student_request = True
@@ -136,9 +138,15 @@ class UpdateAbsentUseCase(use_case.UseCase):
             id=absent.id, data=AbsentInUpdateTime(**req_object.payload.model_dump())
         )
         absent.reload()
+        if subject.status == StatusSubjectEnum.COMPLETED:
+            self.roll_call_repository.refresh_summaries(
+                season=current_season, student_ids=[req_object.current_student.id]
+            )
+        clear_student_roll_call_cache(
+            season=current_season, student_ids=[req_object.current_student.id]
+        )
         if not is_student_request:
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.UPDATE,
                     endpoint=Endpoint.ABSENT,
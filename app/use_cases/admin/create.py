@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.infra.security.security_service import generate_random_password, get_password_hash
 from app.shared import request_object, use_case, response_object
@@ -43,13 +43,11 @@ class CreateAdminRequestObject(request_object.ValidRequestObject):
 class CreateAdminUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         admin_repository: AdminRepository = Depends(AdminRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.admin_repository = admin_repository
         self.audit_log_repository = audit_log_repository
-        self.background_tasks = background_tasks
 
     def process_request(self, req_object: CreateAdminRequestObject):
         admin_in: AdminInCreate = req_object.admin_in
@@ -96,8 +94,7 @@ class CreateAdminUseCase(use_case.UseCase):
             is_admin=True,
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.ADMIN,
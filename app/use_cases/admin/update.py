@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.admin import AdminModel
 from app.shared import request_object, use_case, response_object
 
@@ -38,11 +38,9 @@ class UpdateAdminRequestObject(request_object.ValidRequestObject):
 class UpdateAdminUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         admin_repository: AdminRepository = Depends(AdminRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
-        self.background_tasks = background_tasks
         self.admin_repository = admin_repository
         self.audit_log_repository = audit_log_repository
 
@@ -58,8 +56,7 @@ class UpdateAdminUseCase(use_case.UseCase):
 
         if req_object.current_admin.id != admin.id:
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.UPDATE,
                     endpoint=Endpoint.ADMIN,
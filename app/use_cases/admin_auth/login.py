@@ -3,7 +3,7 @@ from fastapi import Depends
 from app.domain.auth.entity import LoginRequest, TokenData, AuthAdminInfoInResponse
 from app.domain.admin.entity import Admin, AdminInDB
 from app.models.admin import AdminModel
-from app.infra.security.security_service import verify_password, create_access_token
+from app.infra.security.security_service import verify_and_update_password, create_access_token
 from app.infra.admin.admin_repository import AdminRepository
 from app.shared import request_object, use_case, response_object
 
@@ -35,11 +35,16 @@ class LoginUseCase(use_case.UseCase):
         admin: AdminModel = self.admin_repository.get_by_email(req_object.login_payload.email)
         checker = False
         if admin:
-            checker = verify_password(req_object.login_payload.password, admin.password)
+            checker, new_hash = verify_and_update_password(
+                req_object.login_payload.password, admin.password
+            )
         if not admin or not checker:
             return response_object.ResponseFailure.build_parameters_error(
                 message="Sai email hoặc mật khẩu"
             )
+        if new_hash:
+            # hashed with another bcrypt cost than the current one
+            self.admin_repository.update(id=admin.id, data={"password": new_hash})
 
         admin_in_db = AdminInDB.model_validate(admin)
         if admin_in_db.disabled():
@@ -1,11 +1,13 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case
 from app.domain.audit_log.entity import AuditLog, AuditLogInDB, ManyAuditLogsInResponse
 from app.domain.shared.entity import Pagination
-from app.models.audit_log import AuditLogModel
+from app.shared.utils.pagination import next_cursor
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
+from app.infra.list_with_total import TotalMode
+from app.infra.dereference import select_related
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 from app.domain.admin.entity import Admin, AdminInDB
 
@@ -17,6 +19,7 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         page_size: int,
         search: Optional[str] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         type: Optional[AuditLogType] = None,
         endpoint: Optional[Endpoint] = None,
     ):
@@ -24,6 +27,7 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         self.page_size = page_size
         self.search = search
         self.sort = sort
+        self.after = after
         self.endpoint = endpoint
         self.type = type
 
@@ -34,6 +38,7 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         page_size: int,
         search: Optional[str] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         type: Optional[AuditLogType] = None,
         endpoint: Optional[Endpoint] = None,
     ):
@@ -42,6 +47,7 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
             page_size=page_size,
             search=search,
             sort=sort,
+            after=after,
             type=type,
             endpoint=endpoint,
         )
@@ -71,14 +77,15 @@ class ListAuditLogsUseCase(use_case.UseCase):
         if isinstance(req_object.endpoint, Endpoint):
             match_pipeline = {**match_pipeline, "endpoint": req_object.endpoint}
 
-        audit_logs: List[AuditLogModel] = self.audit_log_repository.list(
+        audit_logs, total = self.audit_log_repository.list_with_total(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
             sort=req_object.sort,
+            after=req_object.after,
             match_pipeline=match_pipeline,
+            total_mode=TotalMode.CACHED,
         )
-
-        total = self.audit_log_repository.count_list(match_pipeline=match_pipeline)
+        select_related(audit_logs, "author")
 
         data: Optional[list[AuditLog]] = []
         for log in audit_logs:
@@ -101,6 +108,7 @@ class ListAuditLogsUseCase(use_case.UseCase):
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor(req_object.sort, audit_logs, req_object.page_size),
             ),
             data=data,
         )
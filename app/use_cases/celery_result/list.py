@@ -1,5 +1,5 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case
 from app.domain.celery_result.entity import (
@@ -7,8 +7,9 @@ from app.domain.celery_result.entity import (
     CeleryResultResponse,
 )
 from app.domain.shared.entity import Pagination
-from app.models.celery_result import CeleryResultModel
+from app.shared.utils.pagination import next_cursor
 from app.infra.celery_result.celery_result_repository import CeleryResultRepository
+from app.infra.list_with_total import TotalMode
 from app.domain.celery_result.enum import CeleryResultTag
 
 
@@ -19,12 +20,14 @@ class ListCeleryResultsRequestObject(request_object.ValidRequestObject):
         page_size: int,
         name: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         tag: Optional[CeleryResultTag] = None,
         resolved: Optional[bool] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
         self.sort = sort
+        self.after = after
         self.name = name
         self.tag = tag
         self.resolved = resolved
@@ -36,6 +39,7 @@ class ListCeleryResultsRequestObject(request_object.ValidRequestObject):
         page_size: int,
         name: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         tag: Optional[CeleryResultTag] = None,
         resolved: Optional[bool] = None,
     ):
@@ -43,6 +47,7 @@ class ListCeleryResultsRequestObject(request_object.ValidRequestObject):
             page_index=page_index,
             page_size=page_size,
             sort=sort,
+            after=after,
             tag=tag,
             name=name,
             resolved=resolved,
@@ -70,15 +75,13 @@ class ListCeleryResultsUseCase(use_case.UseCase):
                 req_object.resolved if req_object.resolved else {"$in": [False, None]}
             )
 
-        celery_results: List[CeleryResultModel] = self.celery_result_repository.list(
+        celery_results, total = self.celery_result_repository.list_with_total(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
             sort=req_object.sort,
+            after=req_object.after,
             match_pipeline=match_pipeline if bool(match_pipeline) else None,
-        )
-
-        total = self.celery_result_repository.count_list(
-            match_pipeline=match_pipeline if bool(match_pipeline) else None
+            total_mode=TotalMode.CACHED,
         )
 
         return ManyCeleryResultsInResponse(
@@ -86,6 +89,7 @@ class ListCeleryResultsUseCase(use_case.UseCase):
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor(req_object.sort, celery_results, req_object.page_size),
             ),
             data=[
                 CeleryResultResponse(
@@ -1,5 +1,5 @@
 import json
-from fastapi import BackgroundTasks, Depends
+from fastapi import Depends
 from app.domain.audit_log.entity import AuditLogInDB
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
@@ -30,12 +30,10 @@ class MarkResolvedFailedRequestObject(request_object.ValidRequestObject):
 class MarkResolvedFailedUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         celery_result_repository: CeleryResultRepository = Depends(CeleryResultRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.celery_result_repository = celery_result_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: MarkResolvedFailedRequestObject):
@@ -58,8 +56,7 @@ class MarkResolvedFailedUseCase(use_case.UseCase):
             raise Exception("Something went wrong")
 
         current_season: int = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.CELERY_RESULT,
@@ -0,0 +1,17 @@
+from app.domain.celery_result.entity import CeleryQueueMetrics, CeleryQueuesInResponse
+from app.shared import request_object, use_case
+from celery_config.celery_worker import celery_app
+from celery_config.queue_metrics import get_queue_metrics
+
+
+class GetCeleryQueuesRequestObject(request_object.ValidRequestObject):
+    @classmethod
+    def builder(cls):
+        return GetCeleryQueuesRequestObject()
+
+
+class GetCeleryQueuesUseCase(use_case.UseCase):
+    def process_request(self, req_object: GetCeleryQueuesRequestObject):
+        return CeleryQueuesInResponse(
+            data=[CeleryQueueMetrics(**metrics) for metrics in get_queue_metrics(celery_app)]
+        )
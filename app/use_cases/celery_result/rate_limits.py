@@ -0,0 +1,16 @@
+from app.domain.celery_result.entity import RateLimitMetrics, RateLimitsInResponse
+from app.infra.services.rate_limiter import get_rate_limit_metrics
+from app.shared import request_object, use_case
+
+
+class GetRateLimitsRequestObject(request_object.ValidRequestObject):
+    @classmethod
+    def builder(cls):
+        return GetRateLimitsRequestObject()
+
+
+class GetRateLimitsUseCase(use_case.UseCase):
+    def process_request(self, req_object: GetRateLimitsRequestObject):
+        return RateLimitsInResponse(
+            data=[RateLimitMetrics(**metrics) for metrics in get_rate_limit_metrics()]
+        )
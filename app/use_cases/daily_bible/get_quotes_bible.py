@@ -1,100 +1,115 @@
-import json
 import logging
-import re
+import time
+import uuid
+from datetime import date, timedelta
+
 import requests
+from fastapi import BackgroundTasks, Depends
+from redis.exceptions import WatchError
+
 from app.config.redis import RedisDependency
 from app.domain.daily_bible.entity import DailyBibleResponse
-from app.domain.daily_bible.enum import LiturgicalSeason
+from app.infra.services.daily_bible_api import MAX_FETCH_SECONDS, DailyBibleAPIService
 from app.shared import response_object, use_case
-from app.shared.utils.general import get_ttl_until_midnight
+from app.shared.utils.general import (
+    get_daily_bible_lock_redis_key,
+    get_daily_bible_redis_key,
+    get_today,
+    get_ttl_until_end_of,
+)
 
 logger = logging.getLogger(__name__)
 
-URL = "https://ktcgkpv.org/readings/mass-reading"
-HEADERS = {
-    "X-Requested-With": "XMLHttpRequest",
-    "Content-Type": "text/plain",
-}
-PAYLOAD = "seldate="
+# seconds a refresh may hold the lock, longer than the worst case of the upstream call
+REFRESH_LOCK_TTL = int(MAX_FETCH_SECONDS) + 15
+# how long a request without any cached value waits for a concurrent refresh
+REFRESH_WAIT_SECONDS = 5
 
 
 class GetQuotesBibleUseCase(use_case.UseCase):
-    def __init__(self, redis_client: RedisDependency):
+    def __init__(
+        self,
+        redis_client: RedisDependency,
+        background_tasks: BackgroundTasks,
+        daily_bible_api_service: DailyBibleAPIService = Depends(DailyBibleAPIService),
+    ):
         self.redis_client = redis_client
+        self.background_tasks = background_tasks
+        self.daily_bible_api_service = daily_bible_api_service
 
     def process_request(self):
-        if not self.redis_client.exists("daily-bible-quotes"):
-            try:
-                response = self._fetch_data()
-                if response.status_code == 200:
-                    self._cache_response(response.json())
-                else:
-                    return response_object.ResponseFailure.build_not_found_error(
-                        message="Not found"
-                    )
-            except requests.RequestException as e:
-                return response_object.ResponseFailure.build_system_error(message=str(e))
-            except (KeyError, ValueError):
-                return response_object.ResponseFailure.build_system_error(
-                    message="Invalid response format"
-                )
-        return DailyBibleResponse(**json.loads(self.redis_client.get("daily-bible-quotes")))
+        today = get_today()
+        cached = self.redis_client.get(get_daily_bible_redis_key(today))
+        if cached:
+            return DailyBibleResponse.model_validate_json(cached)
 
-    def _fetch_data(self):
-        return requests.post(URL, headers=HEADERS, data=PAYLOAD)
+        # Single flight: only the owner of the lock calls the upstream, the others serve
+        # yesterday's reading meanwhile
+        stale = self.redis_client.get(get_daily_bible_redis_key(today - timedelta(days=1)))
+        # the token of the owner, so that it never releases a lock taken by another worker
+        token = uuid.uuid4().hex
+        if not self.redis_client.set(
+            get_daily_bible_lock_redis_key(today), token, nx=True, ex=REFRESH_LOCK_TTL
+        ):
+            if stale:
+                return DailyBibleResponse.model_validate_json(stale)
+            return self._wait_for_refresh(today)
 
-    def _cache_response(self, data):
-        resp = data["data"]["mass_reading"][0]
-
-        season_key = resp["date_info"]["season"]
-        season_value = LiturgicalSeason[season_key].value  # Map key to value
+        if stale:
+            self.background_tasks.add_task(self._refresh, today, token)
+            return DailyBibleResponse.model_validate_json(stale)
+        return self._refresh(today, token)
 
+    def _refresh(self, day: date, token: str):
+        """Fetch and cache the reading of `day`, then release the lock"""
         try:
-            cache_data = json.dumps(
-                DailyBibleResponse(
-                    epitomize_text=resp["gospel"][0]["INDEXING"],
-                    gospel_ref=resp["gospel"][0]["EPITOMIZE"],
-                    season=season_value,
-                ).model_dump(),
-                default=str,
+            response = self.daily_bible_api_service.fetch(day=day)
+            if response.status_code != 200:
+                return response_object.ResponseFailure.build_not_found_error(message="Not found")
+            quotes = self.daily_bible_api_service.parse(response.json())
+            # kept one more day, to be served while the next reading is fetched; written
+            # before the release, so that no request finds neither the lock nor the value
+            self.redis_client.setex(
+                get_daily_bible_redis_key(day),
+                get_ttl_until_end_of(day + timedelta(days=1)),
+                quotes.model_dump_json(),
             )
-        except IndexError as e:
-            if "special_content" in resp:
-                # Regex patterns, split to comply with line length < 100
-                epitomize_pattern = (
-                    r'<div class="gospel reading division">.*?'
-                    r'<div class="division-header"><span>Tin Mừng</span></div>.*?'
-                    r'<p class="gospel\[epitomize\] epitomize">([^<]+)</p>'
-                )
-                reference_pattern = (
-                    r'<div class="gospel reading division">.*?'
-                    r'<div class="division-header"><span>Tin Mừng</span></div>.*?'
-                    r'<div class="gospel\[indexing\] right-indexing sel-transparent dropdown">.*?'
-                    r'<span class="btn dropdown-toggle" data-toggle="dropdown">([^<]+)\s*'
-                    r'<i class="fa fa-caret-down"[^>]*></i></span>'
-                )
-                epitomize_match = re.search(epitomize_pattern, resp["special_content"], re.DOTALL)
-                epitomize_text = (
-                    epitomize_match.group(1).strip().strip("&nbsp;") if epitomize_match else None
-                )
-
-                # Find reference text
-                reference_match = re.search(reference_pattern, resp["special_content"], re.DOTALL)
-                reference_text = (
-                    reference_match.group(1).strip().strip("&nbsp;") if reference_match else None
-                )
-                cache_data = json.dumps(
-                    DailyBibleResponse(
-                        epitomize_text=reference_text,
-                        gospel_ref=epitomize_text,
-                        season=season_value,
-                    ).model_dump(),
-                    default=str,
-                )
-            else:
-                raise (e)
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
+            return quotes
+        except requests.RequestException as e:
             return response_object.ResponseFailure.build_system_error(message=str(e))
-        ttl = get_ttl_until_midnight()
-        self.redis_client.setex("daily-bible-quotes", ttl, cache_data)
+        except (KeyError, ValueError, IndexError) as e:
+            logger.error(f"An error occurred: {e}")
+            return response_object.ResponseFailure.build_system_error(
+                message="Invalid response format"
+            )
+        finally:
+            self._release(day, token)
+
+    def _release(self, day: date, token: str):
+        """Delete the lock of `day` if it is still the one taken with `token`"""
+        key = get_daily_bible_lock_redis_key(day)
+        with self.redis_client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                owner = pipe.get(key)
+                if (owner.decode() if isinstance(owner, bytes) else owner) != token:
+                    # expired, and maybe taken by another worker since
+                    pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+            except WatchError:
+                # changed between the get and the delete: not ours anymore
+                pass
+
+    def _wait_for_refresh(self, day: date):
+        deadline = time.monotonic() + REFRESH_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.2)
+            cached = self.redis_client.get(get_daily_bible_redis_key(day))
+            if cached:
+                return DailyBibleResponse.model_validate_json(cached)
+        return response_object.ResponseFailure.build_system_error(
+            message="Đang cập nhật dữ liệu, vui lòng thử lại sau."
+        )
@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.domain.admin.entity import AdminInDB
 from app.models.document import DocumentModel
@@ -40,12 +40,10 @@ class CreateDocumentRequestObject(request_object.ValidRequestObject):
 class CreateDocumentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         document_repository: DocumentRepository = Depends(DocumentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.document_repository = document_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateDocumentRequestObject):
@@ -58,8 +56,7 @@ class CreateDocumentUseCase(use_case.UseCase):
         )
         document: DocumentModel = self.document_repository.create(document=obj_in)
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.DOCUMENT,
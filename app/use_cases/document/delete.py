@@ -1,7 +1,7 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.document.document_repository import DocumentRepository
 from app.infra.tasks.drive_file import delete_file_drive_task
 from app.shared import request_object, response_object, use_case
@@ -38,7 +38,6 @@ class DeleteDocumentRequestObject(request_object.ValidRequestObject):
 class DeleteDocumentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         google_drive_api_service: GoogleDriveAPIService = Depends(GoogleDriveAPIService),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         document_repository: DocumentRepository = Depends(DocumentRepository),
@@ -47,7 +46,6 @@ class DeleteDocumentUseCase(use_case.UseCase):
     ):
         self.google_drive_api_service = google_drive_api_service
         self.document_repository = document_repository
-        self.background_tasks = background_tasks
         self.general_task_repository = general_task_repository
         self.audit_log_repository = audit_log_repository
         self.subject_repository = subject_repository
@@ -83,8 +81,7 @@ class DeleteDocumentUseCase(use_case.UseCase):
             delete_file_drive_task.delay(document.file_id)
 
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.DOCUMENT,
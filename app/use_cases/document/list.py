@@ -1,5 +1,5 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
 from app.domain.document.entity import (
@@ -9,8 +9,10 @@ from app.domain.document.entity import (
     ManyDocumentsInResponse,
 )
 from app.domain.shared.entity import Pagination
-from app.models.document import DocumentModel
+from app.shared.utils.pagination import next_cursor
+from app.shared.utils.search import search_match, search_sort
 from app.infra.document.document_repository import DocumentRepository
+from app.infra.dereference import select_related
 from app.models.admin import AdminModel
 from app.domain.document.enum import DocumentType
 from app.domain.admin.entity import AdminInDB
@@ -28,6 +30,7 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
         search: Optional[str] = None,
         label: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         season: int | None = None,
         type: Optional[DocumentType] = None,
         roles: Optional[list[str]] = None,
@@ -36,6 +39,7 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
         self.page_size = page_size
         self.search = search
         self.sort = sort
+        self.after = after
         self.label = label
         self.current_admin = current_admin
         self.roles = roles
@@ -51,6 +55,7 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
         search: Optional[str] = None,
         label: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         season: int | None = None,
         type: Optional[DocumentType] = None,
         roles: Optional[list[str]] = None,
@@ -62,6 +67,7 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
             page_size=page_size,
             search=search,
             sort=sort,
+            after=after,
             season=season,
             type=type,
             roles=roles,
@@ -224,10 +230,7 @@ class ListDocumentsUseCase(use_case.UseCase):
             return match_pipeline
 
         if isinstance(req_object.search, str):
-            match_pipeline = {
-                **match_pipeline,
-                "name": {"$regex": req_object.search, "$options": "i"},
-            }
+            match_pipeline = {**match_pipeline, **search_match(req_object.search)}
 
         if isinstance(req_object.label, list) and len(req_object.label) > 0:
             match_pipeline = {**match_pipeline, "label": {"$in": req_object.label}}
@@ -235,14 +238,16 @@ class ListDocumentsUseCase(use_case.UseCase):
         if isinstance(req_object.roles, list) and len(req_object.roles) > 0:
             match_pipeline = {**match_pipeline, "role": {"$in": req_object.roles}}
 
-        documents: List[DocumentModel] = self.document_repository.list(
+        sort = search_sort(req_object.sort, req_object.search)
+        documents, total = self.document_repository.list_with_total(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
-            sort=req_object.sort,
+            sort=sort,
+            after=req_object.after,
             match_pipeline=match_pipeline,
+            search=req_object.search,
         )
-
-        total = self.document_repository.count_list(match_pipeline=match_pipeline)
+        select_related(documents, "author")
 
         data: Optional[list[Document]] = []
         for doc in documents:
@@ -259,6 +264,7 @@ class ListDocumentsUseCase(use_case.UseCase):
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor(sort, documents, req_object.page_size),
             ),
             data=data,
         )
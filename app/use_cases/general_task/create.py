@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.domain.admin.entity import AdminInDB
 from app.models.general_task import GeneralTaskModel
@@ -44,14 +44,12 @@ class CreateGeneralTaskRequestObject(request_object.ValidRequestObject):
 class CreateGeneralTaskUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         document_repository: DocumentRepository = Depends(DocumentRepository),
         general_task_repository: GeneralTaskRepository = Depends(GeneralTaskRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.general_task_repository = general_task_repository
         self.document_repository = document_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateGeneralTaskRequestObject):
@@ -73,8 +71,7 @@ class CreateGeneralTaskUseCase(use_case.UseCase):
             general_task=obj_in, attachments=req_object.general_task_in.attachments or []
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.GENERAL_TASK,
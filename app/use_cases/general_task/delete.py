@@ -1,7 +1,7 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.general_task.general_task_repository import GeneralTaskRepository
 from app.shared import request_object, response_object, use_case
 from app.shared.constant import SUPER_ADMIN
@@ -34,12 +34,10 @@ class DeleteGeneralTaskRequestObject(request_object.ValidRequestObject):
 class DeleteGeneralTaskUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         general_task_repository: GeneralTaskRepository = Depends(GeneralTaskRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.general_task_repository = general_task_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: DeleteGeneralTaskRequestObject):
@@ -57,8 +55,7 @@ class DeleteGeneralTaskUseCase(use_case.UseCase):
             self.general_task_repository.delete(id=general_task.id)
 
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.GENERAL_TASK,
@@ -1,5 +1,5 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
 from app.domain.general_task.entity import (
@@ -9,8 +9,10 @@ from app.domain.general_task.entity import (
     ManyGeneralTasksInResponse,
 )
 from app.domain.shared.entity import Pagination
-from app.models.general_task import GeneralTaskModel
+from app.shared.utils.pagination import next_cursor
+from app.shared.utils.search import search_match, search_sort
 from app.infra.general_task.general_task_repository import GeneralTaskRepository
+from app.infra.dereference import select_related
 from app.models.admin import AdminModel
 from app.domain.general_task.enum import GeneralTaskType
 from app.domain.admin.entity import AdminInDB
@@ -29,6 +31,7 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
         search: Optional[str] = None,
         label: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         season: int | None = None,
         type: Optional[GeneralTaskType] = None,
         roles: Optional[list[str]] = None,
@@ -37,6 +40,7 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
         self.page_size = page_size
         self.search = search
         self.sort = sort
+        self.after = after
         self.label = label
         self.current_admin = current_admin
         self.roles = roles
@@ -52,6 +56,7 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
         search: Optional[str] = None,
         label: Optional[list[str]] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
         season: int | None = None,
         type: Optional[GeneralTaskType] = None,
         roles: Optional[list[str]] = None,
@@ -63,6 +68,7 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
             page_size=page_size,
             search=search,
             sort=sort,
+            after=after,
             season=season,
             type=type,
             roles=roles,
@@ -174,23 +180,22 @@ class ListGeneralTasksUseCase(use_case.UseCase):
             return match_pipeline
 
         if isinstance(req_object.search, str):
-            match_pipeline = {
-                **match_pipeline,
-                "title": {"$regex": req_object.search, "$options": "i"},
-            }
+            match_pipeline = {**match_pipeline, **search_match(req_object.search)}
         if isinstance(req_object.label, list) and len(req_object.label) > 0:
             match_pipeline = {**match_pipeline, "label": {"$in": req_object.label}}
         if isinstance(req_object.roles, list) and len(req_object.roles) > 0:
             match_pipeline = {**match_pipeline, "role": {"$in": req_object.roles}}
 
-        general_tasks: List[GeneralTaskModel] = self.general_task_repository.list(
+        sort = search_sort(req_object.sort, req_object.search)
+        general_tasks, total = self.general_task_repository.list_with_total(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
-            sort=req_object.sort,
+            sort=sort,
+            after=req_object.after,
             match_pipeline=match_pipeline,
+            search=req_object.search,
         )
-
-        total = self.general_task_repository.count_list(match_pipeline=match_pipeline)
+        select_related(general_tasks, "author", "attachments.author")
 
         data: Optional[list[GeneralTask]] = []
         for task in general_tasks:
@@ -219,6 +224,7 @@ class ListGeneralTasksUseCase(use_case.UseCase):
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor(sort, general_tasks, req_object.page_size),
             ),
             data=data,
         )
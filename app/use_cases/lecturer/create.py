@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.models.lecturer import LecturerModel
 from app.shared import request_object, use_case
@@ -36,12 +36,10 @@ class CreateLecturerRequestObject(request_object.ValidRequestObject):
 class CreateLecturerUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateLecturerRequestObject):
@@ -52,8 +50,7 @@ class CreateLecturerUseCase(use_case.UseCase):
         )
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.LECTURER,
@@ -1,7 +1,7 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.lecturer.lecturer_repository import LecturerRepository
 from app.shared import request_object, response_object, use_case
 from app.models.lecturer import LecturerModel
@@ -34,14 +34,12 @@ class DeleteLecturerRequestObject(request_object.ValidRequestObject):
 class DeleteLecturerUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.lecturer_repository = lecturer_repository
         self.subject_repository = subject_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: DeleteLecturerRequestObject):
@@ -59,8 +57,7 @@ class DeleteLecturerUseCase(use_case.UseCase):
             self.lecturer_repository.delete(id=lecturer.id)
 
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.LECTURER,
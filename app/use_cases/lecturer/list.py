@@ -4,6 +4,8 @@ from fastapi import Depends
 from app.shared import request_object, use_case
 from app.domain.lecturer.entity import Lecturer, LecturerInDB, ManyLecturersInResponse
 from app.domain.shared.entity import Pagination
+from app.shared.utils.pagination import next_cursor
+from app.shared.utils.search import search_match, search_sort
 from app.models.lecturer import LecturerModel
 from app.infra.lecturer.lecturer_repository import LecturerRepository
 
@@ -15,11 +17,13 @@ class ListLecturersRequestObject(request_object.ValidRequestObject):
         page_size: int,
         search: Optional[str] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
         self.search = search
         self.sort = sort
+        self.after = after
 
     @classmethod
     def builder(
@@ -28,9 +32,10 @@ class ListLecturersRequestObject(request_object.ValidRequestObject):
         page_size: int,
         search: Optional[str] = None,
         sort: Optional[dict[str, int]] = None,
+        after: Optional[str] = None,
     ):
         return ListLecturersRequestObject(
-            page_index=page_index, page_size=page_size, search=search, sort=sort
+            page_index=page_index, page_size=page_size, search=search, sort=sort, after=after
         )
 
 
@@ -41,19 +46,15 @@ class ListLecturersUseCase(use_case.UseCase):
     def process_request(self, req_object: ListLecturersRequestObject):
         match_pipeline = None
         if isinstance(req_object.search, str):
-            match_pipeline = {
-                "$match": {
-                    "$or": [
-                        {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                        {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                    ]
-                }
-            }
+            match_pipeline = {"$match": search_match(req_object.search)}
+        sort = search_sort(req_object.sort, req_object.search)
         lecturers: List[LecturerModel] = self.lecturer_repository.list(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
-            sort=req_object.sort,
+            sort=sort,
+            after=req_object.after,
             match_pipeline=match_pipeline,
+            search=req_object.search,
         )
 
         total = self.lecturer_repository.count_list(match_pipeline=match_pipeline)
@@ -63,6 +64,7 @@ class ListLecturersUseCase(use_case.UseCase):
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor(sort, lecturers, req_object.page_size),
             ),
             data=[Lecturer(**LecturerInDB.model_validate(doc).model_dump()) for doc in lecturers],
         )
@@ -15,6 +15,7 @@ from app.infra.lecturer.lecturer_repository import LecturerRepository
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.shared.utils.general import (
+    clear_student_roll_call_cache,
     get_current_season_value,
 )
 
@@ -100,9 +101,10 @@ class RollCallBySheetUseCase(use_case.UseCase):
                     f"MSHV không hợp lệ - hàng số {idx + 2}"
                 )
 
-        self.roll_call_repository.update_bulk(
+        result = self.roll_call_repository.update_bulk(
             numerical_orders=numerical_orders,
             subject=subject,
             current_season=current_season,
         )
-        return True
+        clear_student_roll_call_cache(season=current_season)
+        return result
@@ -1,9 +1,16 @@
 from fastapi import Depends, HTTPException
 
+from app.config import settings
+from app.config.redis import RedisDependency
+from app.domain.roll_call.entity import StudentRollCallResultInStudentResponse
 from app.models.student import StudentModel
 from app.shared import request_object, use_case
 from app.infra.roll_call.roll_call_repository import RollCallRepository
-from app.shared.utils.general import get_current_season_value
+from app.shared.utils.general import (
+    get_current_season_value,
+    get_roll_call_season_token,
+    get_student_roll_call_redis_key,
+)
 
 
 class GetStudentRollCallResultsRequestObject(request_object.ValidRequestObject):
@@ -28,8 +35,13 @@ class GetStudentRollCallResultsRequestObject(request_object.ValidRequestObject):
 
 
 class GetStudentRollCallResultsUseCase(use_case.UseCase):
-    def __init__(self, roll_call_repository: RollCallRepository = Depends(RollCallRepository)):
+    def __init__(
+        self,
+        redis_client: RedisDependency,
+        roll_call_repository: RollCallRepository = Depends(RollCallRepository),
+    ):
         self.roll_call_repository = roll_call_repository
+        self.redis_client = redis_client
 
     def process_request(self, req_object: GetStudentRollCallResultsRequestObject):
         current_season = get_current_season_value()
@@ -47,7 +59,23 @@ class GetStudentRollCallResultsUseCase(use_case.UseCase):
         else:
             season = current_season
 
-        return self.roll_call_repository.get_student_roll_call_results(
+        redis_key = None
+        if settings.ROLL_CALL_CACHE_TTL > 0:
+            redis_key = get_student_roll_call_redis_key(
+                str(req_object.current_student.id),
+                season,
+                get_roll_call_season_token(season, self.redis_client),
+            )
+            cached = self.redis_client.get(redis_key)
+            if cached:
+                return StudentRollCallResultInStudentResponse.model_validate_json(cached)
+
+        result = self.roll_call_repository.get_student_roll_call_results(
             student_id=req_object.current_student.id,
             season=season,
         )
+        if result is not None and redis_key:
+            self.redis_client.setex(
+                redis_key, settings.ROLL_CALL_CACHE_TTL, result.model_dump_json()
+            )
+        return result
@@ -5,7 +5,8 @@ from app.shared import request_object, use_case, response_object
 
 from app.domain.season.entity import Season, SeasonInDB, SeasonInUpdateTime
 from app.infra.season.season_repository import SeasonRepository
-from app.shared.utils.general import clear_all_cache
+from app.infra.response_cache import ResponseCacheTag, invalidate_response_cache
+from app.shared.utils.general import clear_all_cache, invalidate_current_season_cache
 from pymongo.errors import PyMongoError
 from mongoengine.connection import get_connection
 
@@ -51,6 +52,10 @@ class MarkCurrentSeasonUseCase(use_case.UseCase):
                     season.reload()
 
                     session.commit_transaction()
+                    invalidate_current_season_cache()
+                    # the repository invalidated before the commit, a read in between
+                    # may have cached the former current season
+                    invalidate_response_cache(ResponseCacheTag.SEASON)
                     return Season(**SeasonInDB.model_validate(season).model_dump())
                 except (PyMongoError, ValueError):
                     session.abort_transaction()
@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.domain.shared.enum import AccountStatus
 from app.infra.tasks.email import (
@@ -18,6 +18,7 @@ from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 from app.infra.security.security_service import generate_random_password, get_password_hash
+from app.infra.security.principal_cache import student_principal_cache
 from app.shared.common_exception import CustomException
 from app.shared.utils.general import get_current_season_value
 
@@ -44,14 +45,12 @@ class CreateStudentRequestObject(request_object.ValidRequestObject):
 class CreateStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateStudentRequestObject):
@@ -85,6 +84,7 @@ class CreateStudentUseCase(use_case.UseCase):
 
             try:
                 existing_student.save()
+                student_principal_cache.invalidate(id=existing_student.id)
                 student = StudentInDB.model_validate(existing_student)
             except CustomException as e:
                 return response_object.ResponseFailure.build_parameters_error(message=str(e))
@@ -116,8 +116,7 @@ class CreateStudentUseCase(use_case.UseCase):
                 email=student.email, password=password, full_name=student.full_name
             )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE if existing_student else AuditLogType.CREATE,
                 endpoint=Endpoint.STUDENT,
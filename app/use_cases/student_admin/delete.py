@@ -1,8 +1,9 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.student.student_repository import StudentRepository
+from app.infra.roll_call.roll_call_repository import RollCallRepository
 from app.shared import request_object, response_object, use_case
 from app.models.student import StudentModel
 from app.models.admin import AdminModel
@@ -33,13 +34,13 @@ class DeleteStudentRequestObject(request_object.ValidRequestObject):
 class DeleteStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
+        roll_call_repository: RollCallRepository = Depends(RollCallRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
+        self.roll_call_repository = roll_call_repository
 
     def process_request(self, req_object: DeleteStudentRequestObject):
         student: Optional[StudentModel] = self.student_repository.get_by_id(req_object.id)
@@ -49,8 +50,8 @@ class DeleteStudentUseCase(use_case.UseCase):
         current_season = get_current_season_value()
         try:
             self.student_repository.delete(id=req_object.id)
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.roll_call_repository.delete_summaries(student_id=student.id)
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.STUDENT,
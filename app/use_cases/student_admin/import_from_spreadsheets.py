@@ -1,6 +1,8 @@
-from fastapi import Depends, BackgroundTasks
+from datetime import datetime, timezone
+from fastapi import Depends
 import json
-from mongoengine import NotUniqueError
+from bson import ObjectId
+from mongoengine import ValidationError as MongoValidationError
 
 from pydantic import ValidationError
 
@@ -8,6 +10,7 @@ from app.domain.shared.entity import ImportSpreadsheetsPayload
 from app.domain.shared.enum import AccountStatus
 from app.infra.services.google_sheet_api import GoogleSheetAPIService
 from app.shared import request_object, use_case, response_object
+from app.shared.common_exception import CustomException
 
 from app.domain.student.entity import (
     AttentionImport,
@@ -22,7 +25,8 @@ from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
 from app.domain.audit_log.enum import AuditLogType, Endpoint
-from app.infra.security.security_service import generate_random_password, get_password_hash
+from app.infra.security.password_hasher import hash_passwords
+from app.infra.security.security_service import generate_random_password
 from app.shared.utils.general import (
     convert_valid_date,
     copy_dict,
@@ -32,11 +36,17 @@ from app.shared.constant import HEADER_IMPORT_STUDENT
 from app.domain.student.enum import FieldStudentEnum
 from app.models.student import SeasonInfo, StudentModel
 from app.infra.tasks.email import (
-    send_email_welcome_task,
-    send_email_welcome_with_exist_account_task,
+    send_email_welcome_batch_task,
+    send_email_welcome_with_exist_account_batch_task,
 )
 
 LEN_HEADER_IMPORT_STUDENT = len(HEADER_IMPORT_STUDENT)
+# fields of the sheet copied onto an existing student
+UPDATE_FIELDS_IMPORT_STUDENT = set(HEADER_IMPORT_STUDENT) - {"numerical_order", "group", "email"}
+# recipients of one email task
+EMAIL_BATCH_SIZE = 50
+# mongo duplicate key error
+DUPLICATE_KEY_ERROR = 11000
 
 
 class ImportSpreadsheetsStudentRequestObject(request_object.ValidRequestObject):
@@ -61,7 +71,6 @@ class ImportSpreadsheetsStudentRequestObject(request_object.ValidRequestObject):
 class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
@@ -69,7 +78,6 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
     ):
         self.student_repository = student_repository
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.google_sheet_api_service = google_sheet_api_service
 
@@ -79,6 +87,20 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
             for i in range(LEN_HEADER_IMPORT_STUDENT)
         }
 
+    def validate_row(self, data: dict, current_season: int) -> StudentInDB:
+        """
+        Raises:
+            ValidationError: invalid value in the row
+        """
+        data_copy = copy_dict(data, exclude_keys=["numerical_order", "group"])
+        seasons_info = StudentSeason(
+            season=current_season,
+            numerical_order=data["numerical_order"],
+            group=data["group"],
+        )
+        # the password is only generated for the new students, once the rows are checked
+        return StudentInDB(**data_copy, seasons_info=[seasons_info], password="")
+
     def process_request(self, req_object: ImportSpreadsheetsStudentRequestObject):
         data_import = self.google_sheet_api_service.get_data_from_spreadsheet(
             url=req_object.payload.url,
@@ -101,99 +123,164 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
         attentions: list[AttentionImport] = []
 
         current_season = get_current_season_value()
+
+        # Validate every row first, the database is only read once for the whole sheet
+        students: list[tuple[int, StudentInDB]] = []
         for idx, row in enumerate(data_import):
             data = self.convert_value_spreadsheet_to_dict(row)
             try:
-                data_copy = copy_dict(data)
-                seasons_info = StudentSeason(
-                    season=current_season,
-                    numerical_order=data_copy["numerical_order"],
-                    group=data_copy["group"],
-                )
-                del data_copy["numerical_order"]
-                del data_copy["group"]
-                # password = "12345678"
-                password = generate_random_password()
-                student_in_db = StudentInDB(
-                    **data_copy,
-                    seasons_info=[seasons_info],
-                    password=get_password_hash(password),
-                )
+                students.append((idx, self.validate_row(data, current_season)))
+            except ValidationError as e:
+                errs = e.errors()
+                message = [
+                    (FieldStudentEnum[err["loc"][0]].value + ": " + err["msg"]) for err in errs
+                ]
+                message = "\n".join(message)
+                errors.append(ErrorImport(row=idx + 2, detail=message))
+            except Exception as e:
+                errors.append(ErrorImport(row=idx + 2, detail=str(e)))
 
-                exist_std: StudentModel | None = self.student_repository.find_one(
-                    {"email": student_in_db.email}
-                )
-                if exist_std:
-                    attentions_message = ""
-                    if exist_std.full_name != student_in_db.full_name:
-                        attentions_message += (
-                            f"Họ tên từ {exist_std.full_name} đã thay đổi "
-                            + f"thành {student_in_db.full_name}"
-                        )
-                    if convert_valid_date(exist_std.date_of_birth) != student_in_db.date_of_birth:
-                        attentions_message += ". " if attentions_message else ""
-                        attentions_message += (
-                            f"Ngày sinh từ {convert_valid_date(exist_std.date_of_birth)} "
-                            + f"đã thay đổi thành {student_in_db.date_of_birth}"
-                        )
+        exist_students = self.student_repository.find_by_emails(
+            [student.email for _, student in students]
+        )
+        taken_numerical_orders = self.student_repository.get_numerical_orders(current_season)
 
-                    exist_std.status = AccountStatus.ACTIVE
+        # Same checks as StudentModel.clean, row after row as if each row was saved in turn
+        now = datetime.now(timezone.utc)
+        seen_emails: set[str] = set()
+        new_students: list[tuple[int, StudentModel]] = []
+        # (row index, student id, row, update document, attention message)
+        exist_updates: list[tuple[int, ObjectId, StudentInDB, dict, str]] = []
+        for idx, student_in_db in students:
+            seasons_info = student_in_db.seasons_info[0]
+            exist_std = exist_students.get(student_in_db.email)
+            try:
+                if student_in_db.email in seen_emails or (
+                    exist_std
+                    and any(info.season == current_season for info in exist_std.seasons_info)
+                ):
+                    raise CustomException(
+                        f"Học viên này ({student_in_db.email}) đã đăng ký mùa {current_season}."
+                    )
+                if seasons_info.numerical_order in taken_numerical_orders:
+                    raise CustomException(
+                        f"Đã tồn tại một học viên khác có MSHV {seasons_info.numerical_order} "
+                        f"ở mùa {current_season}."
+                    )
 
-                    exist_std.seasons_info.append(
-                        SeasonInfo(
-                            numerical_order=seasons_info.numerical_order,
-                            group=seasons_info.group,
-                            season=seasons_info.season,
+                if exist_std:
+                    values = student_in_db.model_dump(
+                        include=UPDATE_FIELDS_IMPORT_STUDENT, exclude_none=True
+                    )
+                    son = StudentModel(
+                        **values, status=AccountStatus.ACTIVE, updated_at=now
+                    ).to_mongo()
+                    son.pop("_cls", None)
+                    son.pop("seasons_info", None)
+                    update = {
+                        "$set": {
+                            **son.to_dict(),
+                            **StudentModel.get_search_index(
+                                {**exist_std.to_mongo().to_dict(), **son.to_dict()}
+                            ),
+                            "updated_at": now,
+                        },
+                        "$push": {
+                            "seasons_info": SeasonInfo(**seasons_info.model_dump())
+                            .to_mongo()
+                            .to_dict()
+                        },
+                    }
+                    exist_updates.append(
+                        (
+                            idx,
+                            exist_std.id,
+                            student_in_db,
+                            update,
+                            self.attention_message(exist_std, student_in_db),
                         )
                     )
+                else:
+                    new_student = StudentModel(**student_in_db.model_dump())
+                    new_student.validate(clean=False)
+                    new_students.append((idx, new_student))
+            except (CustomException, MongoValidationError) as e:
+                errors.append(ErrorImport(row=idx + 2, detail=str(e)))
+                continue
 
-                    del data_copy["email"]
-                    for key, value in data_copy.items():
-                        if value is not None:
-                            if hasattr(exist_std, key):
-                                setattr(exist_std, key, value)
+            seen_emails.add(student_in_db.email)
+            taken_numerical_orders.add(seasons_info.numerical_order)
 
-                    exist_std.save()
-                    updated.append(exist_std.email)
-                    if attentions_message:
-                        attentions.append(AttentionImport(row=idx + 2, detail=attentions_message))
+        # bcrypt on a process pool, away from the request threads
+        passwords = [generate_random_password() for _ in new_students]
+        documents = []
+        for (_, new_student), hashed in zip(new_students, hash_passwords(passwords)):
+            new_student.password = hashed
+            # inserted without save(): stamped here as repository.create did
+            new_student.created_at = new_student.updated_at = now
+            documents.append(new_student.to_mongo().to_dict())
 
-                    send_email_welcome_with_exist_account_task.delay(
-                        email=exist_std.email, season=current_season, full_name=exist_std.full_name
-                    )
+        failed: dict[int, str] = {}
+        for err in self.student_repository.insert_many(documents):
+            idx, new_student = new_students[err["index"]]
+            failed[idx] = self.write_error_message(
+                err,
+                new_student.email,
+                new_student.seasons_info[0].numerical_order,
+                current_season,
+            )
+        for err in self.student_repository.bulk_update(
+            [(id, update) for _, id, _, update, _ in exist_updates]
+        ):
+            idx, _, student_in_db, _, _ = exist_updates[err["index"]]
+            failed[idx] = self.write_error_message(
+                err,
+                student_in_db.email,
+                student_in_db.seasons_info[0].numerical_order,
+                current_season,
+            )
+        errors.extend(ErrorImport(row=idx + 2, detail=detail) for idx, detail in failed.items())
 
-                else:
-                    inserted: StudentInDB = self.student_repository.create(student_in_db)
-                    inserteds.append(inserted.email)
+        welcome_recipients: list[dict] = []
+        for (idx, new_student), password in zip(new_students, passwords):
+            if idx in failed:
+                continue
+            inserteds.append(new_student.email)
+            welcome_recipients.append(
+                dict(email=new_student.email, password=password, full_name=new_student.full_name)
+            )
 
-                    send_email_welcome_task.delay(
-                        email=student_in_db.email,
-                        password=password,
-                        full_name=student_in_db.full_name,
-                    )
-            except NotUniqueError:
-                errors.append(
-                    ErrorImport(
-                        row=idx + 2,
-                        detail=f"Email đã tồn tại. ({data.get('email')})",
-                    )
+        exist_recipients: list[dict] = []
+        for idx, _, student_in_db, _, attention_message in exist_updates:
+            if idx in failed:
+                continue
+            updated.append(student_in_db.email)
+            if attention_message:
+                attentions.append(AttentionImport(row=idx + 2, detail=attention_message))
+            exist_recipients.append(
+                dict(
+                    email=student_in_db.email,
+                    season=current_season,
+                    full_name=student_in_db.full_name,
                 )
-            except ValidationError as e:
-                errs = e.errors()
-                message = [
-                    (FieldStudentEnum[err["loc"][0]].value + ": " + err["msg"]) for err in errs
-                ]
-                message = "\n".join(message)
-                errors.append(ErrorImport(row=idx + 2, detail=message))
-            except Exception as e:
-                errors.append(ErrorImport(row=idx + 2, detail=str(e)))
+            )
 
+        for i in range(0, len(welcome_recipients), EMAIL_BATCH_SIZE):
+            send_email_welcome_batch_task.delay(
+                recipients=welcome_recipients[i : i + EMAIL_BATCH_SIZE]
+            )
+        for i in range(0, len(exist_recipients), EMAIL_BATCH_SIZE):
+            send_email_welcome_with_exist_account_batch_task.delay(
+                recipients=exist_recipients[i : i + EMAIL_BATCH_SIZE]
+            )
+
+        errors.sort(key=lambda error: error.row)
+        attentions.sort(key=lambda attention: attention.row)
         response = ImportSpreadsheetsInResponse(
             errors=errors, inserteds=inserteds, updated=updated, attentions=attentions
         )
         if inserteds or attentions:
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.IMPORT,
                     endpoint=Endpoint.STUDENT,
@@ -202,8 +289,43 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
                     author_email=req_object.current_admin.email,
                     author_name=req_object.current_admin.full_name,
                     author_roles=req_object.current_admin.roles,
-                    description=json.dumps(response, default=str, ensure_ascii=False),
+                    # counts only, the inserted and updated students are not repeated
+                    description=json.dumps(
+                        {
+                            "inserteds": len(inserteds),
+                            "updated": len(updated),
+                            "errors": len(errors),
+                            "attentions": [attention.model_dump() for attention in attentions],
+                        },
+                        default=str,
+                        ensure_ascii=False,
+                    ),
                 ),
             )
 
         return response
+
+    def attention_message(self, exist_std: StudentModel, student_in_db: StudentInDB) -> str:
+        attentions_message = ""
+        if exist_std.full_name != student_in_db.full_name:
+            attentions_message += (
+                f"Họ tên từ {exist_std.full_name} đã thay đổi thành {student_in_db.full_name}"
+            )
+        if convert_valid_date(exist_std.date_of_birth) != student_in_db.date_of_birth:
+            attentions_message += ". " if attentions_message else ""
+            attentions_message += (
+                f"Ngày sinh từ {convert_valid_date(exist_std.date_of_birth)} "
+                + f"đã thay đổi thành {student_in_db.date_of_birth}"
+            )
+        return attentions_message
+
+    def write_error_message(
+        self, err: dict, email: str, numerical_order: int, current_season: int
+    ) -> str:
+        """Message of a write error of the bulk insert/update"""
+        if err.get("code") != DUPLICATE_KEY_ERROR:
+            return err.get("errmsg", "")
+        if "email" in err.get("keyPattern", {}) or "email" in err.get("errmsg", ""):
+            return f"Email đã tồn tại. ({email})"
+        # numerical order given concurrently (by another import or an admin)
+        return f"Đã tồn tại một học viên khác có MSHV {numerical_order} ở mùa {current_season}."
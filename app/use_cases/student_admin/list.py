@@ -1,16 +1,19 @@
 import math
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, Dict, Any
 from fastapi import Depends
 from app.shared import request_object, use_case
 from app.domain.student.entity import (
     ManyStudentsInResponse,
-    Student,
-    StudentInDB,
+    PARTIAL_STUDENT_ADAPTER,
+    STUDENT_ADAPTER,
 )
+from app.domain.shared.mongo_adapter import select_fields
 from app.domain.shared.entity import Pagination
-from app.models.student import StudentModel
 from app.infra.student.student_repository import StudentRepository
 from app.shared.utils.general import get_current_season_value
+from app.shared.utils.projection import get_projection
+from app.shared.utils.search import search_match, search_sort
 
 
 class ListStudentsRequestObject(request_object.ValidRequestObject):
@@ -22,6 +25,7 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
         group: int | None = None,
         sort: Optional[dict[str, int]] = None,
         season: int | None = None,
+        fields: list[str] | None = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
@@ -29,6 +33,7 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
         self.sort = sort
         self.group = group
         self.season = season
+        self.fields = fields
 
     @classmethod
     def builder(
@@ -39,6 +44,7 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
         sort: Optional[dict[str, int]] = None,
         group: int | None = None,
         season: int | None = None,
+        fields: list[str] | None = None,
     ):
         return ListStudentsRequestObject(
             page_index=page_index,
@@ -47,6 +53,7 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
             group=group,
             sort=sort,
             season=season,
+            fields=fields,
         )
 
 
@@ -66,10 +73,9 @@ class ListStudentsUseCase(use_case.UseCase):
 
         if isinstance(req_object.search, str):
             pipeline_search = [
-                {"email": {"$regex": req_object.search, "$options": "i"}},
-                {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                {"diocese": {"$regex": req_object.search, "$options": "i"}},
+                search_match(req_object.search),
+                # anchored and case sensitive (emails are lowercase): backed by the email index
+                {"email": {"$regex": f"^{re.escape(req_object.search.strip().lower())}"}},
             ]
             num = None
             try:
@@ -86,20 +92,29 @@ class ListStudentsUseCase(use_case.UseCase):
         if isinstance(req_object.group, int):
             match_pipeline = {**match_pipeline, "seasons_info.group": req_object.group}
 
-        students: List[StudentModel] = self.student_repository.list(
+        sort = search_sort(req_object.sort, req_object.search)
+        students, total = self.student_repository.list_with_total(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
-            sort=req_object.sort,
+            sort=sort,
             match_pipeline=match_pipeline,
+            search=req_object.search,
+            projection=get_projection(req_object.fields, sort),
+            raw=True,
         )
 
-        total = self.student_repository.count_list(match_pipeline=match_pipeline)
-
         return ManyStudentsInResponse(
             pagination=Pagination(
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
             ),
-            data=[Student(**StudentInDB.model_validate(model).model_dump()) for model in students],
+            data=(
+                [
+                    PARTIAL_STUDENT_ADAPTER.validate_python(select_fields(doc, req_object.fields))
+                    for doc in students
+                ]
+                if req_object.fields
+                else [STUDENT_ADAPTER.validate_python(doc) for doc in students]
+            ),
         )
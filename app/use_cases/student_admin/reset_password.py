@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 import json
 from typing import Optional
 from app.shared import request_object, response_object, use_case
@@ -33,12 +33,10 @@ class ResetPasswordStudentRequestObject(request_object.ValidRequestObject):
 class ResetPasswordStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: ResetPasswordStudentRequestObject):
@@ -56,8 +54,7 @@ class ResetPasswordStudentUseCase(use_case.UseCase):
             id=student.id, data={"password": get_password_hash(password)}
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.STUDENT,
@@ -1,12 +1,13 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.student import StudentModel
 from app.shared import request_object, use_case, response_object
 from mongoengine import NotUniqueError
 
 from app.domain.student.entity import Student, StudentInDB, StudentInUpdate
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import student_principal_cache
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
@@ -40,12 +41,10 @@ class UpdateStudentRequestObject(request_object.ValidRequestObject):
 class UpdateStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateStudentRequestObject):
@@ -77,9 +76,10 @@ class UpdateStudentUseCase(use_case.UseCase):
             return response_object.ResponseFailure.build_parameters_error(message=e)
         except Exception as e:
             raise e
+        # also drops the former email, when changed
+        student_principal_cache.invalidate(id=student.id)
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.STUDENT,
@@ -10,6 +10,7 @@ from app.domain.student.entity import (
 from app.domain.shared.entity import Pagination
 from app.models.student import StudentModel
 from app.infra.student.student_repository import StudentRepository
+from app.shared.utils.search import search_match, search_sort
 
 
 class ListStudentsInStudentRequestObject(request_object.ValidRequestObject):
@@ -88,11 +89,7 @@ class ListStudentsInStudentRequestUseCase(use_case.UseCase):
         match_pipeline: Optional[Dict[str, Any]] = {"seasons_info.season": select_season}
 
         if isinstance(req_object.search, str):
-            pipeline_search = [
-                {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                {"diocese": {"$regex": req_object.search, "$options": "i"}},
-            ]
+            pipeline_search = [search_match(req_object.search)]
             num = None
             try:
                 num = int(req_object.search)
@@ -111,8 +108,9 @@ class ListStudentsInStudentRequestUseCase(use_case.UseCase):
         students: List[StudentModel] = self.student_repository.list(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
-            sort=req_object.sort,
+            sort=search_sort(req_object.sort, req_object.search),
             match_pipeline=match_pipeline,
+            search=req_object.search,
         )
 
         total = self.student_repository.count_list(match_pipeline=match_pipeline)
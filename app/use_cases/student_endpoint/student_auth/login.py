@@ -3,7 +3,7 @@ from fastapi import Depends
 from app.domain.auth.entity import LoginRequest, TokenData, AuthStudentInfoInResponse
 from app.domain.student.entity import StudentGetMeResponse, StudentInDB
 from app.models.student import StudentModel
-from app.infra.security.security_service import verify_password, create_access_token
+from app.infra.security.security_service import verify_and_update_password, create_access_token
 from app.infra.student.student_repository import StudentRepository
 from app.shared import request_object, use_case, response_object
 
@@ -35,11 +35,16 @@ class LoginStudentUseCase(use_case.UseCase):
         student: StudentModel = self.student_repository.get_by_email(req_object.login_payload.email)
         checker = False
         if student:
-            checker = verify_password(req_object.login_payload.password, student.password)
+            checker, new_hash = verify_and_update_password(
+                req_object.login_payload.password, student.password
+            )
         if not student or not checker:
             return response_object.ResponseFailure.build_parameters_error(
                 message="Sai email hoặc mật khẩu"
             )
+        if new_hash:
+            # hashed with another bcrypt cost than the current one
+            self.student_repository.update(id=student.id, data={"password": new_hash})
 
         student_in_db = StudentInDB.model_validate(student)
         if student_in_db.disabled():
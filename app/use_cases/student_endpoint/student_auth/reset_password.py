@@ -1,6 +1,7 @@
 from fastapi import Depends
 from app.domain.auth.entity import ResetPassword, ResetPasswordResponse
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import student_principal_cache
 from app.infra.security.security_service import get_password_hash
 from app.shared import request_object, use_case, response_object
 from app.shared.utils.otp_utils import verify_reset_token
@@ -49,6 +50,7 @@ class ResetPasswordStudentUseCase(use_case.UseCase):
             # Update password
             student.password = get_password_hash(req_object.payload.new_password)
             student.save()
+            student_principal_cache.invalidate(id=student.id)
 
             # Send email notification password changed
             send_email_password_changed_task.delay(
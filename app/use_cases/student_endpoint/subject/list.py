@@ -4,6 +4,7 @@ from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB, SubjectInStudent
 from app.models.subject import SubjectModel
 from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.dereference import select_related
 from app.domain.lecturer.entity import LecturerInDB, LecturerInStudent
 from app.models.student import StudentModel
 from app.domain.document.entity import DocumentInDB, DocumentInStudent
@@ -83,6 +84,7 @@ class ListSubjectsStudentUseCase(use_case.UseCase):
         subjects: List[SubjectModel] = self.subject_repository.list(
             sort=req_object.sort, match_pipeline=match_pipeline
         )
+        select_related(subjects, "lecturer")
 
         return [
             SubjectInStudent(
@@ -4,8 +4,10 @@ from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB
 from app.infra.subject.subject_repository import SubjectRepository
 from app.models.subject import SubjectModel
+from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.roll_call.roll_call_repository import RollCallRepository
 from app.models.student import StudentModel
-from app.shared.utils.general import get_current_season_value
+from app.shared.utils.general import clear_student_roll_call_cache, get_current_season_value
 from app.infra.manage_form.manage_form_repository import ManageFormRepository
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
@@ -60,11 +62,13 @@ class CreateSubjectEvaluationUseCase(use_case.UseCase):
         subject_evaluation_repository: SubjectEvaluationRepository = Depends(
             SubjectEvaluationRepository
         ),
+        roll_call_repository: RollCallRepository = Depends(RollCallRepository),
     ):
         self.subject_evaluation_repository = subject_evaluation_repository
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.subject_evaluation_question_repository = subject_evaluation_question_repository
+        self.roll_call_repository = roll_call_repository
 
     def process_request(self, req_object: CreateSubjectEvaluationRequestObject):
         form_subject_evaluation: ManageFormModel | None = self.manage_form_repository.find_one(
@@ -121,6 +125,13 @@ class CreateSubjectEvaluationUseCase(use_case.UseCase):
                     numerical_order=req_object.current_student.seasons_info[-1].numerical_order,
                 )
             )
+            if subject.status == StatusSubjectEnum.COMPLETED:
+                self.roll_call_repository.refresh_summaries(
+                    season=current_season, student_ids=[req_object.current_student.id]
+                )
+            clear_student_roll_call_cache(
+                season=current_season, student_ids=[req_object.current_student.id]
+            )
         except NotUniqueError:
             return response_object.ResponseFailure.build_parameters_error("Lượng giá bị trùng.")
         except Exception:
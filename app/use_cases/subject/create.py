@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.models.subject import SubjectModel
 from app.shared import request_object, use_case, response_object
@@ -43,7 +43,6 @@ class CreateSubjectRequestObject(request_object.ValidRequestObject):
 class CreateSubjectUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         document_repository: DocumentRepository = Depends(DocumentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
@@ -51,7 +50,6 @@ class CreateSubjectUseCase(use_case.UseCase):
     ):
         self.subject_repository = subject_repository
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.document_repository = document_repository
 
@@ -89,8 +87,7 @@ class CreateSubjectUseCase(use_case.UseCase):
         )
         subject: SubjectModel = self.subject_repository.create(subject=obj_in)
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.SUBJECT,
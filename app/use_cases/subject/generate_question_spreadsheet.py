@@ -1,5 +1,5 @@
 import json
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.config import settings
 from app.domain.upload.entity import AddPermissionDriveFile
@@ -34,14 +34,12 @@ class GenerateQuestionSpreadsheetRequestObject(request_object.ValidRequestObject
 class GenerateQuestionSpreadsheetUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         google_sheet_api_service: GoogleSheetAPIService = Depends(GoogleSheetAPIService),
         google_drive_api_service: GoogleDriveAPIService = Depends(GoogleDriveAPIService),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.subject_repository = subject_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.google_sheet_api_service = google_sheet_api_service
         self.google_drive_api_service = google_drive_api_service
@@ -114,8 +112,7 @@ class GenerateQuestionSpreadsheetUseCase(use_case.UseCase):
             editors=[settings.YSOF_EMAIL, req_object.current_admin.email],
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.SUBJECT,
@@ -2,6 +2,7 @@ from fastapi import Depends
 from app.shared import response_object, use_case
 from app.domain.subject.entity import Subject, SubjectInDB
 from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.dereference import select_related
 from app.models.subject import SubjectModel
 from app.domain.lecturer.entity import Lecturer, LecturerInDB
 from app.domain.document.entity import AdminInDocument, Document, DocumentInDB
@@ -32,6 +33,7 @@ class GetSubjectNextMostRecentUseCase(use_case.UseCase):
             page_index=1,
             page_size=1,
         )
+        select_related(subjects, "lecturer", "attachments.author")
         if len(subjects) == 0:
             return response_object.ResponseFailure.build_not_found_error(
                 "Không còn buổi học nào tiếp theo"
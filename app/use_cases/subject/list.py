@@ -1,14 +1,12 @@
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
-from app.domain.subject.entity import Subject, SubjectInDB
+from app.domain.subject.entity import SUBJECT_ADAPTER
 from app.models.subject import SubjectModel
 from app.infra.subject.subject_repository import SubjectRepository
-from app.domain.lecturer.entity import Lecturer, LecturerInDB
+from app.infra.dereference import select_related_raw
 from app.shared.utils.general import get_current_season_value
 from app.models.admin import AdminModel
-from app.domain.document.entity import AdminInDocument, Document, DocumentInDB
-from app.domain.admin.entity import AdminInDB
 from app.domain.shared.enum import AdminRole
 from app.domain.subject.enum import StatusSubjectEnum
 
@@ -87,23 +85,9 @@ class ListSubjectsUseCase(use_case.UseCase):
             match_pipeline = {**match_pipeline, "subdivision": req_object.subdivision}
         if isinstance(req_object.status, list):
             match_pipeline = {**match_pipeline, "status": {"$in": req_object.status}}
-        subjects: List[SubjectModel] = self.subject_repository.list(
-            sort=req_object.sort, match_pipeline=match_pipeline
+        subjects: List[dict] = self.subject_repository.list(
+            sort=req_object.sort, match_pipeline=match_pipeline, raw=True
         )
+        select_related_raw(subjects, SubjectModel, "lecturer", "attachments.author")
 
-        return [
-            Subject(
-                **SubjectInDB.model_validate(subject).model_dump(
-                    exclude=({"lecturer", "attachments"})
-                ),
-                lecturer=Lecturer(**LecturerInDB.model_validate(subject.lecturer).model_dump()),
-                attachments=[
-                    Document(
-                        **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
-                        author=AdminInDocument(**AdminInDB.model_validate(doc.author).model_dump()),
-                    )
-                    for doc in subject.attachments
-                ],
-            )
-            for subject in subjects
-        ]
+        return [SUBJECT_ADAPTER.validate_python(subject) for subject in subjects]
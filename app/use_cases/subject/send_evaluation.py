@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 import json
 from typing import Optional
 from app.shared import request_object, response_object, use_case
@@ -40,14 +40,12 @@ class SubjectSendEvaluationRequestObject(request_object.ValidRequestObject):
 class SubjectSendEvaluationUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
     ):
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: SubjectSendEvaluationRequestObject):
@@ -85,8 +83,7 @@ class SubjectSendEvaluationUseCase(use_case.UseCase):
             )
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.OTHER,
                 endpoint=Endpoint.SUBJECT,
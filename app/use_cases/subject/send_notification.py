@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 import json
 from typing import Optional
 from app.infra.tasks.email import (
@@ -59,7 +59,6 @@ class SubjectSendNotificationRequestObject(request_object.ValidRequestObject):
 class SubjectSendNotificationUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         redis_client: RedisDependency,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
@@ -67,7 +66,6 @@ class SubjectSendNotificationUseCase(use_case.UseCase):
     ):
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.redis_client = redis_client
 
@@ -110,8 +108,7 @@ class SubjectSendNotificationUseCase(use_case.UseCase):
 
             # Log the action
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.OTHER,
                     endpoint=Endpoint.SUBJECT,
@@ -171,8 +168,7 @@ class SubjectSendNotificationUseCase(use_case.UseCase):
 
         # Log the action
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.OTHER,
                 endpoint=Endpoint.SUBJECT,
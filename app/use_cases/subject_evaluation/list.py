@@ -1,25 +1,23 @@
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
-from app.domain.subject.entity import SubjectInDB
+from app.domain.shared.mongo_adapter import select_fields
 from app.domain.subject.subject_evaluation.entity import (
-    LecturerInEvaluation,
     ManySubjectEvaluationAdminInResponse,
-    StudentInEvaluation,
-    SubjectEvaluationAdmin,
-    SubjectEvaluationInDB,
-    SubjectInEvaluation,
+    PARTIAL_SUBJECT_EVALUATION_ADMIN_ADAPTER,
+    SUBJECT_EVALUATION_ADMIN_ADAPTER,
 )
 from app.infra.subject.subject_evaluation_repository import SubjectEvaluationRepository
-from app.domain.lecturer.entity import LecturerInDB
-from app.models.subject_evaluation import SubjectEvaluationModel
 from app.shared.utils.general import get_current_season_value
 from app.models.subject import SubjectModel
 from app.infra.subject.subject_repository import SubjectRepository
 from app.domain.shared.entity import Pagination
 import math
-from app.domain.student.entity import StudentInDB
 from app.infra.student.student_repository import StudentRepository
+from app.infra.dereference import select_related_raw
 from app.models.student import StudentModel
+from app.models.subject_evaluation import SubjectEvaluationModel
+from app.shared.utils.projection import get_projection
+from app.shared.utils.search import search_match
 
 
 class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
@@ -30,12 +28,14 @@ class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
         sort: str,
         subject_id: str,
         search: str | None = None,
+        fields: list[str] | None = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
         self.sort = sort
         self.subject_id = subject_id
         self.search = search
+        self.fields = fields
 
     @classmethod
     def builder(
@@ -45,6 +45,7 @@ class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
         sort: str,
         subject_id: str,
         search: str | None = None,
+        fields: list[str] | None = None,
     ) -> request_object.RequestObject:
         return ListSubjectEvaluationRequestObject(
             page_index=page_index,
@@ -52,6 +53,7 @@ class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
             search=search,
             sort=sort,
             subject_id=subject_id,
+            fields=fields,
         )
 
 
@@ -86,25 +88,27 @@ class ListSubjectEvaluationUseCase(use_case.UseCase):
             students: list[StudentModel] = self.student_repository.list(
                 match_pipeline={
                     "$or": [
-                        {"full_name": {"$regex": req_object.search, "$options": "i"}},
+                        search_match(req_object.search),
                         {"numerical_order": numerical_order},
                     ]
                 },
                 page_size=100,
+                projection={"_id": 1},
             )
             match_pipeline = {
                 **match_pipeline,
                 "student": {"$in": [student.id for student in students]},
             }
 
-        docs: list[SubjectEvaluationModel] = self.subject_evaluation_repository.list(
+        docs, total = self.subject_evaluation_repository.list_with_total(
             match_pipeline=match_pipeline,
             sort=req_object.sort,
             page_size=req_object.page_size,
             page_index=req_object.page_index,
+            projection=get_projection(req_object.fields, req_object.sort),
+            raw=True,
         )
-
-        total = self.subject_evaluation_repository.count_list(match_pipeline=match_pipeline)
+        select_related_raw(docs, SubjectEvaluationModel, "subject.lecturer", "student")
 
         return ManySubjectEvaluationAdminInResponse(
             pagination=Pagination(
@@ -112,25 +116,14 @@ class ListSubjectEvaluationUseCase(use_case.UseCase):
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
             ),
-            data=[
-                SubjectEvaluationAdmin(
-                    **SubjectEvaluationInDB.model_validate(subject_evaluation).model_dump(
-                        exclude={"student", "subject"}
-                    ),
-                    subject=SubjectInEvaluation(
-                        **SubjectInDB.model_validate(subject_evaluation.subject).model_dump(
-                            exclude=({"lecturer"})
-                        ),
-                        lecturer=LecturerInEvaluation(
-                            **LecturerInDB.model_validate(
-                                subject_evaluation.subject.lecturer
-                            ).model_dump()
-                        ),
-                    ),
-                    student=StudentInEvaluation(
-                        **StudentInDB.model_validate(subject_evaluation.student).model_dump()
-                    ),
-                )
-                for subject_evaluation in docs
-            ],
+            data=(
+                [
+                    PARTIAL_SUBJECT_EVALUATION_ADMIN_ADAPTER.validate_python(
+                        select_fields(doc, req_object.fields)
+                    )
+                    for doc in docs
+                ]
+                if req_object.fields
+                else [SUBJECT_EVALUATION_ADMIN_ADAPTER.validate_python(doc) for doc in docs]
+            ),
         )
@@ -14,6 +14,7 @@ from app.infra.subject.subject_evaluation_repository import SubjectEvaluationRep
 from app.domain.lecturer.entity import LecturerInDB
 from app.models.subject_evaluation import SubjectEvaluationModel
 from app.infra.student.student_repository import StudentRepository
+from app.infra.dereference import select_related
 from app.domain.student.entity import StudentInDB
 
 
@@ -51,6 +52,7 @@ class ListSubjectEvaluationByStudentUseCase(use_case.UseCase):
         docs: SubjectEvaluationModel = self.subject_evaluation_repository.list(
             match_pipeline={"student": req_object.current_student.id}
         )
+        select_related(docs, "subject.lecturer")
         return [
             (
                 SubjectEvaluationStudent(
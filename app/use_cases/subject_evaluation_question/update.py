@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.shared import request_object, use_case, response_object
 
@@ -51,14 +51,12 @@ class UpdateSubjectEvaluationQuestionRequestObject(request_object.ValidRequestOb
 class UpdateSubjectEvaluationQuestionUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_evaluation_question_repository: SubjectEvaluationQuestionRepository = Depends(
             SubjectEvaluationQuestionRepository
         ),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.subject_evaluation_question_repository = subject_evaluation_question_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateSubjectEvaluationQuestionRequestObject):
@@ -79,8 +77,7 @@ class UpdateSubjectEvaluationQuestionUseCase(use_case.UseCase):
         )
         subject_evaluation_question.reload()
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.SUBJECT_EVALUATION_QUESTION,
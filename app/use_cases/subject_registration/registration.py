@@ -1,12 +1,13 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectRegistrationInResponse
 from app.infra.subject.subject_registration_repository import SubjectRegistrationRepository
 from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.roll_call.roll_call_repository import RollCallRepository
 from app.models.subject import SubjectModel
 from app.models.student import StudentModel
 from app.models.admin import AdminModel
-from app.shared.utils.general import get_current_season_value
+from app.shared.utils.general import clear_student_roll_call_cache, get_current_season_value
 from app.infra.manage_form.manage_form_repository import ManageFormRepository
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
@@ -55,7 +56,6 @@ class SubjectRegistrationStudentRequestObject(request_object.ValidRequestObject)
 class SubjectRegistrationStudentCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         subject_registration_repository: SubjectRegistrationRepository = Depends(
@@ -63,13 +63,14 @@ class SubjectRegistrationStudentCase(use_case.UseCase):
         ),
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
+        roll_call_repository: RollCallRepository = Depends(RollCallRepository),
     ):
         self.subject_registration_repository = subject_registration_repository
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
+        self.roll_call_repository = roll_call_repository
 
     def process_request(self, req_object: SubjectRegistrationStudentRequestObject):
         is_student_request = True
@@ -115,11 +116,16 @@ class SubjectRegistrationStudentCase(use_case.UseCase):
             student_id=req_object.current_student.id, subject_ids=req_object.subjects
         )
         assert res, "Something went wrong"
+        self.roll_call_repository.refresh_summaries(
+            season=current_season, student_ids=[req_object.current_student.id]
+        )
+        clear_student_roll_call_cache(
+            season=current_season, student_ids=[req_object.current_student.id]
+        )
 
         # Add audit log for admin processing
         if not is_student_request and req_object.current_admin:
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.UPDATE,
                     endpoint=Endpoint.STUDENT,
@@ -0,0 +1,198 @@
+"""Micro-benchmark of the list rows, mongoengine hydration vs raw documents
+(app.domain.shared.mongo_adapter)
+
+Seeds an in-memory database (mongomock) with a page of students, their evaluations and
+absences of a subject, then builds the rows of the list endpoints from the same aggregate
+results with both paths: from_mongo, select_related and the XInDB/response models as the
+use cases did, or select_related_raw and the TypeAdapter of the response model. Checks that
+they give the same documents, and reports ms per page. The loading of the references is in
+both timings; mongomock is far slower than a server, so it is a bound of the hydration gain.
+Usage: python -m benchmarks.hydration [--page-size 500] [--repeat 10]
+"""
+
+import argparse
+import copy
+import time
+from datetime import date, datetime, timezone
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.domain.absent.entity import ADMIN_ABSENT_ADAPTER, AbsentInDB, AdminAbsentInResponse
+from app.domain.lecturer.entity import LecturerInDB
+from app.domain.student.entity import STUDENT_ADAPTER, Student, StudentInDB
+from app.domain.subject.entity import SubjectInDB
+from app.domain.subject.subject_evaluation.entity import (
+    SUBJECT_EVALUATION_ADMIN_ADAPTER,
+    LecturerInEvaluation,
+    StudentInEvaluation,
+    SubjectEvaluationAdmin,
+    SubjectEvaluationInDB,
+    SubjectInEvaluation,
+)
+from app.domain.subject.subject_evaluation.enum import QualityValueEnum
+from app.infra.dereference import select_related, select_related_raw
+from app.models.absent import AbsentModel
+from app.models.lecturer import LecturerModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.subject import SubjectModel
+from app.models.subject_evaluation import QualityDocument, SubjectEvaluationModel
+
+
+def seed(page_size: int) -> None:
+    now = datetime.now(timezone.utc)
+    lecturer = LecturerModel(title="Cha", holy_name="Phêrô", full_name="Nguyễn Văn Giảng").save()
+    subject = SubjectModel(
+        title="Môn học",
+        start_at=date(2024, 3, 27),
+        subdivision="Kinh Thánh",
+        code="KT01",
+        status="init",
+        lecturer=lecturer,
+        season=3,
+        created_at=now,
+        updated_at=now,
+    ).save()
+    for i in range(page_size):
+        student = StudentModel(
+            seasons_info=[SeasonInfo(numerical_order=i + 1, group=i % 20, season=3)],
+            email=f"student{i}@example.com",
+            holy_name="Maria",
+            full_name=f"trần thị  học viên {i}",
+            date_of_birth=date(2000, 1, 1),
+            diocese="Sài Gòn",
+            note="Ghi chú " * 10,
+            password="password",
+            status="active",
+            created_at=now,
+            updated_at=now,
+        ).save()
+        SubjectEvaluationModel(
+            student=student,
+            subject=subject,
+            quality=QualityDocument(
+                focused_right_topic=QualityValueEnum.AGREE,
+                practical_content=QualityValueEnum.AGREE,
+                benefit_in_life=QualityValueEnum.STRONGLY_AGREE,
+                duration=QualityValueEnum.NEUTRAL,
+                method=QualityValueEnum.AGREE,
+            ),
+            most_resonated="Bài giảng",
+            invited="Có",
+            feedback_lecturer="Cảm ơn cha",
+            satisfied=5,
+            numerical_order=i + 1,
+            created_at=now,
+            updated_at=now,
+        ).save()
+        AbsentModel(
+            student=student,
+            subject=subject,
+            reason="Bận việc",
+            status=True,
+            created_by="HV",
+            created_at=now,
+            updated_at=now,
+        ).save()
+
+
+def students_hydrated(docs: list[dict]) -> list[Student]:
+    models = [StudentModel.from_mongo(doc) for doc in docs]
+    return [Student(**StudentInDB.model_validate(model).model_dump()) for model in models]
+
+
+def students_raw(docs: list[dict]) -> list[Student]:
+    return [STUDENT_ADAPTER.validate_python(doc) for doc in docs]
+
+
+def _subject_in_evaluation(subject: SubjectModel) -> SubjectInEvaluation:
+    return SubjectInEvaluation(
+        **SubjectInDB.model_validate(subject).model_dump(exclude=({"lecturer"})),
+        lecturer=LecturerInEvaluation(**LecturerInDB.model_validate(subject.lecturer).model_dump()),
+    )
+
+
+def evaluations_hydrated(docs: list[dict]) -> list[SubjectEvaluationAdmin]:
+    models = [SubjectEvaluationModel.from_mongo(doc) for doc in docs]
+    select_related(models, "subject.lecturer", "student")
+    return [
+        SubjectEvaluationAdmin(
+            **SubjectEvaluationInDB.model_validate(model).model_dump(
+                exclude={"student", "subject"}
+            ),
+            subject=_subject_in_evaluation(model.subject),
+            student=StudentInEvaluation(**StudentInDB.model_validate(model.student).model_dump()),
+        )
+        for model in models
+    ]
+
+
+def evaluations_raw(docs: list[dict]) -> list[SubjectEvaluationAdmin]:
+    select_related_raw(docs, SubjectEvaluationModel, "subject.lecturer", "student")
+    return [SUBJECT_EVALUATION_ADMIN_ADAPTER.validate_python(doc) for doc in docs]
+
+
+def absents_hydrated(docs: list[dict]) -> list[AdminAbsentInResponse]:
+    models = [AbsentModel.from_mongo(doc) for doc in docs]
+    select_related(models, "subject.lecturer", "student")
+    return [
+        AdminAbsentInResponse(
+            **AbsentInDB.model_validate(model).model_dump(exclude={"student", "subject"}),
+            subject=_subject_in_evaluation(model.subject),
+            student=Student(**StudentInDB.model_validate(model.student).model_dump()),
+        )
+        for model in models
+    ]
+
+
+def absents_raw(docs: list[dict]) -> list[AdminAbsentInResponse]:
+    select_related_raw(docs, AbsentModel, "subject.lecturer", "student")
+    return [ADMIN_ABSENT_ADAPTER.validate_python(doc) for doc in docs]
+
+
+def benchmark(docs: list[dict], hydrated, raw, repeat: int) -> tuple[float, float, bool]:
+    """
+    :return: (ms with mongoengine, ms with the raw documents, same documents)
+    """
+    # both paths consume their documents (from_mongo pops _id, the references are replaced)
+    same = [row.model_dump(mode="json") for row in hydrated(copy.deepcopy(docs))] == [
+        row.model_dump(mode="json") for row in raw(copy.deepcopy(docs))
+    ]
+
+    timings = []
+    for build in (hydrated, raw):
+        pages = [copy.deepcopy(docs) for _ in range(repeat)]
+        start = time.perf_counter()
+        for page in pages:
+            build(page)
+        timings.append((time.perf_counter() - start) * 1000 / repeat)
+    return timings[0], timings[1], same
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    disconnect()
+    connect(
+        "hydration-benchmark", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+    )
+    seed(args.page_size)
+
+    print(f"{'page':<28} {'mongoengine ms':>14} {'raw ms':>8} {'speedup':>8} {'same docs':>9}")
+    for name, model, hydrated, raw in (
+        ("students", StudentModel, students_hydrated, students_raw),
+        ("subject evaluations", SubjectEvaluationModel, evaluations_hydrated, evaluations_raw),
+        ("absents", AbsentModel, absents_hydrated, absents_raw),
+    ):
+        docs = list(model._get_collection().find())
+        slow, fast, same = benchmark(docs, hydrated, raw, args.repeat)
+        name = f"{args.page_size} {name}"
+        print(f"{name:<28} {slow:>14.2f} {fast:>8.2f} {slow / fast:>7.1f}x {str(same):>9}")
+    disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Micro-benchmark of the JSON responses, jsonable_encoder path vs FastJSONResponse
+
+Serializes our largest responses (roll call results of a season, a page of 500 students)
+with both paths, checks that they give the same documents, and reports ms per response.
+Usage: python -m benchmarks.json_response [--students 300] [--subjects 30] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+from datetime import date, datetime, timezone
+
+from app.domain.absent.enum import AbsentType
+from app.domain.roll_call.entity import StudentRollCallResult, StudentRollCallResultInResponse
+from app.domain.shared.entity import Pagination
+from app.domain.student.entity import ManyStudentsInResponse, Student, StudentSeason
+from app.shared.json_response import render_json, render_json_compat
+
+
+def roll_call_results(students: int, subjects: int) -> StudentRollCallResultInResponse:
+    subject_ids = [f"{i:024x}" for i in range(subjects)]
+    return StudentRollCallResultInResponse(
+        data=[
+            StudentRollCallResult(
+                id=f"{i:024x}",
+                numerical_order=i + 1,
+                holy_name="Giuse",
+                full_name=f"Nguyễn Văn Học Viên {i}",
+                subjects={
+                    subject_id: {
+                        "attend_zoom": (i + j) % 3 != 0,
+                        "evaluation": (i + j) % 4 != 0,
+                        "absent_type": AbsentType.NO_ATTEND if (i + j) % 7 == 0 else None,
+                    }
+                    for j, subject_id in enumerate(subject_ids)
+                },
+                subject_completed=subjects // 2,
+                subject_not_completed=subjects // 2,
+                subject_registered=subjects,
+            )
+            for i in range(students)
+        ],
+        summary={
+            subject_id: {"completed": students // 2, "no_complete": students // 2}
+            for subject_id in subject_ids
+        },
+    )
+
+
+def students_page(students: int) -> ManyStudentsInResponse:
+    now = datetime.now(timezone.utc)
+    return ManyStudentsInResponse(
+        pagination=Pagination(total=students, page_index=1, total_pages=1),
+        data=[
+            Student(
+                id=f"{i:024x}",
+                holy_name="Maria",
+                full_name=f"Trần Thị Học Viên {i}",
+                email=f"student{i}@example.com",
+                date_of_birth=date(2000, 1, 1),
+                diocese="Sài Gòn",
+                note="Ghi chú " * 10,
+                seasons_info=[StudentSeason(numerical_order=i + 1, group=i % 20, season=3)],
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(students)
+        ],
+    )
+
+
+def benchmark(content, repeat: int) -> tuple[float, float, bool]:
+    """
+    :return: (ms with jsonable_encoder, ms with FastJSONResponse, same bytes)
+    """
+    compat, fast = render_json_compat(content), render_json(content)
+    assert json.loads(compat) == json.loads(fast), "the two paths give different documents"
+
+    timings = []
+    for render in (render_json_compat, render_json):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            render(content)
+        timings.append((time.perf_counter() - start) * 1000 / repeat)
+    return timings[0], timings[1], compat == fast
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--subjects", type=int, default=30, help="subjects of the season")
+    parser.add_argument("--page-size", type=int, default=500, help="students of a list page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'response':<28} {'jsonable ms':>11} {'fast ms':>8} {'speedup':>8} {'same bytes':>10}")
+    for name, content in (
+        (
+            f"roll call {args.students}x{args.subjects}",
+            roll_call_results(args.students, args.subjects),
+        ),
+        (f"students page {args.page_size}", students_page(args.page_size)),
+        (f"list of {args.page_size} students", students_page(args.page_size).data),
+    ):
+        compat, fast, same = benchmark(content, args.repeat)
+        print(f"{name:<28} {compat:>11.2f} {fast:>8.2f} {compat / fast:>7.1f}x {str(same):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Micro-benchmark of bcrypt, to size the password hashing pool of the login tier
+
+Reports hashes/sec at each cost factor, in one process and on a pool of processes.
+Usage: python -m benchmarks.password_hash [--rounds 10 11 12] [--hashes 20]
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.hash import bcrypt
+
+PASSWORD = "benchmark-password"
+
+
+def _hash(rounds: int) -> str:
+    return bcrypt.using(rounds=rounds).hash(PASSWORD)
+
+
+def benchmark(rounds: int, hashes: int, pool: ProcessPoolExecutor, workers: int):
+    """
+    :return: (hashes/sec in one process, hashes/sec on the pool)
+    """
+    start = time.perf_counter()
+    for _ in range(hashes):
+        _hash(rounds)
+    single = hashes / (time.perf_counter() - start)
+
+    list(pool.map(_hash, [rounds] * workers))  # warm up every process
+    start = time.perf_counter()
+    list(pool.map(_hash, [rounds] * hashes))
+    pooled = hashes / (time.perf_counter() - start)
+    return single, pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--hashes", type=int, default=20, help="hashes per cost factor")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f"{'rounds':>6} {'ms/hash':>8} {'hashes/s':>9} {f'hashes/s ({args.workers} procs)':>22}")
+    with ProcessPoolExecutor(
+        max_workers=args.workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        for rounds in args.rounds:
+            single, pooled = benchmark(rounds, args.hashes, pool, args.workers)
+            print(f"{rounds:>6} {1000 / single:>8.1f} {single:>9.2f} {pooled:>22.2f}")
+
+
+if __name__ == "__main__":
+    main()
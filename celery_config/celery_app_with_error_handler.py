@@ -2,7 +2,7 @@ import json
 import traceback
 from functools import wraps
 
-from celery.exceptions import Ignore
+from celery.exceptions import Ignore, Retry
 
 from app.domain.celery_result.enum import CeleryResultTag
 from celery_config.celery_worker import celery_app, logger
@@ -22,6 +22,9 @@ def celery_app_with_error_handler(tag: CeleryResultTag = CeleryResultTag.DEFAULT
         def wrapper(self, *args, **kwargs):
             try:
                 return task_func(*args, **kwargs)
+            except Retry:
+                # rescheduled (e.g. rate limited), not a failure
+                raise
             except Exception as ex:
                 logger.exception(ex)
                 metadata = {
@@ -3,10 +3,17 @@ import os
 from logging.handlers import TimedRotatingFileHandler
 
 from celery import Celery
-from celery.signals import after_setup_logger, worker_process_init, worker_process_shutdown
+from celery.signals import (
+    after_setup_logger,
+    before_task_publish,
+    task_prerun,
+    worker_process_init,
+    worker_process_shutdown,
+)
 
 from app.config import CeleryConfig, settings
 from app.config.database import connect, disconnect
+from celery_config.queue_metrics import ENQUEUED_AT_HEADER, record_wait, stamp_enqueued_at
 
 logger = logging.getLogger(__name__)
 
@@ -49,3 +56,17 @@ def connect_db(**kwargs):
 @worker_process_shutdown.connect
 def disconnect_db(**kwargs):
     disconnect()
+
+
+@before_task_publish.connect
+def stamp_task_enqueued_at(headers=None, **kwargs):
+    if headers is not None:
+        stamp_enqueued_at(headers)
+
+
+@task_prerun.connect
+def record_task_queue_wait(task=None, **kwargs):
+    enqueued_at = task.request.get(ENQUEUED_AT_HEADER)
+    queue = (task.request.delivery_info or {}).get("routing_key")
+    if enqueued_at and queue:
+        record_wait(queue, float(enqueued_at))
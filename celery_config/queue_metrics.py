@@ -0,0 +1,82 @@
+"""Depth and wait time of the celery queues
+
+The publisher stamps each message with its enqueue time, the worker records the time the
+message waited in its queue when the task starts.
+"""
+
+import logging
+import time
+
+from amqp.exceptions import NotFound
+
+from app.config import CELERY_QUEUES
+from app.config.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+
+def get_queue_wait_redis_key(queue: str) -> str:
+    return f"celery:queue:{queue}:wait"
+
+
+def stamp_enqueued_at(headers: dict) -> None:
+    headers[ENQUEUED_AT_HEADER] = time.time()
+
+
+def record_wait(queue: str, enqueued_at: float) -> None:
+    wait = max(0.0, time.time() - enqueued_at)
+    key = get_queue_wait_redis_key(queue)
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.hincrby(key, "count", 1)
+        pipe.hincrbyfloat(key, "total_seconds", wait)
+        pipe.hset(key, "last_seconds", wait)
+        pipe.execute()
+    except Exception as ex:
+        # metrics never fail a task
+        logger.warning(f"Cannot record the wait time of queue {queue}: {ex}")
+
+
+def get_queue_depths(celery_app) -> dict[str, tuple[int, int]]:
+    """(messages ready, consumers) of each queue, from a passive declare on the broker"""
+    depths = {}
+    with celery_app.connection_for_read() as conn:
+        for queue in CELERY_QUEUES:
+            channel = conn.channel()
+            try:
+                _, depth, consumers = channel.queue_declare(queue=queue, passive=True)
+                depths[queue] = (depth, consumers)
+            except NotFound:
+                # not declared yet: no worker ever consumed it
+                pass
+            finally:
+                if channel.is_open:
+                    channel.close()
+    return depths
+
+
+def get_queue_metrics(celery_app) -> list[dict]:
+    depths = get_queue_depths(celery_app)
+    redis_client = get_redis_client()
+    metrics = []
+    for queue in CELERY_QUEUES:
+        wait = redis_client.hgetall(get_queue_wait_redis_key(queue))
+        wait = {
+            (key.decode() if isinstance(key, bytes) else key): float(value)
+            for key, value in wait.items()
+        }
+        count = int(wait.get("count", 0))
+        depth, consumers = depths.get(queue, (None, None))
+        metrics.append(
+            dict(
+                queue=queue,
+                depth=depth,
+                consumers=consumers,
+                tasks_started=count,
+                avg_wait_seconds=wait["total_seconds"] / count if count else None,
+                last_wait_seconds=wait.get("last_seconds"),
+            )
+        )
+    return metrics
@@ -0,0 +1,3 @@
+# ms per list page (students, subject evaluations, absents), mongoengine hydration vs raw documents
+# Usage: sh scripts/benchmark-hydration.sh [--page-size 500] [--repeat 10]
+python -m benchmarks.hydration "$@"
@@ -0,0 +1,3 @@
+# ms per response of the largest responses, jsonable_encoder path vs FastJSONResponse
+# Usage: sh scripts/benchmark-json-response.sh [--students 300] [--subjects 30] [--repeat 20]
+python -m benchmarks.json_response "$@"
@@ -0,0 +1,3 @@
+# bcrypt hashes/sec at each cost factor, to size PASSWORD_HASH_WORKERS / PASSWORD_BCRYPT_ROUNDS
+# Usage: sh scripts/benchmark-password-hash.sh [--rounds 10 11 12] [--hashes 20] [--workers 4]
+python -m benchmarks.password_hash "$@"
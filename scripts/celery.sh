@@ -1,6 +1,11 @@
 # Run worker and beat // Don't run on Windows
+# Consumes every queue (mail_critical, mail_bulk, drive, periodic, celery)
 celery -A celery_config.celery_worker worker -B --loglevel=INFO
 
+# Or a low latency worker for OTP / password / account mails beside a bulk worker:
+# celery -A celery_config.celery_worker worker -Q mail_critical -n critical@%h --concurrency=2 --prefetch-multiplier=1 --loglevel=INFO
+# celery -A celery_config.celery_worker worker -B -Q mail_bulk,drive,periodic,celery -n bulk@%h --loglevel=INFO
+
 
 # On windows,run two commands below
 # celery -A celery_config.celery_worker worker --loglevel=INFO
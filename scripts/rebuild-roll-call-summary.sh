@@ -0,0 +1,3 @@
+# Backfill the materialized roll call summaries of a season (default to the current season)
+# Usage: sh scripts/rebuild-roll-call-summary.sh [season]
+celery -A celery_config.celery_worker call app.infra.tasks.roll_call.rebuild_roll_call_summary_task --args="[${1:-null}]"
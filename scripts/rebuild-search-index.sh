@@ -0,0 +1,3 @@
+# Backfill the search index of the students, lecturers, documents and general tasks
+# Usage: sh scripts/rebuild-search-index.sh
+celery -A celery_config.celery_worker call app.infra.tasks.search_index.rebuild_search_index_task
@@ -1,10 +1,17 @@
+import threading
 import unittest
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 from app.main import app
+import fakeredis
 import mongomock
+from passlib.hash import bcrypt
+from app.config import settings
+from app.infra.security import password_hasher
 from app.infra.security.security_service import get_password_hash, verify_password
 from app.models.admin import AdminModel
+from app.infra.admin.admin_repository import AdminRepository
+from app.infra.security.principal_cache import PrincipalCache
 from app.models.reset_otp import ResetOTPModel
 from unittest.mock import patch
 from app.domain.auth.entity import TokenData
@@ -206,3 +213,80 @@ class TestAuthAdminApi(unittest.TestCase):
             )
             assert r.status_code == 400
             assert r.json().get("detail") == "Token không hợp lệ hoặc đã hết hạn"
+
+    @pytest.mark.order(11)
+    def test_admin_principal_cache(self):
+        with patch.object(settings, "AUTH_PRINCIPAL_CACHE_TTL", 30):
+            admin_principal_cache = PrincipalCache("admin")
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch(
+            "app.infra.security.security_service.admin_principal_cache", admin_principal_cache
+        ), patch(
+            "app.infra.admin.admin_repository.admin_principal_cache", admin_principal_cache
+        ), patch(
+            # invalidations are published to the other processes (see test_principal_cache)
+            "app.infra.security.principal_cache.get_redis_client",
+            return_value=fakeredis.FakeStrictRedis(),
+        ), patch.object(admin_principal_cache._listener, "start"):
+            mock_token.return_value = TokenData(email=self.user.email)
+            with patch(
+                "app.infra.admin.admin_repository.AdminRepository.get_by_email",
+                wraps=AdminRepository().get_by_email,
+            ) as mock_get_by_email:
+                for _ in range(2):
+                    r = self.client.get(
+                        "/api/v1/admins/me",
+                        headers={
+                            "Authorization": "Bearer {}".format("xxx"),
+                        },
+                    )
+                    assert r.status_code == 200
+                    assert r.json()["full_name"] == "Nguyen Thanh Tam"
+                assert mock_get_by_email.call_count == 1
+
+                # an update of the account drops the cached principal
+                AdminRepository().update(id=self.user.id, data={"full_name": "Nguyen Van B"})
+                r = self.client.get(
+                    "/api/v1/admins/me",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert r.json()["full_name"] == "Nguyen Van B"
+                assert mock_get_by_email.call_count == 2
+
+    @pytest.mark.order(12)
+    def test_admin_login_rehash_password(self):
+        admin: AdminModel = AdminModel(
+            status="active",
+            roles=["admin"],
+            holy_name="Rehash",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="rehash@example.com",
+            full_name="Rehash User",
+            password=bcrypt.using(rounds=4).hash("password"),
+        ).save()
+
+        r = self.client.post(
+            "/api/v1/admin/auth/login",
+            data={"username": "rehash@example.com", "password": "password"},
+        )
+        assert r.status_code == 200
+
+        # hashed again with the bcrypt cost of the settings
+        admin.reload()
+        assert admin.password.startswith(f"$2b${settings.PASSWORD_BCRYPT_ROUNDS}$")
+        assert verify_password("password", admin.password)
+
+    @pytest.mark.order(13)
+    def test_admin_login_password_hasher_busy(self):
+        with patch.object(password_hasher, "_pending", threading.BoundedSemaphore(1)) as pending:
+            pending.acquire()
+            r = self.client.post(
+                "/api/v1/admin/auth/login",
+                data={"username": "user@example.com", "password": "local@local"},
+            )
+            assert r.status_code == 503
+            assert r.headers["Retry-After"] == "1"
@@ -2,9 +2,11 @@ import time
 import unittest
 from unittest.mock import patch
 
+import fakeredis
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 
+from app.config import settings
 from app.main import app
 import mongomock
 
@@ -14,6 +16,7 @@ from app.infra.security.security_service import (
     get_password_hash,
 )
 from app.models.lecturer import LecturerModel
+from app.infra.lecturer.lecturer_repository import LecturerRepository
 from app.models.subject import SubjectModel
 from app.models.season import SeasonModel
 from app.models.audit_log import AuditLogModel
@@ -167,6 +170,38 @@ class TestLecturerApi(unittest.TestCase):
             resp = r.json()
             assert resp["pagination"]["total"] == 2
 
+    def test_get_lecturers_by_cursor(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user2.email)
+            # same full_name: the pages are ordered by the _id tie breaker
+            ids, after = [], None
+            for _ in range(LecturerModel.objects().count() + 1):
+                r = self.client.get(
+                    "/api/v1/lecturers",
+                    params={"page_size": 1, "sort_by": "full_name", "sort": "ascend"}
+                    | ({"after": after} if after else {}),
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                resp = r.json()
+                ids.extend(lecturer["id"] for lecturer in resp["data"])
+                after = resp["pagination"]["next_cursor"]
+                if not after:
+                    break
+            assert after is None
+            assert ids == sorted(str(lecturer.id) for lecturer in LecturerModel.objects())
+
+            r = self.client.get(
+                "/api/v1/lecturers",
+                params={"after": "invalid"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 400
+
     def test_get_lecturer_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
             mock_token.return_value = TokenData(email=self.user2.email)
@@ -181,6 +216,112 @@ class TestLecturerApi(unittest.TestCase):
             assert doc.holy_name == self.lecturer.holy_name
             assert doc.full_name == self.lecturer.full_name
 
+    def test_search_lecturers(self):
+        lecturer = LecturerModel(
+            title="Cha",
+            holy_name="Giuse",
+            full_name="Trần Văn Đức",
+            information="string",
+            contact="string",
+        ).save()
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user1.email)
+            # without diacritics, any order, prefixes of the words
+            r = self.client.get(
+                "/api/v1/lecturers",
+                params={"search": "duc TRAN gius"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert resp["pagination"]["total"] == 1
+            assert resp["data"][0]["id"] == str(lecturer.id)
+
+            # the index follows the updates
+            assert LecturerRepository().update(lecturer.id, {"full_name": "Trần Minh Đức"})
+            r = self.client.get(
+                "/api/v1/lecturers",
+                params={"search": "minh giuse"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert [doc["id"] for doc in r.json()["data"]] == [str(lecturer.id)]
+
+            # whole words before prefixes, then the newest first
+            whole_word = LecturerModel(title="Cha", full_name="Lê Vĩnh").save()
+            prefix = LecturerModel(title="Cha", full_name="Hoàng Vinhson").save()
+            r = self.client.get(
+                "/api/v1/lecturers",
+                params={"search": "vinh"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert [doc["id"] for doc in r.json()["data"]] == [str(whole_word.id), str(prefix.id)]
+        for doc in (lecturer, whole_word, prefix):
+            doc.delete()
+
+    def test_get_lecturer_cached(self):
+        lecturer = LecturerModel(title="Cha", full_name="Nguyen Van Cache").save()
+        with (
+            patch("app.infra.security.security_service.verify_token") as mock_token,
+            patch.object(settings, "RESPONSE_CACHE_TTL", 60 * 60),
+            patch(
+                "app.infra.response_cache.get_redis_client",
+                return_value=fakeredis.FakeStrictRedis(),
+            ),
+        ):
+            mock_token.return_value = TokenData(email=self.user2.email)
+            r = self.client.get(
+                f"/api/v1/lecturers/{lecturer.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert r.json()["full_name"] == "Nguyen Van Cache"
+            etag = r.headers["etag"]
+
+            # unchanged: 304 without body
+            r = self.client.get(
+                f"/api/v1/lecturers/{lecturer.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                    "If-None-Match": etag,
+                },
+            )
+            assert r.status_code == 304
+            assert r.content == b""
+
+            # a write outside the repositories is not seen before the TTL
+            LecturerModel.objects(id=lecturer.id).update_one(full_name="Nguyen Van Direct")
+            r = self.client.get(
+                f"/api/v1/lecturers/{lecturer.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.json()["full_name"] == "Nguyen Van Cache"
+
+            # the writes of the repository invalidate the cached responses
+            assert LecturerRepository().update(lecturer.id, {"full_name": "Nguyen Van Moi"})
+            r = self.client.get(
+                f"/api/v1/lecturers/{lecturer.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                    "If-None-Match": etag,
+                },
+            )
+            assert r.status_code == 200
+            assert r.json()["full_name"] == "Nguyen Van Moi"
+            assert r.headers["etag"] != etag
+        lecturer.delete()
+
     def test_update_lecturer_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
             mock_token.return_value = TokenData(email=self.user1.email)
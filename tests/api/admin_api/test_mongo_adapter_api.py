@@ -0,0 +1,241 @@
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import mongomock
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+
+from app.domain.absent.entity import AbsentInDB, AdminAbsentInResponse
+from app.domain.admin.entity import AdminInDB
+from app.domain.document.entity import AdminInDocument, Document, DocumentInDB
+from app.domain.lecturer.entity import Lecturer, LecturerInDB
+from app.domain.student.entity import Student, StudentInDB
+from app.domain.subject.entity import Subject, SubjectInDB
+from app.domain.subject.subject_evaluation.entity import (
+    LecturerInEvaluation,
+    StudentInEvaluation,
+    SubjectEvaluationAdmin,
+    SubjectEvaluationInDB,
+    SubjectInEvaluation,
+)
+from app.infra.security.security_service import TokenData, get_password_hash
+from app.main import app
+from app.models.absent import AbsentModel
+from app.models.admin import AdminModel
+from app.models.document import DocumentModel
+from app.models.lecturer import LecturerModel
+from app.models.season import SeasonModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.subject import SubjectModel
+from app.models.subject_evaluation import SubjectEvaluationModel
+
+# the rows of the list endpoints as the use cases built them before the raw documents:
+# mongoengine documents, their XInDB models, then the response models
+
+
+def subject_hydrated(subject: SubjectModel) -> Subject:
+    return Subject(
+        **SubjectInDB.model_validate(subject).model_dump(exclude=({"lecturer", "attachments"})),
+        lecturer=Lecturer(**LecturerInDB.model_validate(subject.lecturer).model_dump()),
+        attachments=[
+            Document(
+                **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
+                author=AdminInDocument(**AdminInDB.model_validate(doc.author).model_dump()),
+            )
+            for doc in subject.attachments
+        ],
+    )
+
+
+def subject_in_evaluation_hydrated(subject: SubjectModel) -> SubjectInEvaluation:
+    return SubjectInEvaluation(
+        **SubjectInDB.model_validate(subject).model_dump(exclude=({"lecturer"})),
+        lecturer=LecturerInEvaluation(**LecturerInDB.model_validate(subject.lecturer).model_dump()),
+    )
+
+
+def evaluation_hydrated(evaluation: SubjectEvaluationModel) -> SubjectEvaluationAdmin:
+    return SubjectEvaluationAdmin(
+        **SubjectEvaluationInDB.model_validate(evaluation).model_dump(
+            exclude={"student", "subject"}
+        ),
+        subject=subject_in_evaluation_hydrated(evaluation.subject),
+        student=StudentInEvaluation(**StudentInDB.model_validate(evaluation.student).model_dump()),
+    )
+
+
+def absent_hydrated(absent: AbsentModel) -> AdminAbsentInResponse:
+    return AdminAbsentInResponse(
+        **AbsentInDB.model_validate(absent).model_dump(exclude={"student", "subject"}),
+        subject=subject_in_evaluation_hydrated(absent.subject),
+        student=Student(**StudentInDB.model_validate(absent.student).model_dump()),
+    )
+
+
+class TestMongoAdapterApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        now = datetime(2024, 3, 20, 8, 30, tzinfo=timezone.utc)
+        SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.admin = AdminModel(
+            status="active",
+            roles=["admin"],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="admin@example.com",
+            full_name="Nguyen Van Quan Tri",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        lecturer = LecturerModel(title="Cha", holy_name="Phanxico", full_name="Giang Vien").save()
+        document = DocumentModel(
+            file_id="file-0",
+            mimeType="image/jpeg",
+            name="Tài liệu",
+            role="bhv",
+            type="common",
+            label=["string"],
+            season=3,
+            author=cls.admin,
+        ).save()
+        cls.subject = SubjectModel(
+            title="Môn học",
+            start_at=date(2024, 3, 27),
+            subdivision="string",
+            code="KT01",
+            status="init",
+            lecturer=lecturer,
+            season=3,
+            attachments=[document],
+            created_at=now,
+            updated_at=now,
+        ).save()
+        # a DateField is stored as a datetime, here with a time of day (written by a script)
+        SubjectModel._get_collection().update_one(
+            {"_id": cls.subject.id}, {"$set": {"start_at": datetime(2024, 3, 27, 7, 30)}}
+        )
+        cls.students = [
+            StudentModel(
+                seasons_info=[SeasonInfo(numerical_order=i + 1, group=1, season=3)],
+                status="active",
+                holy_name="Maria",
+                phone_number="0123456789",
+                email=f"student{i}@example.com",
+                # not normalized in the database
+                full_name=f"  trần thị  học viên {i}",
+                date_of_birth=date(2000, 1, i + 1),
+                password=get_password_hash(password="local@local"),
+                created_at=now,
+                updated_at=now,
+            ).save()
+            for i in range(3)
+        ]
+        for i, student in enumerate(cls.students):
+            SubjectEvaluationModel(
+                quality={
+                    "focused_right_topic": "Trung lập",
+                    "practical_content": "Đồng ý",
+                    "benefit_in_life": "Hoàn toàn đồng ý",
+                    "duration": "Hoàn toàn đồng ý",
+                    "method": "Hoàn toàn đồng ý",
+                },
+                most_resonated="Bài giảng",
+                invited="Sống",
+                feedback_lecturer="Cảm ơn",
+                satisfied=8,
+                subject=cls.subject,
+                student=student,
+                numerical_order=i + 1,
+                created_at=now,
+                updated_at=now,
+            ).save()
+            AbsentModel(
+                student=student,
+                subject=cls.subject,
+                reason="Bận việc",
+                status=True,
+                created_by="HV",
+                created_at=now,
+                updated_at=now,
+            ).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def get(self, url: str, **params) -> dict | list:
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            r = self.client.get(
+                url,
+                params=params,
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+        assert r.status_code == 200
+        return r.json()
+
+    def assert_same_rows(self, rows: list[dict], hydrated: list) -> None:
+        expected = {row["id"]: row for row in jsonable_encoder(hydrated, by_alias=True)}
+        assert len(rows) == len(expected)
+        for row in rows:
+            assert row == expected[row["id"]]
+
+    def test_students(self):
+        resp = self.get("/api/v1/students")
+        self.assert_same_rows(
+            resp["data"],
+            [
+                Student(**StudentInDB.model_validate(student).model_dump())
+                for student in StudentModel.objects()
+            ],
+        )
+        # validate_name of the raw full names, mongo_date of the dates of birth
+        student = next(row for row in resp["data"] if row["email"] == "student0@example.com")
+        assert student["full_name"] == "Trần Thị Học Viên 0"
+        assert student["date_of_birth"] == "2000-01-01"
+
+    def test_subjects(self):
+        resp = self.get("/api/v1/subjects")
+        self.assert_same_rows(
+            resp, [subject_hydrated(subject) for subject in SubjectModel.objects()]
+        )
+        # mongo_date of start_at, the references loaded by select_related_raw
+        assert resp[0]["start_at"] == "2024-03-27"
+        assert resp[0]["lecturer"]["full_name"] == "Giang Vien"
+        assert resp[0]["attachments"][0]["author"]["id"] == str(self.admin.id)
+
+    def test_subject_evaluations(self):
+        resp = self.get("/api/v1/subjects/evaluations", subject_id=str(self.subject.id))
+        self.assert_same_rows(
+            resp["data"],
+            [evaluation_hydrated(evaluation) for evaluation in SubjectEvaluationModel.objects()],
+        )
+        assert {row["student"]["full_name"] for row in resp["data"]} == {
+            f"Trần Thị Học Viên {i}" for i in range(3)
+        }
+        assert {row["subject"]["lecturer"]["full_name"] for row in resp["data"]} == {"Giang Vien"}
+
+    def test_absents(self):
+        resp = self.get(f"/api/v1/absents/{self.subject.id}")
+        self.assert_same_rows(resp, [absent_hydrated(absent) for absent in AbsentModel.objects()])
+        assert {row["student"]["date_of_birth"] for row in resp} == {
+            f"2000-01-0{i + 1}" for i in range(3)
+        }
+        assert {row["subject"]["lecturer"]["full_name"] for row in resp} == {"Giang Vien"}
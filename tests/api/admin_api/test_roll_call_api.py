@@ -0,0 +1,343 @@
+import unittest
+import fakeredis
+import pytest
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+from mongoengine import connect, disconnect
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+import mongomock
+
+from app.models.admin import AdminModel
+from app.infra.security.security_service import (
+    TokenData,
+    get_password_hash,
+)
+from app.models.lecturer import LecturerModel
+from app.models.subject import SubjectModel
+from app.models.season import SeasonModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.absent import AbsentModel
+from app.models.subject_evaluation import SubjectEvaluationModel
+from app.models.subject_registration import SubjectRegistrationModel
+from app.domain.absent.enum import AbsentType
+from app.infra.roll_call.roll_call_repository import RollCallRepository
+from app.models.roll_call_summary import RollCallSummaryModel
+
+
+class TestRollCallApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        cls.season: SeasonModel = SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.admin: AdminModel = AdminModel(
+            status="active",
+            roles=[
+                "bkl",
+            ],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="user1@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        cls.lecturer: LecturerModel = LecturerModel(
+            title="Cha",
+            holy_name="Phanxico",
+            full_name="Nguyen Van A",
+            information="Thạc sĩ thần học",
+            contact="Phone: 012345657",
+        ).save()
+        cls.subjects: list[SubjectModel] = [
+            SubjectModel(
+                title=f"Môn học {idx}",
+                start_at=f"2024-03-2{idx}",
+                subdivision="string",
+                code="string",
+                question_url="string",
+                zoom={"meeting_id": 0, "pass_code": "string", "link": "string"},
+                documents_url=["string"],
+                status=status,
+                lecturer=cls.lecturer,
+                season=3,
+            ).save()
+            for idx, status in enumerate(["completed", "completed", "init"], start=1)
+        ]
+        cls.students: list[StudentModel] = [
+            StudentModel(
+                seasons_info=[
+                    SeasonInfo(
+                        numerical_order=idx,
+                        group=1,
+                        season=3,
+                    )
+                ],
+                status="active",
+                holy_name="Martin",
+                phone_number="0123456789",
+                email=f"student{idx}@example.com",
+                full_name="Nguyen Thanh Tam",
+                password="local@local",
+            ).save()
+            for idx in range(1, 4)
+        ]
+        subject1, subject2, subject3 = cls.subjects
+        student1, student2, student3 = cls.students
+        for student, subject, attend_zoom in [
+            (student1, subject1, True),
+            (student1, subject2, True),
+            (student1, subject3, False),
+            (student2, subject1, False),
+            (student2, subject2, True),
+            (student3, subject1, False),
+        ]:
+            SubjectRegistrationModel(
+                student=student.id, subject=subject.id, attend_zoom=attend_zoom
+            ).save()
+        SubjectEvaluationModel(
+            quality={
+                "focused_right_topic": "Trung lập",
+                "practical_content": "Đồng ý",
+                "benefit_in_life": "Hoàn toàn đồng ý",
+                "duration": "Hoàn toàn đồng ý",
+                "method": "Hoàn toàn đồng ý",
+            },
+            most_resonated="Bài giảng",
+            invited="Sống",
+            feedback_lecturer="Cảm ơn",
+            satisfied=8,
+            subject=subject1,
+            student=student1,
+            numerical_order=1,
+        ).save()
+        AbsentModel(
+            subject=subject1,
+            student=student2,
+            reason="Xin phép nghỉ",
+            status=True,
+            type=AbsentType.NO_ATTEND,
+            created_by="HV",
+        ).save()
+        AbsentModel(
+            subject=subject2,
+            student=student2,
+            reason="Xin phép không lượng giá",
+            status=True,
+            type=AbsentType.NO_EVALUATION,
+            created_by="HV",
+        ).save()
+        AbsentModel(
+            subject=subject1,
+            student=student3,
+            reason="Chưa duyệt",
+            status=False,
+            created_by="HV",
+        ).save()
+        RollCallRepository().refresh_summaries(season=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    @pytest.mark.order(1)
+    def test_get_roll_call_results(self):
+        subject1, subject2, _ = self.subjects
+        student1, student2, student3 = self.students
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            r = self.client.get(
+                "/api/v1/roll-call/results",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert [doc["id"] for doc in resp["data"]] == [
+                str(student1.id),
+                str(student2.id),
+                str(student3.id),
+            ]
+            assert resp["data"][0]["subjects"] == {
+                str(subject1.id): {
+                    "attend_zoom": True,
+                    "evaluation": True,
+                    "absent_type": None,
+                    "result": "completed",
+                },
+                str(subject2.id): {
+                    "attend_zoom": True,
+                    "evaluation": False,
+                    "absent_type": None,
+                    "result": "no_complete",
+                },
+            }
+            assert resp["data"][0]["subject_completed"] == 1
+            assert resp["data"][0]["subject_not_completed"] == 1
+            assert resp["data"][0]["subject_registered"] == 2
+
+            assert resp["data"][1]["subjects"][str(subject1.id)]["result"] == "absent"
+            assert resp["data"][1]["subjects"][str(subject2.id)]["result"] == "completed"
+            assert resp["data"][1]["subject_completed"] == 1
+            assert resp["data"][1]["subject_not_completed"] == 0
+
+            assert resp["data"][2]["subjects"] == {
+                str(subject1.id): {
+                    "attend_zoom": False,
+                    "evaluation": False,
+                    "absent_type": None,
+                    "result": "no_complete",
+                },
+            }
+            assert resp["summary"] == {
+                str(subject1.id): {"absent": 1, "completed": 1, "no_complete": 1},
+                str(subject2.id): {"absent": 0, "completed": 1, "no_complete": 1},
+            }
+
+    @pytest.mark.order(2)
+    def test_get_roll_call_results_summary_over_season(self):
+        subject1, subject2, _ = self.subjects
+        # not materialized yet (e.g. before the first rebuild)
+        RollCallSummaryModel.objects(season=3).delete()
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            r = self.client.get(
+                "/api/v1/roll-call/results?page_size=1&page_index=2",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert len(resp["data"]) == 1
+            assert resp["data"][0]["id"] == str(self.students[1].id)
+            assert resp["summary"] == {
+                str(subject1.id): {"absent": 1, "completed": 1, "no_complete": 1},
+                str(subject2.id): {"absent": 0, "completed": 1, "no_complete": 1},
+            }
+        assert RollCallSummaryModel.objects(season=3).count() == 3
+
+    @pytest.mark.order(3)
+    def test_roll_call_by_sheet(self):
+        subject1, _, _ = self.subjects
+        student1, student2, student3 = self.students
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch(
+            "app.infra.services.google_sheet_api.GoogleSheetAPIService.get_data_from_spreadsheet"
+        ) as mock_get_data_spreadsheet, patch(
+            "app.infra.services.google_drive_api.GoogleDriveAPIService._get_oauth_token"
+        ) as mock_get_oauth_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            mock_get_oauth_token.return_value = Credentials(
+                token="<access_token>",
+                refresh_token="<refresh_token>",
+                client_id="<client_id>",
+                client_secret="<client_secret>",
+                token_uri="<token_uri>",
+                scopes=["https://www.googleapis.com/auth/drive"],
+            )
+            mock_get_data_spreadsheet.return_value = [["MSHV"], ["1"], ["3"], [], ["9"]]
+            r = self.client.post(
+                "/api/v1/roll-call/by-sheet",
+                json={"url": "string", "subject_id": str(subject1.id)},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert r.json() == {"matched": 2, "updated": 1, "unknown_numerical_orders": [9]}
+
+            attend_zoom = {
+                doc.student.id: doc.attend_zoom
+                for doc in SubjectRegistrationModel.objects(subject=subject1.id)
+            }
+            assert attend_zoom == {student1.id: True, student2.id: False, student3.id: True}
+
+            summary = RollCallSummaryModel.objects(student=student3.id, season=3).get()
+            assert summary.subject_completed == 0
+            assert summary.subject_not_completed == 1
+            assert summary.subjects[0].attend_zoom is True
+
+            r = self.client.get(
+                "/api/v1/roll-call/results",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert resp["data"][2]["subjects"][str(subject1.id)]["attend_zoom"] is True
+            assert resp["summary"][str(subject1.id)] == {
+                "absent": 1,
+                "completed": 1,
+                "no_complete": 1,
+            }
+
+    @pytest.mark.order(4)
+    def test_rebuild_roll_call_summary(self):
+        RollCallSummaryModel.objects(student=self.students[0].id).delete()
+        RollCallSummaryModel(student=self.students[0].id, season=2).save()
+
+        summaries = RollCallRepository().refresh_summaries(season=3)
+        assert set(summaries) == {student.id for student in self.students}
+        assert RollCallSummaryModel.objects(season=3).count() == 3
+        summary = RollCallSummaryModel.objects(student=self.students[0].id, season=3).get()
+        assert summary.subject_registered == 2
+        assert summary.subject_completed == 1
+
+    @pytest.mark.order(5)
+    def test_roll_call_by_sheet_refreshes_cached_subjects(self):
+        _, _, subject3 = self.subjects
+        SubjectModel.objects(id=subject3.id).update_one(status="close_evaluation")
+        with (
+            patch("app.infra.security.security_service.verify_token") as mock_token,
+            patch(
+                "app.infra.services.google_sheet_api.GoogleSheetAPIService.get_data_from_spreadsheet"
+            ) as mock_get_data_spreadsheet,
+            patch.object(settings, "RESPONSE_CACHE_TTL", 60 * 60),
+            patch(
+                "app.infra.response_cache.get_redis_client",
+                return_value=fakeredis.FakeStrictRedis(),
+            ),
+        ):
+            mock_token.return_value = TokenData(email=self.admin.email)
+
+            def get_status() -> str:
+                r = self.client.get(
+                    "/api/v1/subjects",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                return next(doc["status"] for doc in r.json() if doc["id"] == str(subject3.id))
+
+            # cached with the status before the roll call
+            assert get_status() == "close_evaluation"
+
+            mock_get_data_spreadsheet.return_value = [["MSHV"], ["1"]]
+            r = self.client.post(
+                "/api/v1/roll-call/by-sheet",
+                json={"url": "string", "subject_id": str(subject3.id)},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert get_status() == "completed"
@@ -0,0 +1,202 @@
+import unittest
+from collections import Counter
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import mongomock
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+
+from app.infra.security.security_service import TokenData, get_password_hash
+from app.main import app
+from app.models.admin import AdminModel
+from app.models.document import DocumentModel
+from app.models.general_task import GeneralTaskModel
+from app.models.lecturer import LecturerModel
+from app.models.season import SeasonModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.subject import SubjectModel
+from app.models.subject_evaluation import SubjectEvaluationModel
+
+PAGE_SIZE = 4
+
+
+@contextmanager
+def count_reference_queries():
+    """Count the queries by _id (references loaded lazily or by select_related) by collection"""
+    counter = Counter()
+    find = mongomock.collection.Collection.find
+
+    def counting_find(collection, filter=None, *args, **kwargs):
+        if filter and "_id" in filter:
+            counter[collection.name] += 1
+        return find(collection, filter, *args, **kwargs)
+
+    with patch.object(mongomock.collection.Collection, "find", counting_find):
+        yield counter
+
+
+class TestSelectRelatedApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.admins = [
+            AdminModel(
+                status="active",
+                roles=["admin"],
+                holy_name="Martin",
+                phone_number=["0123456789"],
+                latest_season=3,
+                seasons=[3],
+                email=f"admin{i}@example.com",
+                full_name=f"Nguyen Van {i}",
+                password=get_password_hash(password="local@local"),
+            ).save()
+            for i in range(2)
+        ]
+        cls.lecturers = [
+            LecturerModel(title="Cha", holy_name="Phanxico", full_name=f"Giang Vien {i}").save()
+            for i in range(2)
+        ]
+        cls.subjects = [
+            SubjectModel(
+                title=f"Môn học {i}",
+                start_at="2024-03-27",
+                subdivision="string",
+                code=f"KT0{i}",
+                status="init",
+                lecturer=cls.lecturers[i % 2],
+                season=3,
+            ).save()
+            for i in range(PAGE_SIZE)
+        ]
+        cls.students = [
+            StudentModel(
+                seasons_info=[SeasonInfo(numerical_order=i + 1, group=1, season=3)],
+                status="active",
+                holy_name="Maria",
+                phone_number="0123456789",
+                email=f"student{i}@example.com",
+                full_name=f"Tran Thi {i}",
+                password=get_password_hash(password="local@local"),
+            ).save()
+            for i in range(PAGE_SIZE)
+        ]
+        for i, student in enumerate(cls.students):
+            # a page of evaluations of a subject, and a page of evaluations of a student
+            for subject in {cls.subjects[0], cls.subjects[i]}:
+                SubjectEvaluationModel(
+                    quality={
+                        "focused_right_topic": "Trung lập",
+                        "practical_content": "Đồng ý",
+                        "benefit_in_life": "Hoàn toàn đồng ý",
+                        "duration": "Hoàn toàn đồng ý",
+                        "method": "Hoàn toàn đồng ý",
+                    },
+                    most_resonated="Bài giảng",
+                    invited="Sống",
+                    feedback_lecturer="Cảm ơn",
+                    satisfied=8,
+                    subject=subject,
+                    student=student if subject == cls.subjects[0] else cls.students[0],
+                    numerical_order=i + 1,
+                ).save()
+        cls.documents = [
+            DocumentModel(
+                file_id=f"file-{i}",
+                mimeType="image/jpeg",
+                name=f"Tài liệu {i}",
+                role="bhv",
+                type="common",
+                label=["string"],
+                season=3,
+                author=cls.admins[i % 2],
+            ).save()
+            for i in range(PAGE_SIZE)
+        ]
+        for i in range(PAGE_SIZE):
+            GeneralTaskModel(
+                title=f"Cong viec {i}",
+                short_desc="Cong viec",
+                description="Đoạn văn là một đơn vị văn bản nhỏ",
+                start_at="2024-03-22",
+                end_at="2024-03-22",
+                role="bhv",
+                type="common",
+                label=["string"],
+                season=3,
+                author=cls.admins[i % 2],
+                attachments=[cls.documents[i], cls.documents[(i + 1) % PAGE_SIZE]],
+            ).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def get_page(self, url: str, **params) -> dict | list:
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admins[0].email)
+            r = self.client.get(
+                url,
+                params=params,
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+        assert r.status_code == 200
+        return r.json()
+
+    def test_evaluations_of_a_subject(self):
+        with count_reference_queries() as queries:
+            resp = self.get_page("/api/v1/subjects/evaluations", subject_id=self.subjects[0].id)
+        assert len(resp["data"]) == PAGE_SIZE
+        assert {row["student"]["email"] for row in resp["data"]} == {
+            student.email for student in self.students
+        }
+        assert {row["subject"]["lecturer"]["full_name"] for row in resp["data"]} == {"Giang Vien 0"}
+        # one query per referenced collection, whatever the size of the page (and the lookup
+        # of the subject of the filter)
+        assert queries == {"Subjects": 2, "Lecturers": 1, "Students": 1}
+
+    def test_evaluations_of_a_student(self):
+        with count_reference_queries() as queries:
+            resp = self.get_page(f"/api/v1/subjects/evaluations/{self.students[0].id}")
+        assert len(resp) == PAGE_SIZE
+        assert {row["subject"]["lecturer"]["full_name"] for row in resp} == {
+            "Giang Vien 0",
+            "Giang Vien 1",
+        }
+        assert queries["Subjects"] == 1
+        assert queries["Lecturers"] == 1
+
+    def test_documents(self):
+        with count_reference_queries() as queries:
+            resp = self.get_page("/api/v1/documents")
+        assert len(resp["data"]) == PAGE_SIZE
+        assert {row["author"]["full_name"] for row in resp["data"]} == {
+            admin.full_name for admin in self.admins
+        }
+        assert queries == {"Admins": 1}
+
+    def test_general_tasks(self):
+        with count_reference_queries() as queries:
+            resp = self.get_page("/api/v1/general-tasks")
+        assert len(resp["data"]) == PAGE_SIZE
+        assert {row["author"]["full_name"] for row in resp["data"]} == {
+            admin.full_name for admin in self.admins
+        }
+        assert all(len(row["attachments"]) == 2 for row in resp["data"])
+        # the authors of the attachments are the authors of the tasks, loaded once
+        assert queries == {"Admins": 1, "Documents": 1}
@@ -319,6 +319,32 @@ class TestStudentAdminApi(unittest.TestCase):
             resp = r.json()
             assert resp["pagination"]["total"] == 2
 
+    @pytest.mark.order(6)
+    def test_get_all_students_with_fields(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            r = self.client.get(
+                "/api/v1/students",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+                params={"fields": ["id", "full_name", "seasons_info"]},
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert resp["pagination"]["total"] == 5
+            for student in resp["data"]:
+                assert set(student) == {"id", "full_name", "seasons_info"}
+
+            r = self.client.get(
+                "/api/v1/students",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+                params={"fields": ["full_name", "password"]},
+            )
+            assert r.status_code == 400
+
     @pytest.mark.order(7)
     def test_update_student_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
@@ -373,10 +399,10 @@ class TestStudentAdminApi(unittest.TestCase):
         ) as mock_get_data_spreadsheet, patch(
             "app.infra.services.google_drive_api.GoogleDriveAPIService._get_oauth_token"
         ) as mock_get_oauth_token, patch(
-            "app.infra.tasks.email.send_email_welcome_task.delay"
-        ), patch(
-            "app.infra.tasks.email.send_email_welcome_with_exist_account_task.delay"
-        ):
+            "app.infra.tasks.email.send_email_welcome_batch_task.delay"
+        ) as mock_send_email_welcome, patch(
+            "app.infra.tasks.email.send_email_welcome_with_exist_account_batch_task.delay"
+        ) as mock_send_email_welcome_with_exist_account:
             mock_token.return_value = TokenData(email=self.admin.email)
             mock_get_oauth_token.return_value = Credentials(
                 token="<access_token>",
@@ -493,6 +519,29 @@ class TestStudentAdminApi(unittest.TestCase):
 
             mock_get_data_spreadsheet.assert_called_once()
 
+            # Welcome emails are sent by batch
+            mock_send_email_welcome.assert_called_once()
+            assert [
+                recipient["email"]
+                for recipient in mock_send_email_welcome.call_args.kwargs["recipients"]
+            ] == resp["inserteds"]
+            mock_send_email_welcome_with_exist_account.assert_called_once()
+            assert mock_send_email_welcome_with_exist_account.call_args.kwargs["recipients"] == [
+                dict(email=self.student_old_season_2.email, season=3, full_name="Lê Thắm Tiên")
+            ]
+
+            student = StudentModel.objects(email=self.student_old_season_2.email).get()
+            assert [info.season for info in student.seasons_info] == [2, 3]
+            assert student.full_name == "Lê Thắm Tiên"
+            assert student.updated_at is not None
+            assert student.updated_at != self.student_old_season_2.updated_at
+
+            # inserted in bulk, stamped as by repository.create
+            for email in resp["inserteds"]:
+                student = StudentModel.objects(email=email).get()
+                assert student.created_at is not None
+                assert student.updated_at is not None
+
             time.sleep(1)
             cursor = AuditLogModel._get_collection().find(
                 {"type": AuditLogType.IMPORT, "endpoint": Endpoint.STUDENT}
@@ -3,11 +3,13 @@ from datetime import date, timedelta
 import time
 import unittest
 from unittest.mock import patch
+import fakeredis
 import pytest
 
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 
+from app.config import settings
 from app.main import app
 import mongomock
 
@@ -28,6 +30,8 @@ from app.domain.document.enum import DocumentType
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
 from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.subject.subject_repository import SubjectRepository
+from app.shared.utils.general import get_roll_call_season_token
 
 
 today = date.today()
@@ -336,6 +340,63 @@ class TestSubjectApi(unittest.TestCase):
             """  # noqa: E501
             assert len(resp) == 3
 
+    def test_get_all_subjects_cached(self):
+        with (
+            patch("app.infra.security.security_service.verify_token") as mock_token,
+            patch.object(settings, "RESPONSE_CACHE_TTL", 60 * 60),
+            patch(
+                "app.infra.response_cache.get_redis_client",
+                return_value=fakeredis.FakeStrictRedis(),
+            ),
+        ):
+            mock_token.return_value = TokenData(email=self.user.email)
+
+            def get_status() -> str:
+                r = self.client.get(
+                    "/api/v1/subjects",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                return next(doc["status"] for doc in r.json() if doc["id"] == str(self.subject.id))
+
+            status = get_status()
+            # as close_form_evaluation_task does
+            assert SubjectRepository().bulk_update(
+                data={"status": StatusSubjectEnum.CLOSE_EVALUATION}, entities=[self.subject]
+            )
+            assert get_status() == StatusSubjectEnum.CLOSE_EVALUATION
+        SubjectModel.objects(id=self.subject.id).update_one(status=status)
+
+    def test_subject_writes_clear_roll_call_cache(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        with patch("app.shared.utils.general.get_redis_client", return_value=redis_client):
+            subject = SubjectModel(
+                title="Môn học tạm",
+                start_at=date.today(),
+                subdivision="string",
+                code="TMP",
+                lecturer=self.lecturer,
+                status="init",
+                season=3,
+            ).save()
+            tokens = {season: get_roll_call_season_token(season, redis_client) for season in (2, 3)}
+
+            # the cached results hold the titles and codes of the subjects of the season
+            for write in (
+                lambda: SubjectRepository().update(id=subject.id, data={"code": "TMP2"}),
+                lambda: SubjectRepository().bulk_update(
+                    data={"status": StatusSubjectEnum.COMPLETED}, entities=[subject]
+                ),
+                lambda: SubjectRepository().delete(id=subject.id),
+            ):
+                assert write()
+                # a new generation of the season of the subject only
+                assert get_roll_call_season_token(3, redis_client) != tokens[3]
+                assert get_roll_call_season_token(2, redis_client) == tokens[2]
+                tokens[3] = get_roll_call_season_token(3, redis_client)
+
     def test_get_all_subjects_short(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
             mock_token.return_value = TokenData(email=self.user.email)
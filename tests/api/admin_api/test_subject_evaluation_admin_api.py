@@ -164,3 +164,23 @@ class TestSubjectEvaluationAdminApi(unittest.TestCase):
             assert resp["pagination"]["total"] == 1
             assert "data" in resp
             assert len(resp["data"])
+
+    def test_get_list_subject_evaluation_with_fields(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            r = self.client.get(
+                "/api/v1/subjects/evaluations",
+                params={
+                    "subject_id": str(self.subject.id),
+                    "fields": ["id", "feedback_lecturer", "student"],
+                },
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            resp = r.json()
+            assert r.status_code == 200
+            assert resp["pagination"]["total"] == 1
+            assert set(resp["data"][0]) == {"id", "feedback_lecturer", "student"}
+            assert resp["data"][0]["feedback_lecturer"] == self.subject_evaluation.feedback_lecturer
+            assert resp["data"][0]["student"]["id"] == str(self.student.id)
@@ -1,5 +1,8 @@
 import unittest
+from datetime import timedelta
 from unittest.mock import patch
+from fastapi import BackgroundTasks
+import fakeredis
 import responses
 from fastapi.testclient import TestClient
 import mongomock
@@ -8,6 +11,15 @@ from app.domain.auth.entity import TokenData
 from app.infra.security.security_service import get_password_hash
 from app.main import app
 from app.models.student import SeasonInfo, StudentModel
+from app.config.redis import get_redis_client
+from app.domain.daily_bible.entity import DailyBibleResponse
+from app.infra.services.daily_bible_api import MAX_FETCH_SECONDS, DailyBibleAPIService
+from app.use_cases.daily_bible.get_quotes_bible import REFRESH_LOCK_TTL, GetQuotesBibleUseCase
+from app.shared.utils.general import (
+    get_daily_bible_lock_redis_key,
+    get_daily_bible_redis_key,
+    get_today,
+)
 
 mock_response_value_bible = {
     "data": {
@@ -134,6 +146,87 @@ class TestDailyBibleApi(unittest.TestCase):
             assert resp["epitomize_text"] == "Lc 22,14 – 23,56"
             assert resp["season"] == "Mùa Chay"
 
+    @responses.activate
+    def test_get_daily_quotes_stale_while_refreshing(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        today = get_today()
+        redis_client.set(
+            get_daily_bible_redis_key(today - timedelta(days=1)),
+            DailyBibleResponse(
+                gospel_ref="Hôm qua", epitomize_text="Ga 1,1", season="Mùa Chay"
+            ).model_dump_json(),
+        )
+        # another request is fetching today's reading
+        redis_client.set(get_daily_bible_lock_redis_key(today), 1)
+        app.dependency_overrides[get_redis_client] = lambda: redis_client
+        try:
+            with patch("app.infra.security.security_service.verify_token") as mock_token:
+                mock_token.return_value = TokenData(email=self.student.email)
+                r = self.client.get(
+                    "/api/v1/student/daily-bible/daily-quotes",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert r.json()["gospel_ref"] == "Hôm qua"
+                assert len(responses.calls) == 0
+
+                # the lock is released, the request refreshes today's reading
+                redis_client.delete(get_daily_bible_lock_redis_key(today))
+                responses.add(
+                    responses.POST,
+                    "https://ktcgkpv.org/readings/mass-reading",
+                    json=mock_response_value_bible,
+                    status=200,
+                )
+                r = self.client.get(
+                    "/api/v1/student/daily-bible/daily-quotes",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert len(responses.calls) == 1
+                assert redis_client.exists(get_daily_bible_redis_key(today))
+                assert not redis_client.exists(get_daily_bible_lock_redis_key(today))
+        finally:
+            app.dependency_overrides.pop(get_redis_client, None)
+
+    @responses.activate
+    def test_refresh_writes_before_releasing_its_own_lock(self):
+        assert REFRESH_LOCK_TTL > MAX_FETCH_SECONDS
+        responses.add(
+            responses.POST,
+            "https://ktcgkpv.org/readings/mass-reading",
+            json=mock_response_value_bible,
+            status=200,
+        )
+        redis_client = fakeredis.FakeStrictRedis()
+        today = get_today()
+        lock_key = get_daily_bible_lock_redis_key(today)
+        use_case = GetQuotesBibleUseCase(redis_client, BackgroundTasks(), DailyBibleAPIService())
+
+        # the value is written while the lock is still held
+        setex = redis_client.setex
+
+        def setex_under_lock(*args, **kwargs):
+            assert redis_client.get(lock_key) == b"mine"
+            return setex(*args, **kwargs)
+
+        redis_client.set(lock_key, "mine")
+        with patch.object(redis_client, "setex", side_effect=setex_under_lock):
+            use_case._refresh(today, "mine")
+        # the reading of the day of the key, not the one of the upstream's today
+        assert responses.calls[0].request.body == f"seldate={today.isoformat()}"
+        assert redis_client.exists(get_daily_bible_redis_key(today))
+        assert not redis_client.exists(lock_key)
+
+        # the lock expired during the fetch and another worker took it: left to that worker
+        redis_client.set(lock_key, "other")
+        use_case._refresh(today, "mine")
+        assert redis_client.get(lock_key) == b"other"
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+import unittest
+import pytest
+from unittest.mock import patch
+
+import fakeredis
+from mongoengine import connect, disconnect
+from fastapi.testclient import TestClient
+
+from app.main import app
+import mongomock
+
+from app.config.redis import get_redis_client
+from app.infra.security.security_service import TokenData
+from app.models.lecturer import LecturerModel
+from app.models.subject import SubjectModel
+from app.models.season import SeasonModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.absent import AbsentModel
+from app.models.subject_registration import SubjectRegistrationModel
+from app.domain.absent.enum import AbsentType
+from app.infra.roll_call.roll_call_repository import RollCallRepository
+from app.shared.utils.general import (
+    clear_student_roll_call_cache,
+    get_roll_call_season_token,
+    get_student_roll_call_redis_key,
+)
+
+
+class TestRollCallStudentApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        cls.season: SeasonModel = SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.lecturer: LecturerModel = LecturerModel(
+            title="Cha",
+            holy_name="Phanxico",
+            full_name="Nguyen Van A",
+            information="Thạc sĩ thần học",
+            contact="Phone: 012345657",
+        ).save()
+        cls.subjects: list[SubjectModel] = [
+            SubjectModel(
+                title=f"Môn học {idx}",
+                start_at=f"2024-03-2{idx}",
+                subdivision="string",
+                code=f"code{idx}",
+                question_url="string",
+                zoom={"meeting_id": 0, "pass_code": "string", "link": "string"},
+                documents_url=["string"],
+                status=status,
+                lecturer=cls.lecturer,
+                season=3,
+            ).save()
+            for idx, status in enumerate(["completed", "completed", "init"], start=1)
+        ]
+        cls.student: StudentModel = StudentModel(
+            seasons_info=[
+                SeasonInfo(
+                    numerical_order=1,
+                    group=1,
+                    season=3,
+                )
+            ],
+            status="active",
+            holy_name="Martin",
+            phone_number="0123456789",
+            email="student@example.com",
+            full_name="Nguyen Thanh Tam",
+            password="local@local",
+        ).save()
+        for subject in cls.subjects:
+            SubjectRegistrationModel(
+                student=cls.student.id, subject=subject.id, attend_zoom=True
+            ).save()
+        AbsentModel(
+            subject=cls.subjects[1],
+            student=cls.student,
+            reason="Xin phép không lượng giá",
+            status=True,
+            type=AbsentType.NO_EVALUATION,
+            created_by="HV",
+        ).save()
+        cls.redis_client = fakeredis.FakeStrictRedis()
+        app.dependency_overrides[get_redis_client] = lambda: cls.redis_client
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_redis_client, None)
+        disconnect()
+
+    @pytest.mark.order(1)
+    def test_get_my_roll_call_results(self):
+        subject1, subject2, _ = self.subjects
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.student.email)
+            r = self.client.get(
+                "/api/v1/student/roll-call/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            # ordered by start_at descending
+            assert resp["subjects"] == [
+                {
+                    "subject": {"id": str(subject2.id), "title": "Môn học 2", "code": "code2"},
+                    "attend_zoom": True,
+                    "evaluation": False,
+                    "absent_type": AbsentType.NO_EVALUATION,
+                    "result": "completed",
+                },
+                {
+                    "subject": {"id": str(subject1.id), "title": "Môn học 1", "code": "code1"},
+                    "attend_zoom": True,
+                    "evaluation": False,
+                    "absent_type": None,
+                    "result": "no_complete",
+                },
+            ]
+            assert resp["subject_completed"] == 1
+            assert resp["subject_not_completed"] == 1
+            assert resp["subject_registered"] == 2
+
+    @pytest.mark.order(2)
+    def test_get_my_roll_call_results_cached(self):
+        token = get_roll_call_season_token(3, self.redis_client)
+        redis_key = get_student_roll_call_redis_key(str(self.student.id), 3, token)
+        assert self.redis_client.exists(redis_key)
+
+        SubjectRegistrationModel.objects(student=self.student.id).update(attend_zoom=False)
+        RollCallRepository().refresh_summaries(season=3, student_ids=[self.student.id])
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.student.email)
+            r = self.client.get(
+                "/api/v1/student/roll-call/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert r.json()["subject_completed"] == 1
+
+            with patch("app.shared.utils.general.get_redis_client", return_value=self.redis_client):
+                clear_student_roll_call_cache(season=3)
+            # a new generation of the season, without scanning its keys
+            assert get_roll_call_season_token(3, self.redis_client) != token
+
+            r = self.client.get(
+                "/api/v1/student/roll-call/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert r.json()["subject_completed"] == 0
+            assert r.json()["subject_not_completed"] == 2
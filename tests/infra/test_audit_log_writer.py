@@ -0,0 +1,199 @@
+import os
+import queue
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from bson import ObjectId
+from mongoengine import ValidationError, connect, disconnect
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from app.config import settings
+from app.domain.audit_log.entity import AuditLogInDB
+from app.domain.audit_log.enum import AuditLogType, Endpoint
+from app.infra.audit_log.audit_log_writer import (
+    AuditLogWriter,
+    insert_audit_logs,
+    to_document,
+)
+from app.models.audit_log import AuditLogModel
+
+
+def make_audit_log(description: str = "Tạo môn học") -> AuditLogInDB:
+    return AuditLogInDB(
+        type=AuditLogType.CREATE,
+        endpoint=Endpoint.SUBJECT,
+        author_name="Admin",
+        author_email="admin@example.com",
+        author_roles=["admin"],
+        description=description,
+        season=3,
+    )
+
+
+class TestAuditLogWriter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        AuditLogModel.objects.delete()
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.journal_dir.name, "audit-log-journal.jsonl")
+        self.settings_patch = patch.multiple(
+            settings,
+            AUDIT_LOG_JOURNAL_PATH=self.journal_path,
+            AUDIT_LOG_BATCH_SIZE=3,
+            AUDIT_LOG_FLUSH_SECONDS=0.2,
+            AUDIT_LOG_BUFFER_SIZE=10,
+        )
+        self.settings_patch.start()
+        self.writer = AuditLogWriter()
+
+    def tearDown(self):
+        self.writer.close()
+        self.settings_patch.stop()
+        self.journal_dir.cleanup()
+
+    def read_journal(self) -> list[str]:
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, encoding="utf-8") as f:
+            return [line for line in f if line.strip()]
+
+    def test_to_document_validates(self):
+        document = to_document(
+            make_audit_log("x" * (settings.AUDIT_LOG_DESCRIPTION_MAX_LENGTH + 5))
+        )
+        assert isinstance(document["_id"], ObjectId)
+        assert document["created_at"] is not None
+        assert document["description"].endswith("(5 characters truncated)")
+
+        with self.assertRaises(ValidationError):
+            to_document(make_audit_log().model_copy(update={"author_roles": None}))
+
+    def test_flush_by_size(self):
+        with patch.object(settings, "AUDIT_LOG_FLUSH_SECONDS", 30):
+            for i in range(5):
+                self.writer._queue.put_nowait(to_document(make_audit_log(str(i))))
+            start = time.monotonic()
+            batch = self.writer._next_batch()
+            # a full batch does not wait for AUDIT_LOG_FLUSH_SECONDS
+            assert time.monotonic() - start < 1
+            assert [document["description"] for document in batch] == ["0", "1", "2"]
+
+    def test_flush_by_time(self):
+        self.writer._queue.put_nowait(to_document(make_audit_log()))
+        start = time.monotonic()
+        batch = self.writer._next_batch()
+        assert time.monotonic() - start >= settings.AUDIT_LOG_FLUSH_SECONDS
+        assert len(batch) == 1
+
+    def test_put_writes_in_background(self):
+        self.writer.put(make_audit_log())
+        deadline = time.monotonic() + 5
+        while AuditLogModel.objects.count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert AuditLogModel.objects.count() == 1
+
+        # the entries still buffered at shutdown are written by close
+        self.writer._stopped.set()
+        self.writer._thread.join()
+        for i in range(2):
+            self.writer._queue.put_nowait(to_document(make_audit_log(str(i))))
+        self.writer.close()
+        assert AuditLogModel.objects.count() == 3
+
+    def test_put_writes_in_the_request_without_buffer(self):
+        with patch.object(settings, "AUDIT_LOG_BUFFER_SIZE", 0):
+            self.writer.put(make_audit_log())
+        assert AuditLogModel.objects.count() == 1
+        assert self.writer._thread is None
+
+    def test_failed_insert_is_handed_to_celery(self):
+        batch = [to_document(make_audit_log())]
+        with (
+            patch.object(
+                mongomock.collection.Collection, "insert_many", side_effect=AutoReconnect()
+            ),
+            patch("app.infra.tasks.audit_log.write_audit_logs_task.delay") as mock_delay,
+        ):
+            self.writer._flush(batch)
+            mock_delay.assert_called_once_with(documents=batch)
+        assert self.read_journal() == []
+
+    def test_failed_spill_is_journaled(self):
+        batch = [to_document(make_audit_log(str(i))) for i in range(2)]
+        with (
+            patch.object(
+                mongomock.collection.Collection, "insert_many", side_effect=AutoReconnect()
+            ),
+            patch(
+                "app.infra.tasks.audit_log.write_audit_logs_task.delay",
+                side_effect=ConnectionError("broker down"),
+            ),
+        ):
+            self.writer._flush(batch)
+        assert len(self.read_journal()) == 2
+        assert AuditLogModel.objects.count() == 0
+
+    def test_full_buffer_is_journaled(self):
+        self.writer._queue = queue.Queue(maxsize=1)
+        with patch.object(AuditLogWriter, "_ensure_started"):
+            self.writer.put(make_audit_log("buffered"))
+            self.writer.put(make_audit_log("journaled"))
+        assert self.writer._queue.qsize() == 1
+        journal = self.read_journal()
+        assert len(journal) == 1
+        assert "journaled" in journal[0]
+
+    def test_replay_journal(self):
+        batch = [to_document(make_audit_log(str(i))) for i in range(5)]
+        # one of them was written before the crash
+        insert_audit_logs(batch[:1])
+        self.writer._write_journal(batch)
+
+        self.writer.replay_journal()
+        assert AuditLogModel.objects.count() == 5
+        assert not os.path.exists(self.journal_path)
+        assert os.listdir(self.journal_dir.name) == []
+
+        # nothing journaled
+        self.writer.replay_journal()
+        assert AuditLogModel.objects.count() == 5
+
+    def test_replay_journal_failure_keeps_the_entries(self):
+        batch = [to_document(make_audit_log(str(i))) for i in range(5)]
+        self.writer._write_journal(batch)
+        with patch.object(
+            mongomock.collection.Collection, "insert_many", side_effect=AutoReconnect()
+        ):
+            self.writer.replay_journal()
+        assert len(self.read_journal()) == 5
+        assert os.listdir(self.journal_dir.name) == ["audit-log-journal.jsonl"]
+
+        self.writer.replay_journal()
+        assert AuditLogModel.objects.count() == 5
+
+    def test_insert_audit_logs_skips_duplicates(self):
+        batch = [to_document(make_audit_log(str(i))) for i in range(3)]
+        insert_audit_logs(batch[:2])
+        insert_audit_logs(batch)
+        assert AuditLogModel.objects.count() == 3
+
+        # the other write errors are raised
+        error = BulkWriteError({"writeErrors": [{"index": 0, "code": 121}], "nInserted": 0})
+        with patch.object(mongomock.collection.Collection, "insert_many", side_effect=error):
+            with self.assertRaises(BulkWriteError):
+                insert_audit_logs(batch)
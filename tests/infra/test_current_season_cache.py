@@ -0,0 +1,75 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+from cachetools import TTLCache
+
+from app.config import settings
+from app.shared.utils import general
+from app.shared.utils.general import (
+    CURRENT_SEASON_CHANNEL,
+    CURRENT_SEASON_REDIS_KEY,
+    get_current_season_value,
+    invalidate_current_season_cache,
+)
+
+
+def wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class TestCurrentSeasonCache(unittest.TestCase):
+    def setUp(self):
+        # one Redis server, a client per call as with a connection pool
+        self.server = fakeredis.FakeServer()
+        self.redis_client = fakeredis.FakeStrictRedis(server=self.server)
+        self.redis_client.set(CURRENT_SEASON_REDIS_KEY, 3)
+        for p in (
+            *(
+                patch(
+                    f"{module}.get_redis_client",
+                    side_effect=lambda: fakeredis.FakeStrictRedis(server=self.server),
+                )
+                for module in ("app.shared.utils.general", "app.infra.invalidation_listener")
+            ),
+            patch.object(settings, "CURRENT_SEASON_CACHE_TTL", 60),
+            patch.object(general, "_current_season_cache", TTLCache(maxsize=1, ttl=60)),
+            # a listener of this Redis server
+            patch.object(general._current_season_listener, "_pid", None),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def wait_for_listener(self):
+        assert wait_until(
+            lambda: dict(self.redis_client.pubsub_numsub(CURRENT_SEASON_CHANNEL)).get(
+                CURRENT_SEASON_CHANNEL.encode()
+            )
+            == 1
+        )
+
+    def test_kept_in_memory(self):
+        assert get_current_season_value() == 3
+        self.redis_client.set(CURRENT_SEASON_REDIS_KEY, 4)
+        assert get_current_season_value() == 3
+
+        with patch.object(general, "SeasonRepository") as mock_season_repository:
+            mock_season_repository.return_value.get_current_season.return_value.season = 4
+            invalidate_current_season_cache()
+            assert self.redis_client.get(CURRENT_SEASON_REDIS_KEY) is None
+            assert get_current_season_value() == 4
+
+    def test_invalidated_by_another_process(self):
+        assert get_current_season_value() == 3
+        self.wait_for_listener()
+
+        # the season is changed in another process
+        self.redis_client.set(CURRENT_SEASON_REDIS_KEY, 4)
+        self.redis_client.publish(CURRENT_SEASON_CHANNEL, "invalidate")
+        assert wait_until(lambda: get_current_season_value() == 4)
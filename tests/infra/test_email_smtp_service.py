@@ -0,0 +1,153 @@
+import smtplib
+import unittest
+from email.mime.multipart import MIMEMultipart
+from unittest.mock import MagicMock, patch
+
+from app.config import settings
+from app.infra.email.email_smtp_service import SMTPConnectionPool
+
+
+def make_message(idx: int) -> MIMEMultipart:
+    msg = MIMEMultipart("alternative")
+    msg["To"] = f"student{idx}@example.com"
+    msg["Subject"] = f"Email {idx}"
+    return msg
+
+
+class TestSMTPConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.sessions: list[MagicMock] = []
+        # side effect of send_message, by session index
+        self.send_message_effects: dict = {}
+
+        def new_session(**kwargs):
+            session = MagicMock(name=f"session{len(self.sessions)}")
+            session.noop.return_value = (250, b"OK")
+            session.send_message.side_effect = self.send_message_effects.get(len(self.sessions))
+            self.sessions.append(session)
+            return session
+
+        for p in (
+            patch("app.infra.email.email_smtp_service.smtplib.SMTP", side_effect=new_session),
+            patch.multiple(
+                settings,
+                SMTP_POOL_SIZE=2,
+                SMTP_MAX_MESSAGES_PER_CONNECTION=100,
+                SMTP_KEEPALIVE_SECONDS=30,
+                SMTP_RATE_LIMIT_PER_MINUTE=0,
+            ),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        self.pool = SMTPConnectionPool()
+
+    def sent_by(self, session: MagicMock) -> list[str]:
+        return [c.args[0]["To"] for c in session.send_message.call_args_list]
+
+    def test_session_is_reused(self):
+        assert self.pool.send_many([make_message(0), make_message(1)]) == {}
+        assert self.pool.send_many([make_message(2)]) == {}
+
+        # one login for the three messages, the session is kept open
+        assert len(self.sessions) == 1
+        self.sessions[0].login.assert_called_once()
+        assert len(self.sent_by(self.sessions[0])) == 3
+        self.sessions[0].quit.assert_not_called()
+        # used within SMTP_KEEPALIVE_SECONDS: no NOOP
+        self.sessions[0].noop.assert_not_called()
+
+    def test_sessions_rotate_after_max_messages(self):
+        with patch.object(settings, "SMTP_MAX_MESSAGES_PER_CONNECTION", 2):
+            assert self.pool.send_many([make_message(i) for i in range(5)]) == {}
+
+        assert [len(self.sent_by(session)) for session in self.sessions] == [2, 2, 1]
+        self.sessions[0].quit.assert_called_once()
+        self.sessions[1].quit.assert_called_once()
+        # the last one has room left and goes back to the pool
+        self.sessions[2].quit.assert_not_called()
+        assert self.pool._idle[0].smtp is self.sessions[2]
+
+    def test_dead_idle_session_is_replaced_once(self):
+        self.pool.send_many([make_message(0)])
+        # idle for longer than SMTP_KEEPALIVE_SECONDS, and closed by the server
+        self.sessions[0].noop.side_effect = smtplib.SMTPServerDisconnected()
+        with patch.object(settings, "SMTP_KEEPALIVE_SECONDS", 0):
+            assert self.pool.send_many([make_message(1), make_message(2)]) == {}
+
+        self.sessions[0].noop.assert_called_once()
+        self.sessions[0].quit.assert_called_once()
+        assert len(self.sessions) == 2
+        assert self.sent_by(self.sessions[1]) == [
+            "student1@example.com",
+            "student2@example.com",
+        ]
+
+    def test_idle_session_alive_after_noop(self):
+        self.pool.send_many([make_message(0)])
+        with patch.object(settings, "SMTP_KEEPALIVE_SECONDS", 0):
+            assert self.pool.send_many([make_message(1)]) == {}
+
+        self.sessions[0].noop.assert_called_once()
+        assert len(self.sessions) == 1
+        assert len(self.sent_by(self.sessions[0])) == 2
+
+    def test_lost_session_is_reconnected_once(self):
+        def send_message(msg):
+            if msg["To"] == "student1@example.com":
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            return {}
+
+        self.send_message_effects = {
+            0: send_message,
+            1: smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+        }
+        failures = self.pool.send_many([make_message(i) for i in range(3)])
+
+        # message 1: lost twice (first session, then the new one), reported and not retried
+        # again; message 2 goes through a third session
+        assert list(failures) == [1]
+        assert isinstance(failures[1], smtplib.SMTPServerDisconnected)
+        assert len(self.sessions) == 3
+        assert self.sent_by(self.sessions[0]) == [
+            "student0@example.com",
+            "student1@example.com",
+        ]
+        assert self.sent_by(self.sessions[1]) == ["student1@example.com"]
+        assert self.sent_by(self.sessions[2]) == ["student2@example.com"]
+        self.sessions[0].quit.assert_called_once()
+        self.sessions[1].quit.assert_called_once()
+
+    def test_reconnect_after_lost_session(self):
+        self.pool.send_many([make_message(0)])
+        self.sessions[0].send_message.side_effect = smtplib.SMTPServerDisconnected()
+        assert self.pool.send_many([make_message(1)]) == {}
+
+        assert len(self.sessions) == 2
+        assert self.sent_by(self.sessions[1]) == ["student1@example.com"]
+
+    def test_refused_message_keeps_the_session(self):
+        refused = smtplib.SMTPRecipientsRefused({"student1@example.com": (550, b"No such user")})
+
+        def send_message(msg):
+            if msg["To"] == "student1@example.com":
+                raise refused
+            return {}
+
+        self.send_message_effects = {0: send_message}
+        failures = self.pool.send_many([make_message(i) for i in range(3)])
+
+        assert failures == {1: refused}
+        assert len(self.sessions) == 1
+        assert len(self.sent_by(self.sessions[0])) == 3
+        self.sessions[0].quit.assert_not_called()
+
+    def test_throttle(self):
+        with (
+            patch.object(settings, "SMTP_RATE_LIMIT_PER_MINUTE", 60),
+            patch("app.infra.email.email_smtp_service.time.sleep") as mock_sleep,
+        ):
+            self.pool.send_many([make_message(i) for i in range(3)])
+
+        # the first message goes at once, the next ones a second apart
+        assert len(mock_sleep.call_args_list) == 2
+        assert all(0.9 < c.args[0] <= 2 for c in mock_sleep.call_args_list)
@@ -0,0 +1,202 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+import mongomock
+import sib_api_v3_sdk
+from celery.exceptions import Ignore
+from mongoengine import connect, disconnect
+from sib_api_v3_sdk.rest import ApiException
+
+from app.config import settings
+from app.domain.email_delivery.enum import EmailDeliveryStatus
+from app.infra.tasks import email as email_tasks
+from app.infra.tasks.email import (
+    _send_brevo_by_batch,
+    brevo_service,
+    send_brevo_batch_task,
+    send_email_welcome_batch_task,
+)
+from app.models.email_delivery import EmailDeliveryModel
+
+TEMPLATE_ID = 7
+REF = "subject-1"
+
+
+def brevo_response(send_smtp_email) -> sib_api_v3_sdk.CreateSmtpEmail:
+    return sib_api_v3_sdk.CreateSmtpEmail(
+        message_ids=[
+            f"<{version.to[0].email}@brevo>" for version in send_smtp_email.message_versions
+        ]
+    )
+
+
+class TestBrevoBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        EmailDeliveryModel.objects.delete()
+        self.api_instance = MagicMock()
+        self.api_instance.send_transac_email.side_effect = brevo_response
+        sleep_patch = patch.object(email_tasks.time, "sleep")
+        self.mock_sleep = sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+        for p in (
+            patch.object(brevo_service, "api_instance", self.api_instance),
+            # the failures are stored as the state of the task
+            patch.object(send_brevo_batch_task, "update_state"),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def get_deliveries(self) -> dict[str, EmailDeliveryModel]:
+        return {
+            doc.email: doc for doc in EmailDeliveryModel.objects(ref=REF, template_id=TEMPLATE_ID)
+        }
+
+    def test_send_batch_message_versions(self):
+        message_ids = brevo_service.send_batch(
+            TEMPLATE_ID,
+            [{"email": "a@example.com"}, {"email": "b@example.com", "params": {"name": "B"}}],
+            {"title": "Môn học"},
+        )
+        assert message_ids == ["<a@example.com@brevo>", "<b@example.com@brevo>"]
+
+        self.api_instance.send_transac_email.assert_called_once()
+        send_smtp_email = self.api_instance.send_transac_email.call_args.args[0]
+        assert send_smtp_email.template_id == TEMPLATE_ID
+        assert send_smtp_email.params == {"title": "Môn học"}
+        assert send_smtp_email.to is None
+        versions = send_smtp_email.message_versions
+        assert [version.to[0].email for version in versions] == ["a@example.com", "b@example.com"]
+        assert versions[0].params is None
+        assert versions[1].params == {"title": "Môn học", "name": "B"}
+
+        with self.assertRaises(Exception):
+            brevo_service.send_batch(TEMPLATE_ID, [], {})
+
+    def test_send_by_batch_chunks_recipients(self):
+        emails = ["a@example.com", "b@example.com", "a@example.com", "c@example.com"]
+        with (
+            patch.object(settings, "BREVO_BATCH_SIZE", 2),
+            patch.object(email_tasks, "group") as mock_group,
+        ):
+            _send_brevo_by_batch(TEMPLATE_ID, REF, emails, {"title": "Môn học"})
+        signatures = mock_group.call_args.args[0]
+        assert [signature.args for signature in signatures] == [
+            (
+                TEMPLATE_ID,
+                REF,
+                [{"email": "a@example.com"}, {"email": "b@example.com"}],
+                {"title": "Môn học"},
+            ),
+            (TEMPLATE_ID, REF, [{"email": "c@example.com"}], {"title": "Môn học"}),
+        ]
+        mock_group.return_value.apply_async.assert_called_once()
+
+    def test_send_brevo_batch_task(self):
+        recipients = [{"email": "a@example.com"}, {"email": "b@example.com"}]
+        send_brevo_batch_task(TEMPLATE_ID, REF, recipients, {})
+        # one call for the chunk
+        self.api_instance.send_transac_email.assert_called_once()
+        deliveries = self.get_deliveries()
+        assert deliveries.keys() == {"a@example.com", "b@example.com"}
+        for email, delivery in deliveries.items():
+            assert delivery.status == EmailDeliveryStatus.SENT
+            assert delivery.message_id == f"<{email}@brevo>"
+            assert delivery.attempts == 1
+            assert delivery.created_at is not None
+
+        # sent again (e.g. the task is retried): the deliveries are updated, not duplicated
+        send_brevo_batch_task(TEMPLATE_ID, REF, recipients, {})
+        assert EmailDeliveryModel.objects(ref=REF).count() == 2
+        assert all(delivery.attempts == 2 for delivery in self.get_deliveries().values())
+
+    def test_retry_on_rate_limit(self):
+        responses = iter([ApiException(status=429), ApiException(status=503)])
+
+        def send_transac_email(send_smtp_email):
+            for ex in responses:
+                raise ex
+            return brevo_response(send_smtp_email)
+
+        self.api_instance.send_transac_email.side_effect = send_transac_email
+        send_brevo_batch_task(TEMPLATE_ID, REF, [{"email": "a@example.com"}], {})
+
+        assert self.api_instance.send_transac_email.call_count == 3
+        assert self.mock_sleep.call_args_list == [call(1), call(2)]
+        assert self.get_deliveries()["a@example.com"].status == EmailDeliveryStatus.SENT
+
+    def test_retries_exhausted(self):
+        self.api_instance.send_transac_email.side_effect = ApiException(status=503)
+        with patch.object(settings, "BREVO_BATCH_RETRIES", 2), self.assertRaises(Ignore):
+            send_brevo_batch_task(
+                TEMPLATE_ID, REF, [{"email": "a@example.com"}, {"email": "b@example.com"}], {}
+            )
+        assert self.api_instance.send_transac_email.call_count == 3
+        assert self.mock_sleep.call_args_list == [call(1), call(2)]
+        # a server error is not retried one by one
+        for delivery in self.get_deliveries().values():
+            assert delivery.status == EmailDeliveryStatus.FAILED
+            assert delivery.error.startswith("503")
+
+    def test_rejected_batch_falls_back_to_each_recipient(self):
+        def send_transac_email(send_smtp_email):
+            emails = [version.to[0].email for version in send_smtp_email.message_versions]
+            if len(emails) > 1 or emails == ["invalid@example"]:
+                raise ApiException(status=400, reason="invalid email")
+            return brevo_response(send_smtp_email)
+
+        self.api_instance.send_transac_email.side_effect = send_transac_email
+        recipients = [
+            {"email": "a@example.com"},
+            {"email": "invalid@example"},
+            {"email": "b@example.com"},
+        ]
+        with self.assertRaises(Ignore):
+            send_brevo_batch_task(TEMPLATE_ID, REF, recipients, {})
+
+        # the chunk, then each recipient; a rejection is not retried
+        assert self.api_instance.send_transac_email.call_count == 4
+        self.mock_sleep.assert_not_called()
+        deliveries = self.get_deliveries()
+        assert deliveries["a@example.com"].status == EmailDeliveryStatus.SENT
+        assert deliveries["a@example.com"].message_id == "<a@example.com@brevo>"
+        assert deliveries["b@example.com"].status == EmailDeliveryStatus.SENT
+        assert deliveries["invalid@example"].status == EmailDeliveryStatus.FAILED
+        assert deliveries["invalid@example"].error == "400 invalid email"
+        assert all(delivery.attempts == 1 for delivery in deliveries.values())
+
+    def test_welcome_batch_task(self):
+        recipients = [
+            {"email": "a@example.com", "password": "pw-a", "full_name": "Nguyễn Văn A"},
+            {"email": "b@example.com", "password": "pw-b", "full_name": "Nguyễn Văn B"},
+        ]
+        with (
+            patch.object(
+                email_tasks.email_smtp_service,
+                "send_email_welcome_many",
+                return_value={1: Exception("550 mailbox unavailable")},
+            ) as mock_send_many,
+            patch.object(send_email_welcome_batch_task, "update_state") as mock_update_state,
+            self.assertRaises(Ignore),
+        ):
+            send_email_welcome_batch_task(recipients)
+
+        # one call for the batch, a text per recipient
+        messages = mock_send_many.call_args.args[0]
+        assert [email for email, _ in messages] == ["a@example.com", "b@example.com"]
+        assert "Nguyễn Văn A" in messages[0][1] and "pw-a" in messages[0][1]
+        assert "Nguyễn Văn B" in messages[1][1] and "pw-b" in messages[1][1]
+        description = mock_update_state.call_args.kwargs["meta"]["description"]
+        assert description.startswith("Failed to send 1/2 emails: ['b@example.com']")
@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+import mongomock
+from mongoengine import Document, IntField, StringField, connect, disconnect
+
+from app.config import settings
+from app.infra.list_with_total import TotalMode, aggregate_with_total
+from app.shared.utils.general import get_list_total_redis_key
+
+PAGE_STAGES = [{"$sort": {"_id": 1}}, {"$limit": 2}]
+
+
+class ItemModel(Document):
+    description = StringField()
+    season = IntField()
+
+
+def make_item(description: str, season: int) -> ItemModel:
+    return ItemModel(description=description, season=season).save()
+
+
+class TestListWithTotal(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        ItemModel.objects.delete()
+        self.items = [make_item(str(i), season=3) for i in range(3)] + [
+            make_item(str(i), season=4) for i in range(3, 5)
+        ]
+        self.redis_client = fakeredis.FakeStrictRedis()
+        for p in (
+            patch("app.infra.list_with_total.get_redis_client", return_value=self.redis_client),
+            patch.object(settings, "LIST_TOTAL_CACHE_TTL", 60),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def total_key(self, match_pipeline: dict | None) -> str:
+        return get_list_total_redis_key(ItemModel._get_collection_name(), match_pipeline)
+
+    def test_exact_total_of_the_filter(self):
+        docs, total = aggregate_with_total(ItemModel.objects(), {"season": 3}, PAGE_STAGES)
+        # the total of the filter, not of the page nor of the collection
+        assert [doc["description"] for doc in docs] == ["0", "1"]
+        assert total == 3
+        # counted again on each page
+        make_item("5", season=3)
+        _, total = aggregate_with_total(ItemModel.objects(), {"season": 3}, PAGE_STAGES)
+        assert total == 4
+        assert self.redis_client.keys() == []
+
+        docs, total = aggregate_with_total(ItemModel.objects(), {"season": 9}, PAGE_STAGES)
+        assert docs == []
+        assert total == 0
+
+    def test_cached_total_reused_within_ttl(self):
+        match_pipeline = {"season": 3}
+        docs, total = aggregate_with_total(
+            ItemModel.objects(), match_pipeline, PAGE_STAGES, total_mode=TotalMode.CACHED
+        )
+        assert len(docs) == 2
+        assert total == 3
+        assert 0 < self.redis_client.ttl(self.total_key(match_pipeline)) <= 60
+
+        # within LIST_TOTAL_CACHE_TTL: the page is read again, the total is reused
+        ItemModel.objects(description="0").delete()
+        docs, total = aggregate_with_total(
+            ItemModel.objects(), match_pipeline, PAGE_STAGES, total_mode=TotalMode.CACHED
+        )
+        assert [doc["description"] for doc in docs] == ["1", "2"]
+        assert total == 3
+
+        # expired: counted again
+        self.redis_client.delete(self.total_key(match_pipeline))
+        _, total = aggregate_with_total(
+            ItemModel.objects(), match_pipeline, PAGE_STAGES, total_mode=TotalMode.CACHED
+        )
+        assert total == 2
+
+    def test_estimated_total_of_a_cursor_page(self):
+        page_stages = [{"$match": {"_id": {"$gt": self.items[1].id}}}, *PAGE_STAGES]
+        with patch.object(
+            mongomock.collection.Collection, "estimated_document_count", return_value=5
+        ) as mock_estimated_document_count:
+            docs, total = aggregate_with_total(ItemModel.objects(), None, page_stages, cursor=True)
+        mock_estimated_document_count.assert_called_once()
+        assert [doc["description"] for doc in docs] == ["2", "3"]
+        # the total of the collection, not of the rest of the pages
+        assert total == 5
+        assert self.redis_client.keys() == []
+
+    def test_cursor_page_of_a_filter_caches_its_total(self):
+        match_pipeline = {"season": 3}
+        page_stages = [{"$match": {"_id": {"$gt": self.items[0].id}}}, *PAGE_STAGES]
+        docs, total = aggregate_with_total(
+            ItemModel.objects(), match_pipeline, page_stages, cursor=True
+        )
+        assert [doc["description"] for doc in docs] == ["1", "2"]
+        assert total == 3
+        assert int(self.redis_client.get(self.total_key(match_pipeline))) == 3
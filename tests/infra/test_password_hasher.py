@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from app.config import settings
+from app.infra.security import password_hasher
+
+
+class TestPasswordHasher(unittest.TestCase):
+    def setUp(self):
+        for p in (
+            patch.object(settings, "PASSWORD_HASH_WORKERS", 2),
+            # a pool of this test
+            patch.object(password_hasher, "_executor", None),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.shutdown)
+
+    def shutdown(self):
+        if password_hasher._executor is not None:
+            password_hasher._executor.shutdown()
+
+    def test_hash_on_the_pool(self):
+        hashed = password_hasher.hash_password("local@local")
+        assert password_hasher._executor is not None
+        assert password_hasher.verify_password("local@local", hashed)
+        assert not password_hasher.verify_password("wrong", hashed)
+        assert password_hasher.verify_and_update_password("local@local", hashed) == (True, None)
+
+    def test_hash_passwords_in_order(self):
+        passwords = [f"password-{i}" for i in range(5)]
+        hashes = password_hasher.hash_passwords(passwords)
+        assert password_hasher._executor is not None
+        assert [
+            password_hasher._verify(password, hashed) for password, hashed in zip(passwords, hashes)
+        ] == [True] * 5
+        assert not password_hasher._verify(passwords[0], hashes[1])
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.config import settings
+from app.config.database import PoolStatsListener, disconnect
+
+
+class TestPoolStatsListener(unittest.TestCase):
+    def test_stats_are_logged(self):
+        listener = PoolStatsListener()
+        event = MagicMock(address=("localhost", 27017))
+        with patch.object(settings, "MONGODB_POOL_STATS_LOG_SECONDS", 60):
+            with self.assertNoLogs("app.config.database", level="INFO"):
+                for _ in range(3):
+                    listener.connection_created(event)
+                    listener.connection_checked_out(event)
+                listener.connection_checked_in(event)
+            assert listener.in_use == 2
+
+        # logged on the pool activity, once the interval is elapsed
+        with patch.object(settings, "MONGODB_POOL_STATS_LOG_SECONDS", 0):
+            with self.assertLogs("app.config.database", level="INFO") as logs:
+                listener.connection_checked_out(event)
+        assert logs.output == [
+            "INFO:app.config.database:Mongo pool: 3 connections in use ("
+            "{'created': 3, 'closed': 0, 'checked_out': 4, 'checked_in': 1, "
+            "'check_out_failed': 0, 'pool_cleared': 0})"
+        ]
+
+    def test_stats_are_logged_at_disconnect(self):
+        with (
+            patch.object(settings, "MONGODB_POOL_MONITORING", True),
+            patch("app.config.database.disconnect_all") as mock_disconnect_all,
+            self.assertLogs("app.config.database", level="INFO") as logs,
+        ):
+            disconnect()
+        mock_disconnect_all.assert_called_once()
+        assert "Mongo pool:" in logs.output[0]
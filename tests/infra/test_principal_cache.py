@@ -0,0 +1,90 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+from bson import ObjectId
+
+from app.config import settings
+from app.infra.security.principal_cache import Principal, PrincipalCache
+
+EMAIL = "admin@example.com"
+
+
+def wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class TestPrincipalCache(unittest.TestCase):
+    def setUp(self):
+        # one Redis server, a client per call as with a connection pool
+        self.server = fakeredis.FakeServer()
+        for module in ("app.infra.security.principal_cache", "app.infra.invalidation_listener"):
+            redis_patch = patch(
+                f"{module}.get_redis_client",
+                side_effect=lambda: fakeredis.FakeStrictRedis(server=self.server),
+            )
+            redis_patch.start()
+            self.addCleanup(redis_patch.stop)
+        self.id = ObjectId()
+        self.principal = Principal(document={"_id": self.id, "email": EMAIL}, entity=None)
+
+    def make_cache(self) -> PrincipalCache:
+        """The cache of an API process"""
+        with patch.object(settings, "AUTH_PRINCIPAL_CACHE_TTL", 30):
+            cache = PrincipalCache("admin")
+        cache.set(EMAIL, self.principal, share=False)
+        return cache
+
+    def wait_for_listeners(self, cache: PrincipalCache, count: int):
+        redis_client = fakeredis.FakeStrictRedis(server=self.server)
+        assert wait_until(
+            lambda: dict(redis_client.pubsub_numsub(cache.channel)).get(cache.channel.encode())
+            == count
+        )
+
+    def test_invalidate_every_process(self):
+        writer, other = self.make_cache(), self.make_cache()
+        self.wait_for_listeners(writer, 2)
+        assert other.get(EMAIL) is self.principal
+
+        # the account is written in the process of `writer`, by id
+        writer.invalidate(id=self.id)
+        assert writer.get(EMAIL) is None
+        assert wait_until(lambda: other.get(EMAIL) is None)
+
+        # cached again, then invalidated by email
+        other.set(EMAIL, self.principal, share=False)
+        writer.invalidate(email=EMAIL)
+        assert wait_until(lambda: other.get(EMAIL) is None)
+
+    def test_invalidate_without_redis(self):
+        cache = self.make_cache()
+        with patch(
+            "app.infra.security.principal_cache.get_redis_client",
+            side_effect=ConnectionError("redis down"),
+        ):
+            # the write does not fail, the other processes keep it until the TTL
+            cache.invalidate(id=self.id)
+        assert cache.get(EMAIL) is None
+
+    def test_invalidate_former_email(self):
+        writer, other = self.make_cache(), self.make_cache()
+        self.wait_for_listeners(writer, 2)
+
+        # the email of the account is changed, the cached principal is under the former one
+        writer.invalidate(id=self.id, email="new@example.com")
+        assert writer.get(EMAIL) is None
+        assert wait_until(lambda: other.get(EMAIL) is None)
+
+    def test_invalidate_former_email_shared(self):
+        with patch.object(settings, "AUTH_PRINCIPAL_CACHE_REDIS", True):
+            cache = self.make_cache()
+            cache.set(EMAIL, self.principal)
+            cache.invalidate(id=self.id, email="new@example.com")
+            assert cache.get_document(EMAIL) is None
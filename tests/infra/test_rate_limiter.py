@@ -0,0 +1,165 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from celery.exceptions import Ignore, Retry
+from fastapi import HTTPException
+
+from app.config import settings
+from app.domain.celery_result.enum import CeleryResultTag
+from app.infra.services.google_clients import google_rate_limited
+from app.infra.services.rate_limiter import (
+    RateLimitBucket,
+    RateLimitExceeded,
+    RateLimiter,
+    get_rate_limit_metrics,
+    get_rate_limit_redis_key,
+    rate_limited,
+)
+from celery_config import celery_app_with_error_handler
+
+
+@rate_limited(RateLimitBucket.BREVO, reschedule=True)
+def send_one():
+    return "sent"
+
+
+@rate_limited(RateLimitBucket.BREVO)
+def send_in_loop():
+    return "sent"
+
+
+@google_rate_limited
+def get_file():
+    return "file"
+
+
+@celery_app_with_error_handler(CeleryResultTag.SEND_MAIL)
+def rate_limited_task():
+    return send_one()
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.redis_client = fakeredis.FakeStrictRedis()
+        self.current_task = MagicMock()
+        self.current_task.request.called_directly = False
+        self.current_task.retry.return_value = Retry()
+        for p in (
+            patch(
+                "app.infra.services.rate_limiter.get_redis_client",
+                return_value=self.redis_client,
+            ),
+            patch("app.infra.services.rate_limiter.current_task", self.current_task),
+            # one call per 100s, no burst: the second call is always over the limit
+            patch.multiple(
+                settings,
+                RATE_LIMIT_BREVO_PER_SECOND=0.01,
+                RATE_LIMIT_GOOGLE_PER_SECOND=0.01,
+                RATE_LIMIT_MAX_BLOCK_SECONDS=10,
+                RATE_LIMIT_MAX_RETRIES=20,
+                RATE_LIMIT_MAX_WAIT_SECONDS=5,
+            ),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def get_metrics(self, bucket: RateLimitBucket) -> dict:
+        return next(
+            metrics for metrics in get_rate_limit_metrics() if metrics["bucket"] == bucket.value
+        )
+
+    def test_gcra_burst_boundary(self):
+        limiter = RateLimiter("test", rate=1, burst=2)
+        # an idle bucket allows `burst` calls at once
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        # the next one waits for its slot, one interval later
+        wait = limiter.reserve()
+        assert 0.9 < wait <= 1
+        # the one after, one more interval
+        assert 1.9 < limiter.reserve() <= 2
+
+    def test_gcra_max_wait(self):
+        limiter = RateLimiter("test", rate=1, burst=1)
+        assert limiter.reserve(max_wait=0.5) == 0
+        tat = float(self.redis_client.get(get_rate_limit_redis_key("test")))
+
+        # over max_wait: denied, the slot is not taken
+        assert limiter.reserve(max_wait=0.5) is None
+        assert float(self.redis_client.get(get_rate_limit_redis_key("test"))) == tat
+        # within max_wait: allowed
+        assert 0.5 < limiter.reserve(max_wait=1) <= 1
+
+        stats = self.redis_client.hgetall("rate_limit:test:stats")
+        assert int(stats[b"granted"]) == 2
+        assert int(stats[b"delayed"]) == 1
+        assert int(stats[b"rescheduled"]) == 1
+
+    def test_rate_limited_reschedules_the_task(self):
+        assert send_one() == "sent"
+        with self.assertRaises(Retry):
+            send_one()
+        self.current_task.retry.assert_called_once_with(countdown=10, max_retries=20)
+
+        metrics = self.get_metrics(RateLimitBucket.BREVO)
+        assert metrics["granted"] == 1
+        assert metrics["rescheduled"] == 1
+
+    def test_rate_limited_blocks(self):
+        with patch("app.infra.services.rate_limiter.time.sleep") as mock_sleep:
+            assert send_in_loop() == "sent"
+            mock_sleep.assert_not_called()
+            # not the only call of its task: waits for the slot, 100s later
+            assert send_in_loop() == "sent"
+        mock_sleep.assert_called_once()
+        assert 99 < mock_sleep.call_args.args[0] <= 100
+        self.current_task.retry.assert_not_called()
+
+    def test_rate_limited_fails_fast_outside_tasks(self):
+        self.current_task.request.called_directly = True
+        with patch("app.infra.services.rate_limiter.time.sleep") as mock_sleep:
+            assert send_one() == "sent"
+            # the slot is 100s later, over RATE_LIMIT_MAX_WAIT_SECONDS: not taken
+            with self.assertRaises(RateLimitExceeded):
+                send_one()
+        mock_sleep.assert_not_called()
+        self.current_task.retry.assert_not_called()
+        assert self.get_metrics(RateLimitBucket.BREVO)["granted"] == 1
+
+    def test_rate_limited_waits_outside_tasks(self):
+        self.current_task.request.called_directly = True
+        limiter = RateLimiter(RateLimitBucket.BREVO.value, rate=1)
+        with patch("app.infra.services.rate_limiter.time.sleep") as mock_sleep:
+            limiter.acquire()
+            # within RATE_LIMIT_MAX_WAIT_SECONDS: waits for the slot
+            limiter.acquire()
+        mock_sleep.assert_called_once()
+        assert 0.9 < mock_sleep.call_args.args[0] <= 1
+
+    def test_google_calls_of_the_requests_fail_with_503(self):
+        self.current_task.request.called_directly = True
+        assert get_file() == "file"
+        with self.assertRaises(HTTPException) as context:
+            get_file()
+        assert context.exception.status_code == 503
+        assert context.exception.headers == {"Retry-After": "5"}
+
+    def test_retry_is_not_a_task_failure(self):
+        with patch.object(rate_limited_task, "update_state") as mock_update_state:
+            assert rate_limited_task() == "sent"
+            # rescheduled: Retry goes through to celery, no FAILURE state
+            with self.assertRaises(Retry):
+                rate_limited_task()
+            mock_update_state.assert_not_called()
+
+            # the other exceptions are stored as the state of the task
+            with (
+                patch(
+                    "app.infra.services.rate_limiter.RateLimiter.reserve",
+                    side_effect=ConnectionError("redis down"),
+                ),
+                self.assertRaises(Ignore),
+            ):
+                rate_limited_task()
+            assert mock_update_state.call_args.kwargs["state"] == "FAILURE"
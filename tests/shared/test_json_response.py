@@ -0,0 +1,95 @@
+import json
+import unittest
+from datetime import date, datetime, timezone
+
+from bson import ObjectId
+
+from app.domain.absent.enum import AbsentType
+from app.domain.audit_log.enum import AuditLogType, Endpoint
+from app.domain.roll_call.entity import StudentRollCallResult, StudentRollCallResultInResponse
+from app.domain.shared.entity import Pagination
+from app.domain.student.entity import ManyStudentsInResponse, Student, StudentSeason
+from app.shared.json_response import render_json, render_json_compat
+
+SUBJECT_IDS = [str(ObjectId()) for _ in range(3)]
+
+
+def students_page() -> ManyStudentsInResponse:
+    now = datetime(2024, 5, 1, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    return ManyStudentsInResponse(
+        pagination=Pagination(total=2, page_index=1, total_pages=1),
+        data=[
+            Student(
+                id=str(ObjectId()),
+                holy_name="Maria",
+                full_name=f"Trần Thị Học Viên {i}",
+                email=f"student{i}@example.com",
+                date_of_birth=date(2000, 1, 1),
+                diocese="Sài Gòn",
+                seasons_info=[StudentSeason(numerical_order=i + 1, group=i, season=3)],
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(2)
+        ],
+    )
+
+
+def roll_call_results() -> StudentRollCallResultInResponse:
+    return StudentRollCallResultInResponse(
+        data=[
+            StudentRollCallResult(
+                id=str(ObjectId()),
+                numerical_order=i + 1,
+                holy_name="Giuse",
+                full_name=f"Nguyễn Văn Học Viên {i}",
+                subjects={
+                    subject_id: {
+                        "attend_zoom": (i + j) % 2 == 0,
+                        "evaluation": True,
+                        "absent_type": AbsentType.NO_ATTEND if j == 1 else None,
+                    }
+                    for j, subject_id in enumerate(SUBJECT_IDS)
+                },
+                subject_completed=2,
+                subject_not_completed=1,
+                subject_registered=3,
+            )
+            for i in range(2)
+        ],
+        summary={subject_id: {"completed": 1, "no_complete": 1} for subject_id in SUBJECT_IDS},
+    )
+
+
+class TestJSONResponse(unittest.TestCase):
+    def assert_same_document(self, content) -> bytes:
+        fast = render_json(content)
+        assert json.loads(fast) == json.loads(render_json_compat(content))
+        return fast
+
+    def test_students_page(self):
+        body = self.assert_same_document(students_page())
+        student = json.loads(body)["data"][0]
+        assert student["date_of_birth"] == "2000-01-01"
+        assert student["created_at"] == "2024-05-01T08:30:15.123456Z"
+
+    def test_roll_call_results(self):
+        body = self.assert_same_document(roll_call_results())
+        subjects = json.loads(body)["data"][0]["subjects"]
+        assert subjects[SUBJECT_IDS[1]]["absent_type"] == AbsentType.NO_ATTEND.value
+
+    def test_dict_of_datetimes_and_enums(self):
+        content = {
+            "success": True,
+            "type": AuditLogType.CREATE,
+            "endpoint": Endpoint.SUBJECT,
+            "created_at": datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc),
+            "naive": datetime(2024, 5, 1, 8, 30),
+            "start_at": date(2024, 5, 1),
+            "students": students_page(),
+            "items": [roll_call_results(), None, 1.5],
+            # encoded by jsonable_encoder on both paths
+            "groups": {1, 2},
+        }
+        body = self.assert_same_document(content)
+        assert json.loads(body)["type"] == AuditLogType.CREATE.value